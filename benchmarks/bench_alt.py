@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Compares A* with the manhattan distance and with the ALT landmark heuristic
+for a growing number of landmarks: expanded nodes, preprocessing time,
+query time and memory of the distance table.
+
+Run with `python -m benchmarks.bench_alt`.
+"""
+import random
+import time
+from benchmarks.maps import MAPS
+from pathfinder.alt import Landmarks
+from pathfinder.graph import Graph
+from pathfinder.util.state import State
+
+
+def main():
+    rows: int = 201
+    queries: int = 10
+    print("{:<10} {:>9} {:>10} {:>10} {:>10} {:>10}".format(
+        "map", "landmarks", "KiB", "build ms", "expanded", "query ms"
+    ))
+    for map_name in ("maze", "random30", "terrain"):
+        graph: Graph = MAPS[map_name](rows)
+        states: bytearray = graph.grid.states
+        free: list = [index for index in range(graph.grid.size) if states[index] != State.BARRIER.value]
+        rng: random.Random = random.Random(0)
+        pairs: list = [rng.sample(free, 2) for _ in range(queries)]
+        for count in (0, 1, 2, 4, 8, 16):
+            build: float = 0.0
+            if count:
+                begin: float = time.perf_counter()
+                graph.landmarks = Landmarks(graph.grid, count)
+                build = time.perf_counter() - begin
+            expanded: int = 0
+            elapsed: float = 0.0
+            for start, end in pairs:
+                graph.reset_discovered()
+                begin = time.perf_counter()
+                result = graph.solve(
+                    graph.grid.vertex(start), graph.grid.vertex(end), algorithm="a_star", landmarks=count
+                )
+                elapsed += time.perf_counter() - begin
+                expanded += result.expanded
+            print("{:<10} {:>9} {:>10.0f} {:>10.1f} {:>10.0f} {:>10.2f}".format(
+                map_name, count, graph.landmarks.nbytes / 1024 if count else 0, build * 1000,
+                expanded / queries, elapsed / queries * 1000
+            ))
+
+
+if __name__ == "__main__":
+    main()
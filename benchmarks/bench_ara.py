@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Compares A* with Weighted A* for growing factors and ARA* for growing
+expansion budgets: expanded nodes, query time, distance relative to the
+shortest path and the reported suboptimality bound.
+
+Run with `python -m benchmarks.bench_ara`.
+"""
+import time
+from benchmarks.maps import MAPS, endpoints
+from pathfinder.graph import Graph
+
+
+def main():
+    rows: int = 201
+    print("{:<10} {:<16} {:>10} {:>10} {:>8} {:>8}".format(
+        "map", "mode", "expanded", "query ms", "ratio", "bound"
+    ))
+    for map_name in ("random30", "terrain", "maze"):
+        graph: Graph = MAPS[map_name](rows)
+        start, end = endpoints(graph)
+        graph.reset_discovered()
+        shortest: float = graph.solve(start, end, algorithm="a_star").distance
+        full: int = 0
+        modes: list = []
+        for epsilon in (1.0, 1.5, 2.0, 3.0):
+            modes.append(("a_star e={}".format(epsilon), {"algorithm": "a_star", "epsilon": epsilon}))
+        for share in (0.1, 0.25, 0.5, 1.0, None):
+            name: str = "ara_star {}".format("full" if share is None else "{:.0%}".format(share))
+            modes.append((name, {"algorithm": "ara_star", "share": share}))
+        for name, options in modes:
+            share = options.pop("share", None)
+            if share is not None:
+                # Budgets relative to the expansions of optimal A*
+                options["max_expanded"] = max(int(full * share), 1)
+            graph.reset_discovered()
+            begin: float = time.perf_counter()
+            result = graph.solve(start, end, **options)
+            elapsed: float = time.perf_counter() - begin
+            if name == "a_star e=1.0":
+                full = result.expanded
+            print("{:<10} {:<16} {:>10} {:>10.2f} {:>8} {:>8.3f}".format(
+                map_name, name, result.expanded, elapsed * 1000,
+                "{:.3f}".format(result.distance / shortest) if result.found else "-", result.bound
+            ))
+
+
+if __name__ == "__main__":
+    main()
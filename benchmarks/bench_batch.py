@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Measures the throughput of `batch_query` for a growing number of worker
+processes.
+
+Run with `python -m benchmarks.bench_batch`.
+"""
+import os
+import random
+import time
+from pathfinder.batch import GridSnapshot, batch_query
+from pathfinder.graph import Graph
+from pathfinder.util.state import State
+
+
+def main():
+    rng: random.Random = random.Random(0)
+    rows: int = 300
+    graph: Graph = Graph(rows, 1)
+    for index in range(graph.grid.size):
+        if rng.random() < 0.2:
+            graph.grid.states[index] = State.BARRIER.value
+    snapshot: GridSnapshot = GridSnapshot.from_grid(graph.grid)
+    free: list = [index for index in range(graph.grid.size) if not snapshot.blocked[index]]
+    queries: list = [tuple(rng.sample(free, 2)) for _ in range(400)]
+
+    print("{:>10} {:>14} {:>10}".format("processes", "queries/s", "speedup"))
+    baseline: float = 0.0
+    processes: int = 1
+    while processes <= (os.cpu_count() or 1):
+        begin: float = time.perf_counter()
+        batch_query(snapshot, queries, processes=processes, chunksize=8)
+        throughput: float = len(queries) / (time.perf_counter() - begin)
+        baseline = baseline or throughput
+        print("{:>10} {:>14.1f} {:>9.1f}x".format(processes, throughput, throughput / baseline))
+        processes *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Compares point-to-point latency and expansions of the unidirectional
+solvers with their bidirectional variants on large open grids.
+
+Run with `python -m benchmarks.bench_bidirectional`.
+"""
+import time
+from pathfinder.graph import Graph
+
+
+def run(graph: Graph, algorithm: str) -> tuple:
+    graph.reset_discovered()
+    mid: int = graph.rows // 2
+    begin: float = time.perf_counter()
+    result = graph.solve(graph.grid[mid][0], graph.grid[mid][graph.columns - 1], algorithm=algorithm)
+    return result, time.perf_counter() - begin
+
+
+def main():
+    print("{:>6} {:>24} {:>10} {:>10} {:>10}".format("rows", "algorithm", "distance", "expanded", "seconds"))
+    for rows in (100, 200, 400):
+        graph: Graph = Graph(rows, 1)
+        for algorithm in ("dijkstra", "bidirectional_dijkstra", "a_star", "bidirectional_a_star"):
+            result, elapsed = run(graph, algorithm)
+            print("{:>6} {:>24} {:>10} {:>10} {:>10.3f}".format(
+                rows, algorithm, result.distance, result.expanded, elapsed
+            ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Measures how long Dijkstra and A* take to give up on a walled-off
+destination with and without the index of connected components, and what
+keeping the index up to date costs per barrier edit.
+
+Run with `python -m benchmarks.bench_components`.
+"""
+import random
+import time
+from benchmarks.maps import MAPS
+from pathfinder.graph import Graph
+from pathfinder.util.state import State
+
+
+def main():
+    print("{:<10} {:>6} {:<10} {:>12} {:>12} {:>10} {:>10}".format(
+        "map", "rows", "algorithm", "search ms", "indexed ms", "build ms", "edit us"
+    ))
+    for map_name in ("open", "random30"):
+        for rows in (100, 300):
+            graph: Graph = MAPS[map_name](rows)
+            # Wall off the bottom right corner
+            for index in (graph.grid.index(rows - 2, rows - 1), graph.grid.index(rows - 1, rows - 2)):
+                graph.grid.states[index] = State.BARRIER.value
+            graph.grid.states[graph.grid.size - 1] = State.EMPTY.value
+            start, end = graph.grid[0][0], graph.grid[rows - 1][rows - 1]
+            graph.grid.states[0] = State.EMPTY.value
+
+            begin: float = time.perf_counter()
+            graph.index_components()
+            build: float = time.perf_counter() - begin
+
+            rng: random.Random = random.Random(0)
+            edits: list = [graph.grid.vertex(rng.randrange(1, graph.grid.size - 1)) for _ in range(200)]
+            begin = time.perf_counter()
+            for vertex in edits:
+                if vertex.state == State.BARRIER:
+                    graph.remove_barrier(vertex)
+                else:
+                    graph.set_barrier(vertex)
+            edit: float = (time.perf_counter() - begin) / len(edits)
+
+            for algorithm in ("dijkstra", "a_star"):
+                timings: list = []
+                for components in (None, graph.components):
+                    graph.components = components
+                    graph.reset_discovered()
+                    begin = time.perf_counter()
+                    assert not graph.solve(start, end, algorithm).found
+                    timings.append(time.perf_counter() - begin)
+                print("{:<10} {:>6} {:<10} {:>12.2f} {:>12.3f} {:>10.1f} {:>10.1f}".format(
+                    map_name, rows, algorithm, timings[0] * 1000, timings[1] * 1000, build * 1000, edit * 1e6
+                ))
+
+
+if __name__ == "__main__":
+    main()
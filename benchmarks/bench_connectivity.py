@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Compares path length, expanded nodes and run time of A* on 4-connected and
+8-connected grids, the latter with and without corner cutting.
+
+Run with `python -m benchmarks.bench_connectivity`.
+"""
+import time
+from benchmarks.maps import MAPS, endpoints
+from pathfinder.graph import Graph
+
+
+def run(template: Graph, connectivity: int, corner_cutting: bool) -> tuple:
+    graph: Graph = Graph(template.rows, 1, connectivity, corner_cutting)
+    graph.grid.states[:] = template.grid.states
+    start, end = endpoints(graph)
+    begin: float = time.perf_counter()
+    result = graph.solve(start, end, algorithm="a_star")
+    return result, time.perf_counter() - begin
+
+
+def main():
+    print("{:<10} {:>6} {:<14} {:>10} {:>10} {:>10}".format(
+        "map", "rows", "moves", "length", "expanded", "time [s]"
+    ))
+    for map_name in ("open", "random10", "random30"):
+        for rows in (100, 300):
+            template: Graph = MAPS[map_name](rows)
+            for connectivity, corner_cutting, label in (
+                (4, False, "4"), (8, False, "8"), (8, True, "8 cutting")
+            ):
+                result, elapsed = run(template, connectivity, corner_cutting)
+                print("{:<10} {:>6} {:<14} {:>10.2f} {:>10} {:>10.3f}".format(
+                    map_name, rows, label, result.distance, result.expanded, elapsed
+                ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Measures how long it takes to route many agents to a shared destination,
+once with an A* search per agent and once with a single flow field whose
+directions the agents follow. It also measures what repairing the field
+costs per barrier edit.
+
+Run with `python -m benchmarks.bench_flowfield`.
+"""
+import random
+import time
+from benchmarks.maps import MAPS, endpoints
+from pathfinder.flowfield import FlowField
+from pathfinder.graph import Graph
+from pathfinder.util.state import State
+
+
+def main():
+    print("{:<10} {:>6} {:>7} {:>12} {:>12} {:>10} {:>10} {:>10}".format(
+        "map", "rows", "agents", "a_star ms", "field ms", "build ms", "edit us", "KiB"
+    ))
+    for map_name in ("open", "random30", "maze"):
+        for rows in (100, 200):
+            graph: Graph = MAPS[map_name](rows)
+            _, end = endpoints(graph)
+            rng: random.Random = random.Random(0)
+            free: list = [index for index, state in enumerate(graph.grid.states) if state != State.BARRIER.value]
+            agents: list = [graph.grid.vertex(index) for index in rng.sample(free, 100)]
+
+            begin: float = time.perf_counter()
+            costs: list = []
+            for agent in agents:
+                graph.reset_discovered()
+                costs.append(graph.solve(agent, end, "a_star").distance)
+            a_star: float = time.perf_counter() - begin
+
+            begin = time.perf_counter()
+            field: FlowField = graph.flow_field([end])
+            build: float = time.perf_counter() - begin
+            for agent in agents:
+                field.path(agent.index)
+            routed: float = time.perf_counter() - begin
+            assert [field.cost(agent.index) for agent in agents] == costs
+
+            edits: list = [graph.grid.vertex(index) for index in rng.sample(free, 100) if index != end.index]
+            begin = time.perf_counter()
+            for vertex in edits:
+                graph.set_barrier(vertex)
+            for vertex in edits:
+                graph.remove_barrier(vertex)
+            edit: float = (time.perf_counter() - begin) / (2 * len(edits))
+
+            print("{:<10} {:>6} {:>7} {:>12.1f} {:>12.1f} {:>10.1f} {:>10.1f} {:>10.0f}".format(
+                map_name, rows, len(agents), a_star * 1000, routed * 1000, build * 1000, edit * 1e6,
+                field.nbytes / 1024
+            ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Compares hierarchical path finding A* (HPA*) with plain A* on random queries:
+expanded nodes, latency and how much longer the HPA* paths are. The one-off
+preprocessing and the incremental update after a barrier edit are timed as
+well.
+
+Run with `python -m benchmarks.bench_hpa`.
+"""
+import random
+import time
+from benchmarks.maps import MAPS
+from pathfinder.graph import Graph
+from pathfinder.hpa import HierarchicalPlanner
+from pathfinder.util.state import State
+
+
+def main():
+    rng: random.Random = random.Random(0)
+    queries: int = 20
+    print("{:<10} {:>6} {:>9} {:>9} {:>12} {:>12} {:>10} {:>10} {:>10}".format(
+        "map", "rows", "build ms", "edit ms", "A* expanded", "HPA expanded", "A* ms", "HPA ms", "length"
+    ))
+    for map_name in ("open", "random10", "random30", "maze"):
+        for rows in (128, 256):
+            graph: Graph = MAPS[map_name](rows)
+            states: bytearray = graph.grid.states
+            free: list = [index for index in range(graph.grid.size) if states[index] != State.BARRIER.value]
+
+            begin: float = time.perf_counter()
+            graph.hierarchy = HierarchicalPlanner(graph.grid)
+            build: float = time.perf_counter() - begin
+
+            totals: dict = {"a_star": [0, 0.0, 0.0], "hpa_star": [0, 0.0, 0.0]}
+            for _ in range(queries):
+                start, end = rng.sample(free, 2)
+                for algorithm, total in totals.items():
+                    graph.reset_discovered()
+                    begin = time.perf_counter()
+                    result = graph.solve(graph.grid.vertex(start), graph.grid.vertex(end), algorithm)
+                    total[1] += time.perf_counter() - begin
+                    total[0] += result.expanded
+                    if result.found:
+                        total[2] += result.distance
+
+            # Block a free cell and let the abstract graph catch up
+            begin = time.perf_counter()
+            graph.set_barrier(graph.grid.vertex(rng.choice(free)))
+            edit: float = time.perf_counter() - begin
+
+            print("{:<10} {:>6} {:>9.1f} {:>9.2f} {:>12.0f} {:>12.0f} {:>10.2f} {:>10.2f} {:>9.3f}x".format(
+                map_name, rows, build * 1000, edit * 1000,
+                totals["a_star"][0] / queries, totals["hpa_star"][0] / queries,
+                totals["a_star"][1] / queries * 1000, totals["hpa_star"][1] / queries * 1000,
+                totals["hpa_star"][2] / totals["a_star"][2],
+            ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Compares the number of expanded nodes and the run time of Jump Point Search
+with A* on open grids and grids with random barriers.
+
+Run with `python -m benchmarks.bench_jps`.
+"""
+import random
+import time
+from pathfinder.graph import Graph
+from pathfinder.util.state import State
+
+BARRIER: int = State.BARRIER.value
+EMPTY: int = State.EMPTY.value
+
+
+def make_graph(rows: int, percent_barriers: float, seed: int = 0) -> Graph:
+    rng: random.Random = random.Random(seed)
+    graph: Graph = Graph(rows, 1)
+    for index in range(graph.grid.size):
+        if rng.random() < percent_barriers:
+            graph.grid.states[index] = BARRIER
+    graph.grid.states[0] = graph.grid.states[-1] = EMPTY
+    return graph
+
+
+def run(graph: Graph, algorithm: str) -> tuple:
+    graph.reset_discovered()
+    begin: float = time.perf_counter()
+    result = graph.solve(graph.grid[0][0], graph.grid[graph.rows - 1][graph.columns - 1], algorithm=algorithm)
+    return result, time.perf_counter() - begin
+
+
+def main():
+    print("{:>6} {:>9} {:>10} {:>10} {:>10} {:>10} {:>10}".format(
+        "rows", "barriers", "distance", "A* exp", "JPS exp", "A* s", "JPS s"
+    ))
+    for rows in (50, 100, 200):
+        for percent in (0.0, 0.1, 0.2):
+            graph: Graph = make_graph(rows, percent)
+            a_star, a_star_time = run(graph, "a_star")
+            jps, jps_time = run(graph, "jps")
+            assert a_star.distance == jps.distance
+            print("{:>6} {:>9.0%} {:>10} {:>10} {:>10} {:>10.3f} {:>10.3f}".format(
+                rows, percent, jps.distance, a_star.expanded, jps.expanded, a_star_time, jps_time
+            ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark comparing A* driven by the former lock based priority queue
+with a linear membership scan against the indexed heap.
+
+Run with `python -m benchmarks.bench_priority_queue`.
+"""
+import math
+import queue
+import time
+from pathfinder.graph import Graph
+from pathfinder.util.state import State
+
+BARRIER: int = State.BARRIER.value
+
+
+class LegacyPriorityQueue(queue.PriorityQueue):
+    """The priority queue used by the solvers before the indexed heap."""
+
+    def is_element(self, element, key=id):
+        for entry in self.queue:
+            if key(entry) == element:
+                return True
+        return False
+
+
+def legacy_a_star(graph: Graph) -> int:
+    """A* as implemented before the indexed heap. Returns the number of expansions."""
+    grid = graph.grid
+    start, end = graph.start.index, graph.end.index
+    end_row, end_col = grid.position(end)
+    g_score: list = [float('inf')] * grid.size
+    g_score[start] = 0
+    open_queue: LegacyPriorityQueue = LegacyPriorityQueue()
+    open_queue.put((0, time.time(), start))
+    expanded: int = 0
+    while not open_queue.empty():
+        current: int = open_queue.get()[2]
+        expanded += 1
+        if current == end:
+            break
+        for neighbor in grid.neighbors(current):
+            if grid.states[neighbor] == BARRIER:
+                continue
+            alt_dist = g_score[current] + 1
+            if alt_dist < g_score[neighbor]:
+                g_score[neighbor] = alt_dist
+                row, col = grid.position(neighbor)
+                f_score = alt_dist + math.hypot(row - end_row, col - end_col)
+                if not open_queue.is_element(neighbor, key=lambda x: x[2]):
+                    open_queue.put((f_score, time.time(), neighbor))
+    return expanded
+
+
+def make_graph(rows: int) -> Graph:
+    """Open grid with a wall in the middle forcing a detour."""
+    graph: Graph = Graph(rows, 1)
+    for row in range(rows - 1):
+        graph.grid[row][rows // 2].set_barrier()
+    graph.set_start(graph.grid[0][0])
+    graph.set_end(graph.grid[0][rows - 1])
+    return graph
+
+
+def measure(solver, rows: int) -> float:
+    graph: Graph = make_graph(rows)
+    begin: float = time.perf_counter()
+    expanded = solver(graph)
+    elapsed: float = time.perf_counter() - begin
+    if not isinstance(expanded, int):
+        expanded = expanded.expanded
+    return expanded / elapsed
+
+
+def main():
+    print("{:>6} {:>18} {:>18} {:>8}".format("rows", "legacy exp/s", "indexed exp/s", "speedup"))
+    for rows in (25, 50, 100, 200):
+        legacy: float = measure(legacy_a_star, rows)
+        indexed: float = measure(lambda graph: graph.a_star(), rows)
+        print("{:>6} {:>18,.0f} {:>18,.0f} {:>7.1f}x".format(rows, legacy, indexed, indexed / legacy))
+
+
+if __name__ == "__main__":
+    main()
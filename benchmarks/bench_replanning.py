@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Compares the work of repairing a plan with Lifelong Planning A* after a few
+barrier edits with the work of planning from scratch.
+
+Run with `python -m benchmarks.bench_replanning`.
+"""
+import random
+import time
+from pathfinder.graph import Graph
+from pathfinder.util.state import State
+
+
+def main():
+    rng: random.Random = random.Random(0)
+    rows: int = 150
+    graph: Graph = Graph(rows, 1)
+    for index in range(graph.grid.size):
+        if rng.random() < 0.2:
+            graph.grid.states[index] = State.BARRIER.value
+    graph.set_start(graph.grid[0][0])
+    graph.set_end(graph.grid[rows - 1][rows - 1])
+    graph.replan()
+
+    totals: dict = {"incremental": [0, 0, 0.0], "from scratch": [0, 0, 0.0]}
+    rounds: int = 20
+    for _ in range(rounds):
+        # Edit a few cells close to the current path
+        path: list = list(graph.paths)
+        for node in rng.sample(path, 3):
+            vertex = graph.grid.vertex(node)
+            if vertex != graph.start and vertex != graph.end:
+                graph.set_barrier(vertex)
+
+        begin: float = time.perf_counter()
+        repaired = graph.replan()
+        elapsed: float = time.perf_counter() - begin
+        totals["incremental"][0] += repaired.expanded
+        totals["incremental"][1] += repaired.opened
+        totals["incremental"][2] += elapsed
+
+        planner = graph.planner
+        graph.planner = None
+        begin = time.perf_counter()
+        scratch = graph.replan()
+        elapsed = time.perf_counter() - begin
+        totals["from scratch"][0] += scratch.expanded
+        totals["from scratch"][1] += scratch.opened
+        totals["from scratch"][2] += elapsed
+        graph.planner = planner
+        assert repaired.distance == scratch.distance
+
+    print("{:>14} {:>14} {:>14} {:>12}".format("", "expanded", "updated", "ms"))
+    for name, (expanded, updated, elapsed) in totals.items():
+        print("{:>14} {:>14.0f} {:>14.0f} {:>12.2f}".format(
+            name, expanded / rounds, updated / rounds, elapsed / rounds * 1000
+        ))
+
+
+if __name__ == "__main__":
+    main()
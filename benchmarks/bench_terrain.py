@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Compares Dijkstra keeping its nodes in a binary heap with Dial's algorithm
+keeping them in a bucket queue on weighted terrain and on unit weights.
+
+Run with `python -m benchmarks.bench_terrain`.
+"""
+import time
+from benchmarks.maps import endpoints, random_map, terrain_map
+from pathfinder.graph import Graph
+
+
+def run(graph: Graph, engine: str) -> tuple:
+    graph.reset_discovered()
+    start, end = endpoints(graph)
+    begin: float = time.perf_counter()
+    result = graph.solve(start, end, algorithm="dijkstra", engine=engine)
+    return result, time.perf_counter() - begin
+
+
+def main():
+    print("{:>6} {:>8} {:>10} {:>12} {:>12} {:>8}".format(
+        "rows", "weights", "expanded", "heap [s]", "bucket [s]", "speedup"
+    ))
+    for rows in (100, 200, 400):
+        for max_weight in (1, 4, 9, 32):
+            if max_weight == 1:
+                graph: Graph = random_map(rows, 0, 0.1)
+            else:
+                graph = terrain_map(rows, 0, max_weight)
+            heap, heap_time = run(graph, "queue")
+            bucket, bucket_time = run(graph, "bucket")
+            assert heap.distance == bucket.distance
+            print("{:>6} {:>8} {:>10} {:>12.3f} {:>12.3f} {:>7.2f}x".format(
+                rows, "1-{}".format(max_weight), bucket.expanded, heap_time, bucket_time,
+                heap_time / bucket_time
+            ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Seeded maps shared by the benchmarks. The same name, size and seed always
+yield the same map.
+"""
+import random
+from pathfinder.graph import Graph
+from pathfinder.util.state import State
+
+
+def open_map(rows: int, seed: int = 0) -> Graph:
+    """Grid without any barriers."""
+    return Graph(rows, 1)
+
+
+def random_map(rows: int, seed: int = 0, density: float = 0.2) -> Graph:
+    """Grid where every cell is a barrier with the given probability."""
+    rng: random.Random = random.Random(seed)
+    graph: Graph = Graph(rows, 1)
+    graph.grid.states[:] = bytes(
+        State.BARRIER.value if rng.random() < density else State.EMPTY.value
+        for _ in range(graph.grid.size)
+    )
+    graph.grid.invalidate()
+    return graph
+
+
+def maze_map(rows: int, seed: int = 0) -> Graph:
+    """Maze made by the recursive backtracker of `pathfinder.maze`."""
+    graph: Graph = Graph(rows, 1)
+    graph.generate_maze(seed=seed)
+    return graph
+
+
+def terrain_map(rows: int, seed: int = 0, max_weight: int = 9) -> Graph:
+    """Grid with 10% barriers where every cell has a random weight between 1 and max_weight."""
+    rng: random.Random = random.Random(seed)
+    graph: Graph = random_map(rows, seed, 0.1)
+    graph.grid.weights[:] = bytes(rng.randint(1, max_weight) for _ in range(graph.grid.size))
+    return graph
+
+
+# Pairs of (name: factory) of all maps. Random maps are named by their density.
+MAPS: dict = {
+    "open": open_map,
+    "random10": lambda rows, seed=0: random_map(rows, seed, 0.1),
+    "random30": lambda rows, seed=0: random_map(rows, seed, 0.3),
+    "maze": maze_map,
+    "terrain": terrain_map,
+}
+
+
+def endpoints(graph: Graph) -> tuple:
+    """
+    Returns the free cells closest to the top left and the bottom right
+    corner which are used as start and destination.
+    """
+    states: bytearray = graph.grid.states
+    barrier: int = State.BARRIER.value
+    start: int = next(index for index in range(graph.grid.size) if states[index] != barrier)
+    end: int = next(index for index in reversed(range(graph.grid.size)) if states[index] != barrier)
+    return graph.grid.vertex(start), graph.grid.vertex(end)
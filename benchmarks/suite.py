@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Reproducible benchmark suite for the solvers, maze generation, grid
+management and rendering on seeded maps.
+
+Every benchmark records the best wall time of several repetitions, the
+number of expanded nodes per second for the solvers and the peak memory
+allocated during a separate run under tracemalloc. Results are saved as
+JSON so that two revisions can be compared:
+
+    python -m benchmarks.suite --output before.json
+    python -m benchmarks.suite --output after.json --compare before.json
+
+Use e.g. `--sizes 50 200 1000 2000` for larger maps.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from benchmarks.maps import MAPS, endpoints
+from pathfinder.graph import Graph
+
+BENCHMARKS: tuple = ("init_grid", "generate_maze", "dijkstra", "a_star", "reset_discovered", "draw")
+
+
+def measure(setup, run, repeat: int, memory: bool) -> dict:
+    """
+    Times a benchmark.
+
+    Parameters
+    ----------
+    setup: callable
+        Returns the argument passed to `run`. Not timed.
+    run: callable
+        The benchmarked code. May return a search result.
+    repeat: int
+        Number of timed repetitions, the best one is reported.
+    memory: bool
+        Whether to measure the peak memory in an additional run.
+
+    Returns
+    -------
+    dict
+        The measured values.
+    """
+    best: float = float('inf')
+    result = None
+    for _ in range(repeat):
+        argument = setup()
+        begin: float = time.perf_counter()
+        result = run(argument)
+        best = min(best, time.perf_counter() - begin)
+
+    record: dict = {"seconds": best}
+    expanded: int = getattr(result, "expanded", None)
+    if expanded is not None:
+        record["expanded"] = expanded
+        record["distance"] = result.distance
+        record["expansions_per_second"] = expanded / best if best > 0 else None
+    if memory:
+        argument = setup()
+        tracemalloc.start()
+        run(argument)
+        record["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return record
+
+
+def solver_setup(map_name: str, rows: int, seed: int):
+    """Returns a setup function creating a map with start and destination."""
+    template: Graph = MAPS[map_name](rows, seed)
+
+    def setup() -> Graph:
+        graph: Graph = Graph(rows, 1)
+        graph.grid.states[:] = template.grid.states
+        graph.grid.weights[:] = template.grid.weights
+        start, end = endpoints(graph)
+        graph.set_start(start)
+        graph.set_end(end)
+        return graph
+    return setup
+
+
+def searched_setup(map_name: str, rows: int, seed: int):
+    """Returns a setup function creating a map searched by Dijkstra."""
+    base = solver_setup(map_name, rows, seed)
+
+    def setup() -> Graph:
+        graph: Graph = base()
+        graph.dijkstra()
+        graph.mark_path(False)
+        return graph
+    return setup
+
+
+def draw_setup(map_name: str, rows: int, seed: int):
+    """Returns a setup function creating a headless window showing a searched map."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    from pathfinder.gui import GUI
+
+    base = searched_setup(map_name, rows, seed)
+
+    def setup():
+        gui = GUI(rows, rows)
+        gui.graph = base()
+        gui.graph.grid.invalidate()
+        return gui
+    return setup
+
+
+def run_benchmark(name: str, map_name: str, rows: int, seed: int, repeat: int, memory: bool) -> dict:
+    """Runs a single benchmark and returns its record or None if not applicable."""
+    if name == "init_grid":
+        if map_name != "open":
+            return None
+        return measure(lambda: None, lambda _: Graph(rows, 1), repeat, memory)
+    if name == "generate_maze":
+        if map_name != "maze":
+            return None
+        return measure(lambda: Graph(rows, 1), lambda graph: graph.generate_maze(seed=seed), repeat, memory)
+    if name == "dijkstra":
+        return measure(solver_setup(map_name, rows, seed), lambda graph: graph.dijkstra(), repeat, memory)
+    if name == "a_star":
+        return measure(solver_setup(map_name, rows, seed), lambda graph: graph.a_star(), repeat, memory)
+    if name == "reset_discovered":
+        return measure(
+            searched_setup(map_name, rows, seed), lambda graph: graph.reset_discovered(), repeat, memory
+        )
+    if name == "draw":
+        return measure(draw_setup(map_name, rows, seed), lambda gui: gui.draw(), repeat, memory)
+    raise ValueError("Unknown benchmark: {}".format(name))
+
+
+def revision() -> str:
+    """Returns the current git revision or None."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: list, baseline: list, threshold: float) -> int:
+    """
+    Prints the ratio of the wall times of matching benchmarks.
+
+    Returns
+    -------
+    int
+        Number of benchmarks which got slower by more than the threshold.
+    """
+    old: dict = {(r["benchmark"], r["map"], r["size"]): r for r in baseline}
+    regressions: int = 0
+    print("\n{:<18} {:<10} {:>6} {:>12} {:>12} {:>8}".format(
+        "benchmark", "map", "size", "before [s]", "after [s]", "ratio"
+    ))
+    for record in results:
+        before: dict = old.get((record["benchmark"], record["map"], record["size"]))
+        if before is None:
+            continue
+        ratio: float = record["seconds"] / before["seconds"] if before["seconds"] else float('inf')
+        flag: str = ""
+        if ratio > threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print("{:<18} {:<10} {:>6} {:>12.4f} {:>12.4f} {:>7.2f}x{}".format(
+            record["benchmark"], record["map"], record["size"], before["seconds"], record["seconds"],
+            ratio, flag
+        ))
+    return regressions
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 200, 500],
+                        help="number of rows (and columns) of the maps")
+    parser.add_argument("--maps", nargs="+", default=list(MAPS), choices=list(MAPS))
+    parser.add_argument("--benchmarks", nargs="+", default=list(BENCHMARKS), choices=list(BENCHMARKS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true", help="skip measuring the peak memory")
+    parser.add_argument("--output", help="file to save the results to as JSON")
+    parser.add_argument("--compare", help="JSON file of an earlier run to compare with")
+    parser.add_argument("--threshold", type=float, default=1.2,
+                        help="ratio of wall times above which a benchmark counts as regression")
+    args = parser.parse_args(argv)
+
+    results: list = []
+    print("{:<18} {:<10} {:>6} {:>12} {:>14} {:>12}".format(
+        "benchmark", "map", "size", "seconds", "expansions/s", "peak MiB"
+    ))
+    for rows in args.sizes:
+        for map_name in args.maps:
+            for name in args.benchmarks:
+                record: dict = run_benchmark(name, map_name, rows, args.seed, args.repeat, not args.no_memory)
+                if record is None:
+                    continue
+                record = dict(benchmark=name, map=map_name, size=rows, seed=args.seed, **record)
+                results.append(record)
+                rate = record.get("expansions_per_second")
+                peak = record.get("peak_bytes")
+                print("{:<18} {:<10} {:>6} {:>12.4f} {:>14} {:>12}".format(
+                    name, map_name, rows, record["seconds"],
+                    "{:,.0f}".format(rate) if rate else "-",
+                    "{:.2f}".format(peak / 2 ** 20) if peak is not None else "-",
+                ))
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({
+                "revision": revision(),
+                "python": sys.version.split()[0],
+                "platform": platform.platform(),
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "results": results,
+            }, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline: list = json.load(file)["results"]
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+from array import array
+from collections import deque
+from pathfinder.grid import Grid
+from pathfinder.util.bucket_queue import BucketQueue
+from pathfinder.util.priority_queue import PriorityQueue
+from pathfinder.util.state import State
+
+BARRIER: int = State.BARRIER.value
+INF: float = float('inf')
+# Number of cells tried as the start of the landmark selection.
+SEEDS: int = 4
+
+
+def distances(grid: Grid, source: int, reverse: bool = False) -> list:
+    """
+    Computes the distances between a cell and all other cells. Grids with
+    unit weights and 4 neighbors are searched breadth first, weighted ones
+    with Dial's algorithm and 8-connected ones with a binary heap.
+
+    Parameters
+    ----------
+    grid: Grid
+        Grid to search.
+    source: int
+        Index of the cell to start at.
+    reverse: bool
+        Whether to compute the distances from all cells to the source
+        instead, which differ on weighted grids.
+
+    Returns
+    -------
+    list
+        Distances indexed by cell, infinite for unreachable cells.
+    """
+    states: bytearray = grid.states
+    weights: bytearray = grid.weights
+    rows, columns = grid.rows, grid.columns
+    offsets: tuple = grid.offsets
+    dist: list = [INF] * grid.size
+    dist[source] = 0
+
+    if not grid.weighted and not grid.diagonal:
+        frontier: deque = deque([source])
+        while frontier:
+            current: int = frontier.popleft()
+            row, col = divmod(current, columns)
+            alt_dist: int = dist[current] + 1
+            for d_row, d_col, offset, _ in offsets:
+                if not (0 <= row + d_row < rows and 0 <= col + d_col < columns):
+                    continue
+                neighbor: int = current + offset
+                if states[neighbor] != BARRIER and dist[neighbor] == INF:
+                    dist[neighbor] = alt_dist
+                    frontier.append(neighbor)
+        return dist
+
+    queue = PriorityQueue() if grid.diagonal else BucketQueue()
+    queue.push(source, 0)
+    while not queue.empty():
+        current, current_dist = queue.pop()
+        row, col = divmod(current, columns)
+        for d_row, d_col, offset, length in offsets:
+            if not (0 <= row + d_row < rows and 0 <= col + d_col < columns):
+                continue
+            neighbor = current + offset
+            if states[neighbor] == BARRIER:
+                continue
+            if d_row and d_col and grid.corner_blocked(current, d_row, d_col):
+                continue
+            # Backwards the move from the neighbor onto the current cell is paid
+            alt_dist = current_dist + weights[current if reverse else neighbor] * length
+            if alt_dist < dist[neighbor]:
+                dist[neighbor] = alt_dist
+                queue.push(neighbor, alt_dist)
+    return dist
+
+
+def unreachable(table: array):
+    """Returns the value marking unreachable cells in a distance array."""
+    return INF if table.typecode == "d" else 2 ** (8 * table.itemsize) - 1
+
+
+class Landmarks:
+    """
+    Table of the exact distances between a few landmark cells and all other
+    cells for the ALT heuristic (A*, landmarks, triangle inequality). The
+    distance from a cell v to the destination t is at least
+    d(L, t) - d(L, v) and d(v, L) - d(t, L) for every landmark L. Unlike
+    geometric heuristics this bound knows the detours around barriers, so
+    especially in mazes far fewer nodes are expanded.
+
+    Landmarks are chosen one by one as the reachable cell farthest from the
+    landmarks chosen before, starting with the cell farthest from a free
+    cell of a large component. More landmarks tighten the bound at the cost of one array of
+    2 or 4 bytes per cell each, 8 on 8-connected grids, and two arrays on
+    weighted grids where the distances to and from a landmark differ.
+
+    Attributes
+    ----------
+    grid: Grid
+        Grid the distances were computed for.
+    version: int
+        Version of the grid the table is up to date with.
+    count: int
+        Number of landmarks requested. Fewer are chosen if the grid has
+        fewer reachable cells.
+    landmarks: list
+        Indices of the landmark cells.
+    forward: list
+        Arrays of the distances from each landmark indexed by cell.
+    backward: list
+        Arrays of the distances to each landmark indexed by cell, the same
+        arrays as `forward` unless the grid is weighted. Unreachable cells
+        hold the largest value of the array type, see `unreachable`.
+    """
+
+    def __init__(self, grid: Grid, count: int = 8):
+        """
+        Parameters
+        ----------
+        grid: Grid
+            Grid to compute the distances for.
+        count: int
+            Number of landmarks, the knob trading memory and preprocessing
+            time for a tighter heuristic.
+        """
+        if count < 1:
+            raise ValueError("At least one landmark is required")
+        self.grid: Grid = grid
+        self.version: int = grid.version
+        self.count: int = count
+        self.landmarks: list = []
+        self.forward: list = []
+        self.backward: list = []
+
+        # Start at a free cell of a component holding at least half of the
+        # free cells if one of a few evenly spread candidates is in one, so
+        # that the landmarks are not wasted on a small enclosed area.
+        free: list = [index for index, state in enumerate(grid.states) if state != BARRIER]
+        if not free:
+            return
+        best: list = []
+        for candidate in free[::max(len(free) // SEEDS, 1)][:SEEDS]:
+            dist: list = distances(grid, candidate)
+            reached: int = len(dist) - dist.count(INF)
+            if reached > len(best) - best.count(INF):
+                best = dist
+            if 2 * reached >= len(free):
+                break
+        # Distance of every cell to the closest landmark, -1 if unreachable
+        closest: list = [-1 if d == INF else d for d in best]
+        for _ in range(count):
+            landmark: int = max(range(grid.size), key=closest.__getitem__)
+            if closest[landmark] <= 0 and self.landmarks:
+                # Every reachable cell is a landmark already
+                break
+            forward: list = distances(grid, landmark)
+            backward: list = distances(grid, landmark, True) if grid.weighted else forward
+            self.landmarks.append(landmark)
+            self.forward.append(self.__compact(forward))
+            self.backward.append(self.forward[-1] if backward is forward else self.__compact(backward))
+            closest = [
+                c if d == INF or c <= d else d for c, d in zip(closest, forward)
+            ]
+
+    def __compact(self, dist: list) -> array:
+        """Stores distances in the smallest array type holding all of them."""
+        if self.grid.diagonal:
+            return array("d", dist)
+        largest: int = max((d for d in dist if d != INF), default=0)
+        table: array = array("H" if largest < 2 ** 16 - 1 else "I")
+        limit: int = unreachable(table)
+        table.extend(limit if d == INF else d for d in dist)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.landmarks)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the distance arrays."""
+        tables: dict = {id(table): table for table in self.forward + self.backward}
+        return sum(table.itemsize * len(table) for table in tables.values())
+
+    def heuristic(self, end: int):
+        """
+        Returns the ALT heuristic towards a destination.
+
+        Parameters
+        ----------
+        end: int
+            Index of the destination.
+
+        Returns
+        -------
+        callable
+            Function returning a lower bound of the distance from a cell to
+            the destination.
+        """
+        terms: list = []
+        for forward, backward in zip(self.forward, self.backward):
+            if forward[end] != unreachable(forward):
+                # d(v, t) >= d(L, t) - d(L, v)
+                terms.append((forward, forward[end], unreachable(forward), 1))
+            if backward[end] != unreachable(backward):
+                # d(v, t) >= d(v, L) - d(t, L)
+                terms.append((backward, backward[end], unreachable(backward), -1))
+
+        def heuristic(node: int) -> float:
+            best = 0
+            for table, target, limit, sign in terms:
+                dist = table[node]
+                if dist != limit:
+                    bound = sign * (target - dist)
+                    if bound > best:
+                        best = bound
+            return best
+
+        return heuristic
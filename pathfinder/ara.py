@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+import time
+from pathfinder.grid import Grid
+from pathfinder.util.priority_queue import PriorityQueue
+from pathfinder.util.state import State
+
+BARRIER: int = State.BARRIER.value
+INF: float = float('inf')
+# Factor slightly below 1 keeping rounding errors of octile distances from
+# making a shortest path look longer than its lower bound.
+SLACK: float = 1 - 1e-9
+
+
+class AnytimeAStar:
+    """
+    Anytime Repairing A* (ARA*) between a start and a destination. A first
+    path is found quickly by a search with the heuristic inflated by a
+    factor epsilon, i.e. Weighted A*, and then improved by searches with
+    ever smaller factors until it is the shortest one or the budget runs out.
+
+    The distances found are kept between the searches. Cells whose distance
+    dropped after they had been expanded by the current search are set
+    aside as inconsistent and queued for the next search, so each search
+    only repairs what the previous one left rather than starting over.
+
+    Every path comes with a bound on how much longer it may be than the
+    shortest one: the smaller of epsilon and its distance divided by the
+    lowest f-score still queued or set aside, which is a lower bound of the
+    shortest distance.
+
+    Attributes
+    ----------
+    grid: Grid
+        Grid to search.
+    start: int
+        Index of the starting cell.
+    end: int
+        Index of the destination.
+    epsilon: float
+        Factor the heuristic of the current search is inflated by.
+    decrease: float
+        Amount epsilon is lowered by between two searches, starting from the
+        bound of the last path if that is lower already.
+    distance: float
+        Length of the best path found so far, infinite if there is none.
+    bound: float
+        Suboptimality bound of the best path found so far, infinite if there
+        is none.
+    g: dict
+        Pairs of (cell: distance from the start), infinite if missing.
+    prev: dict
+        Pairs of (cell: predecessor on the best known path to it).
+    expanded: int
+        Number of cells expanded by all searches.
+    opened: int
+        Number of times a cell was queued by all searches.
+    order: list
+        Indices of the expanded cells in the order of their expansion,
+        including those expanded again by a later search.
+    """
+
+    def __init__(self, grid: Grid, start: int, end: int, heuristic, epsilon: float = 3.0,
+                 decrease: float = 0.5):
+        """
+        Parameters
+        ----------
+        grid: Grid
+            Grid to search.
+        start: int
+            Index of the starting cell.
+        end: int
+            Index of the destination.
+        heuristic: callable
+            Consistent estimate of the distance from a cell to the destination.
+        epsilon: float
+            Inflation factor of the first search, at least 1.
+        decrease: float
+            Amount the factor is lowered by after each search, above 0.
+        """
+        if epsilon < 1:
+            raise ValueError("epsilon must be at least 1, got {}".format(epsilon))
+        if decrease <= 0:
+            raise ValueError("decrease must be positive, got {}".format(decrease))
+        self.grid: Grid = grid
+        self.start: int = start
+        self.end: int = end
+        self.epsilon: float = epsilon
+        self.decrease: float = decrease
+        self.distance: float = INF
+        self.bound: float = INF
+        self.g: dict = {start: 0}
+        self.prev: dict = {}
+        self.expanded: int = 0
+        self.opened: int = 1
+        self.order: list = []
+        self.__heuristic = heuristic
+        self.__queue: PriorityQueue = PriorityQueue()
+        # Cells expanded by the current search
+        self.__closed: set = set()
+        # Expanded cells whose distance dropped since, queued by the next search
+        self.__incons: set = set()
+        self.__queue.push(start, self.__key(start))
+
+    def __key(self, node: int) -> tuple:
+        estimate = self.__heuristic(node)
+        return (self.g[node] + self.epsilon * estimate, estimate)
+
+    def __improve(self, stop) -> bool:
+        """
+        Expands cells until no queued cell may lead to a path shorter than
+        the current one by more than epsilon.
+
+        Parameters
+        ----------
+        stop: callable
+            Returns whether the budget has run out, checked before every
+            expansion.
+
+        Returns
+        -------
+        bool
+            Whether the search was completed.
+        """
+        grid: Grid = self.grid
+        states: bytearray = grid.states
+        weights: bytearray = grid.weights
+        rows, columns = grid.rows, grid.columns
+        offsets: tuple = grid.offsets
+        g: dict = self.g
+        prev: dict = self.prev
+        queue: PriorityQueue = self.__queue
+        closed: set = self.__closed
+        incons: set = self.__incons
+        end: int = self.end
+
+        while not queue.empty() and g.get(end, INF) > queue.peek()[1][0]:
+            if stop():
+                return False
+            current: int = queue.pop()[0]
+            closed.add(current)
+            self.expanded += 1
+            self.order.append(current)
+            row, col = divmod(current, columns)
+            for d_row, d_col, offset, length in offsets:
+                if not (0 <= row + d_row < rows and 0 <= col + d_col < columns):
+                    continue
+                neighbor: int = current + offset
+                if states[neighbor] == BARRIER:
+                    continue
+                if d_row and d_col and grid.corner_blocked(current, d_row, d_col):
+                    continue
+                # Moving onto the neighbor costs its weight times the length of the move
+                alt_dist = g[current] + weights[neighbor] * length
+                if alt_dist < g.get(neighbor, INF):
+                    g[neighbor] = alt_dist
+                    prev[neighbor] = current
+                    if neighbor in closed:
+                        # Expanded by this search already, repaired by the next one
+                        incons.add(neighbor)
+                    else:
+                        queue.push(neighbor, self.__key(neighbor))
+                        self.opened += 1
+        return True
+
+    def __lower_bound(self) -> float:
+        """Returns the lowest f-score of the queued and inconsistent cells."""
+        g: dict = self.g
+        heuristic = self.__heuristic
+        lowest = INF
+        for node in list(self.__queue.position) + list(self.__incons):
+            lowest = min(lowest, g[node] + heuristic(node))
+        return lowest
+
+    def __next_search(self):
+        """Lowers epsilon and queues the inconsistent cells for the next search."""
+        # A factor above the bound reached already could not improve the path
+        self.epsilon = max(min(self.epsilon, self.bound) - self.decrease, 1.0)
+        queue: PriorityQueue = self.__queue
+        for node in list(queue.position):
+            queue.update(node, self.__key(node))
+        for node in self.__incons:
+            queue.push(node, self.__key(node))
+            self.opened += 1
+        self.__incons.clear()
+        self.__closed.clear()
+
+    def solutions(self, deadline: float = None, max_expanded: int = None):
+        """
+        Runs the searches and yields the best path after each of them until
+        the shortest one has been found or the budget has run out. May be
+        called again with a new budget to continue where the last call
+        stopped.
+
+        Parameters
+        ----------
+        deadline: float
+            Optional `time.perf_counter` value after which no further cell
+            is expanded.
+        max_expanded: int
+            Optional number of cells, counting those of earlier calls, after
+            which no further cell is expanded.
+
+        Yields
+        ------
+        float
+            Distance of the best path after each completed search. Its bound,
+            which shrinks with every search, is in `bound`.
+        """
+        clock = time.perf_counter
+
+        def stop() -> bool:
+            return (
+                (max_expanded is not None and self.expanded >= max_expanded)
+                or (deadline is not None and clock() >= deadline)
+            )
+
+        while self.bound > 1:
+            if not self.__improve(stop):
+                return
+            if self.g.get(self.end, INF) == INF:
+                # Nothing is left to search, there is no path at all
+                self.bound = 1.0
+                return
+            # Predecessors may have gotten closer after they were recorded,
+            # so the path can be shorter than the distance of the destination.
+            self.distance = self.__cost(self.path())
+            lower_bound: float = self.__lower_bound()
+            if self.distance * SLACK <= lower_bound:
+                self.bound = 1.0
+            else:
+                self.bound = max(min(self.epsilon, self.distance / lower_bound), 1.0)
+            yield self.distance
+            if self.bound > 1:
+                self.__next_search()
+
+    def __cost(self, path: list) -> float:
+        """Returns the length of a path of adjacent cells."""
+        grid: Grid = self.grid
+        weights: bytearray = grid.weights
+        return sum(weights[node] * grid.distance(before, node) for before, node in zip(path, path[1:]))
+
+    def path(self) -> list:
+        """
+        Returns the indices of the cells of the best path found so far from
+        start to destination, empty if there is none.
+        """
+        if self.end not in self.prev and self.end != self.start:
+            return []
+        path: list = [self.end]
+        node: int = self.end
+        while node != self.start:
+            node = self.prev[node]
+            path.append(node)
+        path.reverse()
+        return path
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+from array import array
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+from pathfinder.grid import Grid
+from pathfinder.util.priority_queue import PriorityQueue
+from pathfinder.util.state import State
+
+# Translation table mapping barriers to 1 and all other states to 0.
+BLOCKED: bytes = bytes(int(value == State.BARRIER.value) for value in range(256))
+
+# Grid shared with the worker processes, set by `_attach`.
+_shared: tuple = None
+
+
+class GridSnapshot:
+    """
+    Frozen, read-only copy of the barriers of a grid. Unlike the grid itself
+    it is not changed by the solvers so that any number of queries can be
+    answered on it concurrently.
+
+    Attributes
+    ----------
+    rows: int
+        Total number of rows.
+    columns: int
+        Total number of columns.
+    blocked: bytes
+        1 for every barrier and 0 for every other cell indexed like the grid.
+    """
+
+    def __init__(self, rows: int, columns: int, blocked: bytes):
+        """
+        Parameters
+        ----------
+        rows: int
+            Total number of rows.
+        columns: int
+            Total number of columns.
+        blocked: bytes
+            1 for every barrier and 0 for every other cell.
+        """
+        if len(blocked) != rows * columns:
+            raise ValueError("Expected {} cells, got {}".format(rows * columns, len(blocked)))
+        self.rows: int = rows
+        self.columns: int = columns
+        self.blocked: bytes = bytes(blocked)
+
+    @classmethod
+    def from_grid(cls, grid: Grid):
+        """Takes a snapshot of the barriers of a 4-connected grid with unit weights."""
+        if grid.weighted or grid.diagonal:
+            raise ValueError("Batch queries require unit weights and 4-connectivity")
+        return cls(grid.rows, grid.columns, grid.states.translate(BLOCKED))
+
+
+def a_star(blocked, rows: int, columns: int, start: int, end: int) -> tuple:
+    """
+    Read-only A* with the manhattan distance as heuristic.
+
+    Parameters
+    ----------
+    blocked
+        Buffer holding 1 for every barrier, indexed by cell.
+    rows: int
+        Total number of rows.
+    columns: int
+        Total number of columns.
+    start: int
+        Index of the starting cell.
+    end: int
+        Index of the destination.
+
+    Returns
+    -------
+    tuple
+        (distance, path) where path is an array of the indices from start to
+        end. The distance is infinite and the path empty if the destination
+        is unreachable.
+    """
+    end_row, end_col = divmod(end, columns)
+    g_score: dict = {start: 0}
+    prev: dict = {}
+    closed: set = set()
+    queue: PriorityQueue = PriorityQueue()
+    queue.push(start, 0)
+
+    while not queue.empty():
+        current: int = queue.pop()[0]
+        if current == end:
+            path: array = array("i", [end])
+            while current != start:
+                current = prev[current]
+                path.append(current)
+            path.reverse()
+            return g_score[end], path
+        closed.add(current)
+
+        row, col = divmod(current, columns)
+        alt_dist: int = g_score[current] + 1
+        for neighbor, valid in (
+            (current - columns, row > 0),
+            (current + columns, row < rows - 1),
+            (current - 1, col > 0),
+            (current + 1, col < columns - 1),
+        ):
+            if not valid or blocked[neighbor] or neighbor in closed:
+                continue
+            if alt_dist < g_score.get(neighbor, alt_dist + 1):
+                g_score[neighbor] = alt_dist
+                prev[neighbor] = current
+                n_row, n_col = divmod(neighbor, columns)
+                queue.push(neighbor, alt_dist + abs(n_row - end_row) + abs(n_col - end_col))
+
+    return float('inf'), array("i")
+
+
+def _attach(name: str, rows: int, columns: int):
+    """Initializer of the worker processes attaching the shared grid."""
+    global _shared
+    memory: SharedMemory = SharedMemory(name=name)
+    _shared = (memory, memory.buf, rows, columns)
+
+
+def _solve(queries: list) -> list:
+    """Answers a chunk of queries on the shared grid."""
+    _, blocked, rows, columns = _shared
+    return [a_star(blocked, rows, columns, start, end) for start, end in queries]
+
+
+def batch_query(snapshot: GridSnapshot, queries: list, processes: int = None,
+                chunksize: int = 64) -> list:
+    """
+    Answers many shortest path queries on the same grid in parallel. The
+    snapshot is copied into shared memory once and attached by every worker
+    process instead of being pickled per task.
+
+    Parameters
+    ----------
+    snapshot: GridSnapshot
+        Grid to answer the queries on.
+    queries: list
+        (start, end) pairs of cell indices.
+    processes: int
+        Number of worker processes, by default one per core. With 1 the
+        queries are answered in the calling process.
+    chunksize: int
+        Number of queries sent to a worker at once.
+
+    Returns
+    -------
+    list
+        (distance, path) pairs in the order of the queries, see `a_star`.
+    """
+    size: int = snapshot.rows * snapshot.columns
+    for start, end in queries:
+        if not (0 <= start < size and 0 <= end < size):
+            raise IndexError("Query ({}, {}) outside of the grid".format(start, end))
+    if processes == 1:
+        return [
+            a_star(snapshot.blocked, snapshot.rows, snapshot.columns, start, end)
+            for start, end in queries
+        ]
+
+    chunks: list = [queries[i:i + chunksize] for i in range(0, len(queries), chunksize)]
+    memory: SharedMemory = SharedMemory(create=True, size=max(size, 1))
+    try:
+        memory.buf[:size] = snapshot.blocked
+        with Pool(processes, _attach, (memory.name, snapshot.rows, snapshot.columns)) as pool:
+            results: list = []
+            for chunk in pool.imap(_solve, chunks):
+                results.extend(chunk)
+        return results
+    finally:
+        memory.close()
+        memory.unlink()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+from collections import OrderedDict
+from pathfinder.grid import Grid
+
+
+class PathTreeCache:
+    """
+    Least recently used cache of complete shortest path trees, i.e. the
+    predecessors of all cells reachable from a source.
+
+    Every tree is stamped with the version of the grid it was computed for.
+    When a barrier is edited the grid's version is increased and the trees
+    the edit cannot affect are stamped with the new version while all others
+    are dropped: adding a barrier only affects trees containing the cell and
+    removing one only trees containing one of its neighbors.
+
+    Attributes
+    ----------
+    grid: Grid
+        Grid the trees belong to.
+    max_nodes: int
+        Upper bound of the number of predecessors stored in all trees.
+    size: int
+        Number of predecessors currently stored.
+    """
+
+    def __init__(self, grid: Grid, max_nodes: int = 4_000_000):
+        """
+        Parameters
+        ----------
+        grid: Grid
+            Grid the trees belong to.
+        max_nodes: int
+            Upper bound of the number of predecessors stored in all trees.
+            Least recently used trees are evicted once it is exceeded.
+        """
+        self.grid: Grid = grid
+        self.max_nodes: int = max_nodes
+        self.size: int = 0
+        # Pairs of (source: (version, tree))
+        self.__trees: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__trees)
+
+    def __contains__(self, source: int) -> bool:
+        return self.get(source) is not None
+
+    def get(self, source: int) -> dict:
+        """
+        Returns the up to date tree of a source or None.
+
+        Parameters
+        ----------
+        source: int
+            Index of the source.
+
+        Returns
+        -------
+        dict
+            Pairs of (cell: previous cell).
+        """
+        entry: tuple = self.__trees.get(source)
+        if entry is None:
+            return None
+        version, tree = entry
+        if version != self.grid.version:
+            self.__drop(source)
+            return None
+        self.__trees.move_to_end(source)
+        return tree
+
+    def put(self, source: int, tree: dict):
+        """
+        Stores the tree of a source for the current version of the grid.
+
+        Parameters
+        ----------
+        source: int
+            Index of the source.
+        tree: dict
+            Pairs of (cell: previous cell) of all cells reachable from the
+            source. The tree must not be modified afterwards.
+        """
+        if source in self.__trees:
+            self.__drop(source)
+        if len(tree) > self.max_nodes:
+            return
+        self.__trees[source] = (self.grid.version, tree)
+        self.size += len(tree)
+        while self.size > self.max_nodes:
+            self.__drop(next(iter(self.__trees)))
+
+    def path(self, source: int, target: int) -> list:
+        """
+        Returns the indices of the cells on the shortest path from a source
+        to a target in O(path length) without searching.
+
+        Returns
+        -------
+        list
+            Indices from source to target, empty if the target is not
+            reachable and None if no tree of the source is cached.
+        """
+        tree: dict = self.get(source)
+        if tree is None:
+            return None
+        if target != source and target not in tree:
+            return []
+        path: list = [target]
+        while target != source:
+            target = tree[target]
+            path.append(target)
+        path.reverse()
+        return path
+
+    def notify(self, index: int, blocked: bool):
+        """
+        Invalidates the trees affected by a barrier edit. Must be called after
+        the grid's version has been increased.
+
+        Parameters
+        ----------
+        index: int
+            Index of the edited cell.
+        blocked: bool
+            Whether the cell became a barrier or stopped being one.
+        """
+        version: int = self.grid.version
+        neighbors: list = self.grid.adjacent(index)
+        # A barrier also blocks the diagonal moves passing its corners, which
+        # connect two of its neighbors.
+        corners: bool = blocked and self.grid.diagonal
+        for source, (_, tree) in list(self.__trees.items()):
+            if blocked:
+                stale: bool = index == source or index in tree or (
+                    corners and any(neighbor in tree for neighbor in neighbors)
+                )
+            else:
+                stale = any(neighbor == source or neighbor in tree for neighbor in neighbors)
+            if stale:
+                self.__drop(source)
+            else:
+                self.__trees[source] = (version, tree)
+
+    def clear(self):
+        """Drops all trees."""
+        self.__trees.clear()
+        self.size = 0
+
+    def __drop(self, source: int):
+        _, tree = self.__trees.pop(source)
+        self.size -= len(tree)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+import argparse
+import sys
+import time
+from pathfinder.batch import BLOCKED
+from pathfinder.graph import Graph
+from pathfinder.mapfile import load, save
+from pathfinder.maze import ENGINES
+from pathfinder.util.result import SearchResult
+from pathfinder.util.state import State
+
+INF: float = float('inf')
+
+ALGORITHMS: tuple = (
+    "a_star", "dijkstra", "jps", "bidirectional_dijkstra", "bidirectional_a_star", "hpa_star", "ara_star"
+)
+
+
+def cell(text: str) -> tuple:
+    """Parses a "row,column" argument."""
+    try:
+        row, col = (int(value) for value in text.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected row,column but got {!r}".format(text))
+    return row, col
+
+
+def free_cell(graph: Graph, last: bool = False) -> tuple:
+    """Returns the first or last cell which is not a barrier as (row, column)."""
+    blocked: bytes = graph.grid.states.translate(BLOCKED)
+    index: int = blocked.rfind(0) if last else blocked.find(0)
+    if index < 0:
+        raise ValueError("The map has no free cell")
+    return divmod(index, graph.columns)
+
+
+def open_graph(args) -> Graph:
+    """Loads the map of the arguments and applies the connectivity options."""
+    graph: Graph = load(args.map)
+    if args.connectivity is not None or args.corner_cutting:
+        graph.set_connectivity(args.connectivity or graph.connectivity, args.corner_cutting)
+    return graph
+
+
+def solve(args) -> int:
+    """Runs one search and prints its result."""
+    graph: Graph = open_graph(args)
+    start: tuple = args.start or free_cell(graph)
+    end: tuple = args.end or free_cell(graph, last=True)
+    for row, col in (start, end):
+        if not (0 <= row < graph.rows and 0 <= col < graph.columns):
+            raise ValueError("Cell {},{} is outside of the map".format(row, col))
+        if graph.grid.states[graph.grid.index(row, col)] == State.BARRIER.value:
+            raise ValueError("Cell {},{} is a barrier".format(row, col))
+
+    options: dict = {"landmarks": args.landmarks} if args.landmarks else {}
+    if args.epsilon is not None:
+        options["epsilon"] = args.epsilon
+    if options and args.algorithm not in ("a_star", "ara_star"):
+        raise ValueError("Landmarks and epsilon are only supported by a_star and ara_star")
+    if args.time_limit is not None or args.max_expanded is not None:
+        if args.algorithm != "ara_star":
+            raise ValueError("Budgets are only supported by ara_star")
+        if args.time_limit is not None:
+            options["time_limit"] = args.time_limit / 1000
+        if args.max_expanded is not None:
+            options["max_expanded"] = args.max_expanded
+    begin: float = time.perf_counter()
+    result: SearchResult = graph.solve(
+        graph.grid[start[0]][start[1]], graph.grid[end[0]][end[1]], args.algorithm, **options
+    )
+    elapsed: float = time.perf_counter() - begin
+
+    print("algorithm: {}".format(args.algorithm))
+    print("start: {},{}  end: {},{}".format(*start, *end))
+    if result.found:
+        print("distance: {}".format(result.distance))
+    else:
+        # Only a search which ran out of budget leaves the bound open
+        print("distance: {}".format("no path within budget" if result.bound == INF else "unreachable"))
+    print("expanded: {}  opened: {}".format(result.expanded, result.opened))
+    if result.bound != 1 or args.algorithm == "ara_star":
+        print("bound: {:.3f}".format(result.bound))
+    print("time: {:.3f} ms".format(elapsed * 1000))
+    if args.path:
+        print(" ".join("{},{}".format(row, col) for row, col in result.path))
+    return 0 if result.found else 1
+
+
+def convert(args) -> int:
+    """Saves a map in the format given by the extension of the output."""
+    graph: Graph = load(args.map)
+    save(graph, args.output)
+    return 0
+
+
+def maze(args) -> int:
+    """Generates a maze and saves it in the format given by the extension of the output."""
+    graph: Graph = Graph(args.rows, 1, columns=args.columns or args.rows)
+    graph.generate_maze(algorithm=args.algorithm, seed=args.seed)
+    save(graph, args.output)
+    return 0
+
+
+def info(args) -> int:
+    """Prints the size, connectivity, barriers and weights of a map."""
+    graph: Graph = load(args.map)
+    grid = graph.grid
+    print("rows: {}  columns: {}  cells: {}".format(grid.rows, grid.columns, grid.size))
+    print("connectivity: {}  corner cutting: {}".format(grid.connectivity, grid.corner_cutting))
+    print("barriers: {}".format(grid.states.count(State.BARRIER.value)))
+    print("weights: {}..{}".format(grid.min_weight(), grid.max_weight()))
+    return 0
+
+
+def parser() -> argparse.ArgumentParser:
+    """Builds the parser of the command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m pathfinder.cli",
+        description="Headless path finding on map files (.map, .png or the binary .grid format)."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("solve", help="find the shortest path between two cells")
+    command.add_argument("map", help="map file")
+    command.add_argument("--start", type=cell, help="row,column of the start, the first free cell by default")
+    command.add_argument("--end", type=cell, help="row,column of the destination, the last free cell by default")
+    command.add_argument("--algorithm", "-a", choices=ALGORITHMS, default="a_star")
+    command.add_argument("--connectivity", type=int, choices=(4, 8), help="override the connectivity of the map")
+    command.add_argument("--corner-cutting", action="store_true", help="allow diagonal moves past a corner")
+    command.add_argument("--landmarks", type=int, default=0, help="number of landmarks of the ALT heuristic of a_star and ara_star")
+    command.add_argument("--epsilon", type=float, help="factor inflating the heuristic of a_star and ara_star")
+    command.add_argument("--time-limit", type=float, help="milliseconds after which ara_star returns its best path")
+    command.add_argument("--max-expanded", type=int, help="number of expanded cells after which ara_star returns its best path")
+    command.add_argument("--path", action="store_true", help="print the cells of the path")
+    command.set_defaults(run=solve)
+
+    command = commands.add_parser("convert", help="convert a map into another format")
+    command.add_argument("map", help="map file to read")
+    command.add_argument("output", help="map file to write, the format follows from the extension")
+    command.set_defaults(run=convert)
+
+    command = commands.add_parser("maze", help="generate a maze")
+    command.add_argument("output", help="map file to write, the format follows from the extension")
+    command.add_argument("--rows", type=int, default=101, help="number of rows")
+    command.add_argument("--columns", type=int, help="number of columns, as many as rows by default")
+    command.add_argument("--algorithm", "-a", choices=tuple(ENGINES), default="backtracker")
+    command.add_argument("--seed", type=int, help="seed of the random numbers, the same seed gives the same maze")
+    command.set_defaults(run=maze)
+
+    command = commands.add_parser("info", help="describe a map")
+    command.add_argument("map", help="map file")
+    command.set_defaults(run=info)
+    return parser
+
+
+def main(argv: list = None) -> int:
+    """
+    Entry point of the command line.
+
+    Parameters
+    ----------
+    argv: list
+        Arguments without the program name, by default those of the process.
+
+    Returns
+    -------
+    int
+        Exit status, 1 if no path was found and 2 for invalid input.
+    """
+    args = parser().parse_args(argv)
+    try:
+        return args.run(args)
+    except (OSError, ValueError) as error:
+        print("error: {}".format(error), file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
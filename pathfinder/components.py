@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+from array import array
+from collections import deque
+from pathfinder.grid import Grid
+from pathfinder.util.state import State
+
+BARRIER: int = State.BARRIER.value
+
+
+class ComponentIndex:
+    """
+    Connected components of the free cells of a grid, so that whether two
+    cells are connected at all is answered without a search.
+
+    Every free cell carries a label and the labels form a union-find forest:
+    two cells are connected if their labels have the same root. Removing a
+    barrier merges the components around it by uniting their labels.
+    Adding one may split a component, which is detected by searching from
+    its free neighbors at the same time until they meet again. Only the
+    parts cut off, never the largest one, are given new labels, so the work
+    is bounded by the size of the smaller parts.
+
+    Diagonal moves never connect cells which are not connected orthogonally
+    as well, see `Grid.corner_blocked`, so the components are the same for
+    both connectivities.
+
+    Attributes
+    ----------
+    grid: Grid
+        Grid whose components are indexed.
+    version: int
+        Version of the grid the index is up to date with.
+    labels: array
+        Label of every cell, -1 for barriers.
+    count: int
+        Number of components.
+    """
+
+    def __init__(self, grid: Grid):
+        """
+        Parameters
+        ----------
+        grid: Grid
+            Grid to index.
+        """
+        self.grid: Grid = grid
+        self.version: int = grid.version
+        self.labels: array = array("i", [-1]) * grid.size
+        self.count: int = 0
+        # Parent of every label in the union-find forest
+        self.__parent: list = []
+
+        states: bytearray = grid.states
+        labels: array = self.labels
+        for index in range(grid.size):
+            if states[index] != BARRIER and labels[index] < 0:
+                self.__fill(index, self.__new_label())
+
+    def __new_label(self) -> int:
+        self.__parent.append(len(self.__parent))
+        self.count += 1
+        return len(self.__parent) - 1
+
+    def __find(self, label: int) -> int:
+        """Returns the root of a label, compressing the path to it."""
+        parent: list = self.__parent
+        root: int = label
+        while parent[root] != root:
+            root = parent[root]
+        while parent[label] != root:
+            parent[label], label = root, parent[label]
+        return root
+
+    def __fill(self, source: int, label: int):
+        """Labels all free cells connected to a cell."""
+        grid: Grid = self.grid
+        labels: array = self.labels
+        labels[source] = label
+        frontier: deque = deque([source])
+        while frontier:
+            for neighbor in self.__free_neighbors(frontier.popleft()):
+                if labels[neighbor] != label:
+                    labels[neighbor] = label
+                    frontier.append(neighbor)
+
+    def __free_neighbors(self, index: int) -> list:
+        """Returns the horizontal and vertical neighbors which are not barriers."""
+        states: bytearray = self.grid.states
+        return [neighbor for neighbor in self.grid.neighbors(index) if states[neighbor] != BARRIER]
+
+    def component(self, index: int) -> int:
+        """
+        Returns an identifier of the component of a cell, -1 for barriers.
+        Identifiers change when components are merged or split.
+        """
+        label: int = self.labels[index]
+        return -1 if label < 0 else self.__find(label)
+
+    def connected(self, a: int, b: int) -> bool:
+        """Whether two cells are free and connected by a path."""
+        return self.component(a) == self.component(b) != -1
+
+    def update_cell(self, index: int):
+        """
+        Notifies the index that a cell became or stopped being a barrier.
+        Changes of the weight do not affect the components.
+
+        Parameters
+        ----------
+        index: int
+            Index of the edited cell.
+        """
+        blocked: bool = self.grid.states[index] == BARRIER
+        if blocked and self.labels[index] >= 0:
+            self.__add_barrier(index)
+        elif not blocked and self.labels[index] < 0:
+            self.__remove_barrier(index)
+        self.version = self.grid.version
+
+    def __remove_barrier(self, index: int):
+        """Merges the components around a cell which became free."""
+        roots: set = {self.component(neighbor) for neighbor in self.__free_neighbors(index)}
+        if not roots:
+            self.labels[index] = self.__new_label()
+            return
+        root: int = roots.pop()
+        for other in roots:
+            self.__parent[other] = root
+        self.count -= len(roots)
+        self.labels[index] = root
+
+    def __add_barrier(self, index: int):
+        """Splits the component of a cell which became a barrier if necessary."""
+        self.labels[index] = -1
+        neighbors: list = self.__free_neighbors(index)
+        if not neighbors:
+            # The cell was a component on its own
+            self.count -= 1
+            return
+        if len(neighbors) == 1:
+            return
+
+        # Search from all neighbors at the same time. Searches which meet
+        # are joined and a search which runs out of cells before all others
+        # have been joined has covered a part which has been cut off.
+        owner: dict = {neighbor: group for group, neighbor in enumerate(neighbors)}
+        group_of: list = list(range(len(neighbors)))
+        frontiers: list = [deque([neighbor]) for neighbor in neighbors]
+        members: list = [[neighbor] for neighbor in neighbors]
+        active: set = set(range(len(neighbors)))
+
+        def find(group: int) -> int:
+            while group_of[group] != group:
+                group = group_of[group]
+            return group
+
+        while len(active) > 1:
+            for group in list(active):
+                if group not in active:
+                    continue
+                frontier: deque = frontiers[group]
+                if not frontier:
+                    # This part is cut off from all other searches
+                    active.discard(group)
+                    if len(active) >= 1:
+                        label: int = self.__new_label()
+                        for cell in members[group]:
+                            self.labels[cell] = label
+                    continue
+                current: int = frontier.popleft()
+                for neighbor in self.__free_neighbors(current):
+                    other = owner.get(neighbor)
+                    if other is None:
+                        owner[neighbor] = group
+                        frontier.append(neighbor)
+                        members[group].append(neighbor)
+                        continue
+                    other = find(other)
+                    if other != group:
+                        # Both searches are in the same part, join them
+                        group_of[other] = group
+                        frontiers[group].extend(frontiers[other])
+                        members[group].extend(members[other])
+                        active.discard(other)
+                if len(active) <= 1:
+                    break
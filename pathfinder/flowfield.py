@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+from array import array
+from collections import deque
+from pathfinder.alt import unreachable
+from pathfinder.grid import Grid
+from pathfinder.util.bucket_queue import BucketQueue
+from pathfinder.util.priority_queue import PriorityQueue
+from pathfinder.util.state import State
+
+BARRIER: int = State.BARRIER.value
+INF: float = float('inf')
+# Direction of cells without a next step, i.e. targets, barriers and cells
+# from which no target can be reached.
+NONE: int = 255
+
+
+class FlowField:
+    """
+    Distances from every cell to the closest of one or more targets together
+    with the direction of the first move of a shortest path, computed by a
+    single search backwards from all targets at once. Any number of agents
+    sharing the targets then follow the directions at O(1) per step instead
+    of searching for themselves.
+
+    The field is repaired after barrier and weight edits, see `update_cell`.
+    Only the cells whose shortest path ran over the edited cell are searched
+    again, or those which get closer if the edit opened a shortcut.
+
+    Attributes
+    ----------
+    grid: Grid
+        Grid the field was computed for.
+    version: int
+        Version of the grid the field is up to date with.
+    targets: tuple
+        Indices of the targets.
+    distance: array
+        Cost of the cheapest path from every cell to a target. Unreachable
+        cells and barriers hold the largest value of the array type, see
+        `pathfinder.alt.unreachable`. Integer costs are stored in 4 bytes
+        per cell, those of 8-connected grids in 8.
+    direction: bytearray
+        Index into `grid.offsets` of the first move of every cell, `NONE`
+        if it has none.
+    """
+
+    def __init__(self, grid: Grid, targets: list):
+        """
+        Parameters
+        ----------
+        grid: Grid
+            Grid to compute the field for.
+        targets: list
+            Indices of the targets.
+        """
+        self.grid: Grid = grid
+        self.version: int = grid.version
+        self.targets: tuple = tuple(targets)
+        typecode: str = "d" if grid.diagonal else "I"
+        self.__limit = unreachable(array(typecode))
+        self.distance: array = array(typecode, [self.__limit]) * grid.size
+        self.direction: bytearray = bytearray([NONE]) * grid.size
+        # Index of the move in the opposite direction of every move
+        moves: list = [(d_row, d_col) for d_row, d_col, _, _ in grid.offsets]
+        self.__opposite: list = [moves.index((-d_row, -d_col)) for d_row, d_col in moves]
+        # Weight of every cell the field knows of, 0 for barriers, to tell
+        # the kind of an edit in `update_cell`
+        self.__known: bytearray = bytearray(
+            0 if state == BARRIER else weight for state, weight in zip(grid.states, grid.weights)
+        )
+        self.__build()
+
+    def __build(self):
+        """Computes the field by searching from all targets at once."""
+        grid: Grid = self.grid
+        states: bytearray = grid.states
+        distance: array = self.distance
+        direction: bytearray = self.direction
+        sources: list = [target for target in dict.fromkeys(self.targets) if states[target] != BARRIER]
+        for target in sources:
+            distance[target] = 0
+
+        if grid.weighted or grid.diagonal:
+            queue = PriorityQueue() if grid.diagonal else BucketQueue()
+            for target in sources:
+                queue.push(target, 0)
+            self.__propagate(queue)
+            return
+
+        # Breadth first on unit weights, every cell is reached by its first move
+        rows, columns = grid.rows, grid.columns
+        offsets: tuple = grid.offsets
+        opposite: list = self.__opposite
+        limit = self.__limit
+        frontier: deque = deque(sources)
+        while frontier:
+            current: int = frontier.popleft()
+            row, col = divmod(current, columns)
+            alt_dist: int = distance[current] + 1
+            for move, (d_row, d_col, offset, _) in enumerate(offsets):
+                if not (0 <= row + d_row < rows and 0 <= col + d_col < columns):
+                    continue
+                neighbor: int = current + offset
+                if states[neighbor] != BARRIER and distance[neighbor] == limit:
+                    distance[neighbor] = alt_dist
+                    # The neighbor moves back the opposite way
+                    direction[neighbor] = opposite[move]
+                    frontier.append(neighbor)
+
+    def __propagate(self, queue):
+        """
+        Lowers the distances of the cells which can move onto the queued
+        cells until no distance can be lowered any more, i.e. Dijkstra's
+        algorithm backwards.
+        """
+        grid: Grid = self.grid
+        states: bytearray = grid.states
+        weights: bytearray = grid.weights
+        rows, columns = grid.rows, grid.columns
+        offsets: tuple = grid.offsets
+        distance: array = self.distance
+        direction: bytearray = self.direction
+        opposite: list = self.__opposite
+        while not queue.empty():
+            current, current_dist = queue.pop()
+            row, col = divmod(current, columns)
+            for move, (d_row, d_col, offset, length) in enumerate(offsets):
+                if not (0 <= row + d_row < rows and 0 <= col + d_col < columns):
+                    continue
+                neighbor: int = current + offset
+                if states[neighbor] == BARRIER:
+                    continue
+                if d_row and d_col and grid.corner_blocked(current, d_row, d_col):
+                    continue
+                # Moving from the neighbor onto the current cell pays its weight
+                alt_dist = current_dist + weights[current] * length
+                if alt_dist < distance[neighbor]:
+                    distance[neighbor] = alt_dist
+                    direction[neighbor] = opposite[move]
+                    queue.push(neighbor, alt_dist)
+
+    def reachable(self, index: int) -> bool:
+        """Whether a target can be reached from a cell."""
+        return self.distance[index] != self.__limit
+
+    def cost(self, index: int) -> float:
+        """Returns the cost of the cheapest path from a cell to a target, infinite if there is none."""
+        dist = self.distance[index]
+        return INF if dist == self.__limit else dist
+
+    def next_step(self, index: int) -> int:
+        """
+        Returns the index of the cell to move to from a cell, -1 on a target
+        and on cells from which no target can be reached.
+        """
+        move: int = self.direction[index]
+        if move == NONE:
+            return -1
+        return index + self.grid.offsets[move][2]
+
+    def path(self, index: int) -> list:
+        """
+        Returns the cheapest path from a cell to a target as a list of
+        indices including both, empty if no target can be reached.
+        """
+        if not self.reachable(index):
+            return []
+        offsets: tuple = self.grid.offsets
+        direction: bytearray = self.direction
+        path: list = [index]
+        while direction[index] != NONE:
+            index += offsets[direction[index]][2]
+            path.append(index)
+        return path
+
+    def update_cell(self, index: int):
+        """
+        Repairs the field after a cell became or stopped being a barrier or
+        its weight changed.
+
+        Parameters
+        ----------
+        index: int
+            Index of the edited cell.
+        """
+        grid: Grid = self.grid
+        known: int = self.__known[index]
+        now: int = 0 if grid.states[index] == BARRIER else grid.weights[index]
+        self.__known[index] = now
+        self.version = grid.version
+        if known == now:
+            return
+
+        # Cells whose path may have become more expensive: a new barrier and
+        # the cells squeezing past its corners, or the cells moving onto a
+        # heavier cell. They and all cells whose path runs over them are
+        # searched again.
+        seeds: list = []
+        if now == 0:
+            seeds.append(index)
+            for neighbor in self.__movers(index):
+                if self.next_step(neighbor) != -1 and self.__blocked(neighbor):
+                    seeds.append(neighbor)
+        elif known and now > known:
+            seeds = [neighbor for neighbor in self.__movers(index) if self.next_step(neighbor) == index]
+        invalid: set = self.__subtree(seeds)
+
+        distance: array = self.distance
+        direction: bytearray = self.direction
+        for cell in invalid:
+            distance[cell] = self.__limit
+            direction[cell] = NONE
+        # Search again from the cells next to the invalidated ones and from
+        # those around the edit, which may have gotten closer.
+        queue = PriorityQueue() if grid.diagonal else BucketQueue()
+        candidates: set = set(invalid)
+        candidates.add(index)
+        candidates.update(self.__movers(index))
+        targets: set = set(self.targets)
+        states: bytearray = grid.states
+        for cell in candidates:
+            if states[cell] == BARRIER:
+                continue
+            if cell in targets:
+                distance[cell] = 0
+                direction[cell] = NONE
+            else:
+                self.__relax(cell)
+        for cell in candidates:
+            if states[cell] != BARRIER and self.reachable(cell):
+                queue.push(cell, distance[cell])
+        self.__propagate(queue)
+
+    def __movers(self, index: int) -> list:
+        """Returns the free cells around a cell, i.e. those which may move onto it."""
+        grid: Grid = self.grid
+        states: bytearray = grid.states
+        rows, columns = grid.rows, grid.columns
+        row, col = divmod(index, columns)
+        return [
+            index + offset for d_row, d_col, offset, _ in grid.offsets
+            if 0 <= row + d_row < rows and 0 <= col + d_col < columns and states[index + offset] != BARRIER
+        ]
+
+    def __blocked(self, index: int) -> bool:
+        """Whether the first move of a cell is no longer possible."""
+        d_row, d_col, offset, _ = self.grid.offsets[self.direction[index]]
+        if self.grid.states[index + offset] == BARRIER:
+            return True
+        return bool(d_row and d_col and self.grid.corner_blocked(index, d_row, d_col))
+
+    def __subtree(self, seeds: list) -> set:
+        """Returns the seeds and all cells whose path runs over one of them."""
+        subtree: set = set(seeds)
+        frontier: list = list(seeds)
+        while frontier:
+            current: int = frontier.pop()
+            for neighbor in self.__movers(current):
+                if neighbor not in subtree and self.next_step(neighbor) == current:
+                    subtree.add(neighbor)
+                    frontier.append(neighbor)
+        return subtree
+
+    def __relax(self, index: int):
+        """Sets the distance of a cell to the best move onto a cell of known distance."""
+        grid: Grid = self.grid
+        weights: bytearray = grid.weights
+        distance: array = self.distance
+        direction: bytearray = self.direction
+        limit = self.__limit
+        rows, columns = grid.rows, grid.columns
+        row, col = divmod(index, columns)
+        for move, (d_row, d_col, offset, length) in enumerate(grid.offsets):
+            if not (0 <= row + d_row < rows and 0 <= col + d_col < columns):
+                continue
+            neighbor: int = index + offset
+            if grid.states[neighbor] == BARRIER or distance[neighbor] == limit:
+                continue
+            if d_row and d_col and grid.corner_blocked(index, d_row, d_col):
+                continue
+            alt_dist = distance[neighbor] + weights[neighbor] * length
+            if alt_dist < distance[index]:
+                distance[index] = alt_dist
+                direction[index] = move
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the distance and direction arrays."""
+        return self.distance.itemsize * len(self.distance) + len(self.direction)
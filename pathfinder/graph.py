@@ -1,12 +1,26 @@
 #!/usr/bin/env python3
-import pygame
+import copy
+from pathfinder.util.bucket_queue import BucketQueue
 from pathfinder.util.priority_queue import PriorityQueue
-from queue import LifoQueue
+from pathfinder.util.result import SearchResult
 import time
-import math
-import random
+from pathfinder.alt import Landmarks
+from pathfinder.ara import AnytimeAStar
+from pathfinder.grid import Grid
+from pathfinder.hpa import HierarchicalPlanner
+from pathfinder.jps import JumpPointSearch
+from pathfinder.lpa import LPAStar
+from pathfinder import maze
+from pathfinder.cache import PathTreeCache
+from pathfinder.flowfield import FlowField
+from pathfinder.components import ComponentIndex
 from pathfinder.vertex import Vertex
 from pathfinder.util.state import State
+from pathfinder.util.stats import SearchStats
+from pathfinder.util.scratch import SearchScratch
+
+BARRIER: int = State.BARRIER.value
+INF: float = float('inf')
 
 
 class Graph:
@@ -20,108 +34,347 @@ class Graph:
     rows: int
         Total number of rows
     columns: int
-        Total number of rows
+        Total number of columns
     vertex_width: int
         Width of square representing a vertex.
+    connectivity: int
+        4 or 8 neighbors per vertex, see `Grid`.
+    corner_cutting: bool
+        Whether diagonal moves may pass a barrier at one corner.
     start: Vertex
         The starting vertex in the graph from which the shortest
         path the destination is to be found.
     end: Vertex
         The destination vertex to which to shortest path is to be
         found.
-    grid: list
-        A list representing the graph/grid.
+    paths: dict
+        Pairs of (index: previous_index) of the last search.
+    planner: LPAStar
+        Incremental planner kept by `replan`, None if it has not been used.
+    hierarchy: HierarchicalPlanner
+        Abstract graph kept by `hpa_star`, None if it has not been used.
+    landmarks: Landmarks
+        Distance table of the ALT heuristic kept by `a_star`, None if it has
+        not been used.
+    cache: PathTreeCache
+        Shortest path trees of complete Dijkstra runs by source.
+    flow: FlowField
+        Flow field kept by `flow_field`, None if it has not been used.
+    components: ComponentIndex
+        Connected components of the free cells, None to disable the index.
+        While it is set, searches for a destination in another component
+        return at once instead of exhausting the start's component.
+    stats: SearchStats
+        Instrumentation collecting counters and timers of the solvers and the
+        maze generator, None to disable it.
+    grid: Grid
+        Compact storage of the graph/grid.
     """
 
-    def __init__(self, rows: int, vertex_width: int):
+    def __init__(self, rows: int, vertex_width: int, connectivity: int = 4,
+                 corner_cutting: bool = False, columns: int = None):
         """
         Parameters
         ----------
         rows: int
-            Total number of rows. Since the window is square the number
-            of rows also equals the number of columns.
+            Total number of rows.
         vertex_width: int
             Width of the square representing a vertix in graph.
+        connectivity: int
+            4 to move only horizontally and vertically or 8 to move
+            diagonally as well.
+        corner_cutting: bool
+            Whether diagonal moves may pass a barrier at one corner.
+        columns: int
+            Total number of columns, by default the grid is square.
         """
         self.rows: int = rows
-        self.columns: int = rows
+        self.columns: int = rows if columns is None else columns
         self.vertex_width: int = vertex_width
+        self.connectivity: int = connectivity
+        self.corner_cutting: bool = corner_cutting
 
         self.start: Vertex = None
         self.end: Vertex = None
         self.paths: dict = {}
+        self.planner: LPAStar = None
+        self.hierarchy: HierarchicalPlanner = None
+        self.landmarks: Landmarks = None
+        self.flow: FlowField = None
+        self.components: ComponentIndex = None
+        self.stats: SearchStats = None
 
-        self.grid: list = self.init_grid()
+        self.grid: Grid = self.init_grid()
+        self.cache: PathTreeCache = PathTreeCache(self.grid)
 
-    def init_grid(self) -> list:
+    def init_grid(self) -> Grid:
         """
-        Initialize the graph by creating a 2d list where the first dimension
-        represents a row and the second dimension represents a columns.
+        Initialize the graph by allocating the storage of all cells. Cells can
+        still be accessed by `grid[row][column]`.
 
         Returns
         -------
-        list
-            2d list representing a graph. 
+        Grid
+            Grid representing a graph.
         """
-        xs: list = []
-        ys: list = []
+        return Grid(self.rows, self.columns, self.vertex_width, self.connectivity, self.corner_cutting)
 
-        for row in range(self.rows):
-            for col in range(self.columns):
-                node = Vertex(row, col, self.vertex_width)
-                ys.append(node)
-            xs.append(ys)
-            ys = []
+    def snapshot(self) -> 'Graph':
+        """
+        Returns a copy of the graph a search can run on in another thread
+        while this graph is drawn and edited. Only the states are copied.
+        The weights, which searches never write, are shared, and so are the
+        landmark and component tables if they are up to date.
 
-        return xs
+        The copy collects its own stats, if this graph has any, so that no
+        counter is written by two threads. Merge them with
+        `SearchStats.merge` once the search is done.
+
+        Returns
+        -------
+        Graph
+            Copy with the same start and destination.
+        """
+        graph: Graph = Graph(self.rows, self.vertex_width, self.connectivity, self.corner_cutting, self.columns)
+        grid: Grid = graph.grid
+        grid.states[:] = self.grid.states
+        grid.weights = self.grid.weights
+        grid.version = self.grid.version
+        graph.start = grid.vertex(self.start.index) if self.start else None
+        graph.end = grid.vertex(self.end.index) if self.end else None
+        graph.stats = None if self.stats is None else SearchStats()
+        for name in ("landmarks", "components"):
+            table = getattr(self, name)
+            if table is not None and table.grid is self.grid and table.version == self.grid.version:
+                table = copy.copy(table)
+                table.grid = grid
+                setattr(graph, name, table)
+        return graph
+
+    def set_connectivity(self, connectivity: int, corner_cutting: bool = False):
+        """
+        Switches between 4 and 8 neighbors per vertex. All cached trees, the
+        incremental planner and the abstract graph are dropped.
+
+        Parameters
+        ----------
+        connectivity: int
+            4 or 8.
+        corner_cutting: bool
+            Whether diagonal moves may pass a barrier at one corner.
+        """
+        self.grid.set_connectivity(connectivity, corner_cutting)
+        self.connectivity = connectivity
+        self.corner_cutting = corner_cutting
+        self.grid.version += 1
+        self.cache.clear()
+        self.planner = None
+        self.hierarchy = None
+        self.landmarks = None
+        self.flow = None
+        # The components do not depend on the connectivity
+        if self.components is not None:
+            self.components.version = self.grid.version
 
     def set_start(self, v: Vertex):
         """
-        Sets a given vertex as the starting point in graph.
+        Sets a given vertex as the starting point in graph. A barrier is
+        removed first so that the auxiliary structures learn of the change.
 
         Parameters
         ----------
         v: Vertex
             Starting point.
         """
+        if v.state == State.BARRIER:
+            self.remove_barrier(v)
         v.set_start()
         self.start = v
 
     def set_end(self, v: Vertex):
         """
-        Sets a given vertex as destination in graph.
+        Sets a given vertex as destination in graph. A barrier is removed
+        first so that the auxiliary structures learn of the change.
 
         Parameters
         ----------
         v: Vertex
             Destination point.
         """
+        if v.state == State.BARRIER:
+            self.remove_barrier(v)
         v.set_end()
         self.end = v
 
-    def __get_discovered(self):
-        nodes: list = []
-        for rows in self.grid:
-            for node in rows:
-                if node.state in [State.OPEN, State.CLOSED, State.PATH]:
-                    nodes.append(node)
-        return nodes
+    def set_barrier(self, v: Vertex):
+        """
+        Turns a vertex into a barrier and notifies the incremental planners.
+
+        Parameters
+        ----------
+        v: Vertex
+            Vertex to block.
+        """
+        v.set_barrier()
+        self.grid.version += 1
+        self.cache.notify(v.index, True)
+        if self.planner is not None:
+            self.planner.update_cell(v.index)
+        if self.hierarchy is not None:
+            self.hierarchy.update_cell(v.index)
+        if self.flow is not None:
+            self.flow.update_cell(v.index)
+        if self.components is not None:
+            self.components.update_cell(v.index)
+
+    def remove_barrier(self, v: Vertex):
+        """
+        Turns a barrier back into an empty vertex and notifies the incremental
+        planners.
+
+        Parameters
+        ----------
+        v: Vertex
+            Barrier to remove.
+        """
+        v.reset()
+        self.grid.version += 1
+        self.cache.notify(v.index, False)
+        if self.planner is not None:
+            self.planner.update_cell(v.index)
+        if self.hierarchy is not None:
+            self.hierarchy.update_cell(v.index)
+        if self.flow is not None:
+            self.flow.update_cell(v.index)
+        if self.components is not None:
+            self.components.update_cell(v.index)
+
+    def set_weight(self, v: Vertex, weight: int):
+        """
+        Sets the traversal weight of a vertex, i.e. the cost of moving onto it,
+        and notifies the cache and the incremental planners.
+
+        Parameters
+        ----------
+        v: Vertex
+            Vertex to change.
+        weight: int
+            New weight between 1 and `pathfinder.grid.MAX_WEIGHT`.
+        """
+        index: int = v.index
+        increased: bool = weight > self.grid.weights[index]
+        self.grid.set_weight(index, weight)
+        self.grid.version += 1
+        # A heavier cell only affects the trees running over it like a new
+        # barrier, a lighter one those reaching one of its neighbors.
+        self.cache.notify(index, increased)
+        if self.planner is not None:
+            self.planner.update_cell(index)
+        if self.hierarchy is not None:
+            self.hierarchy.update_cell(index)
+        if self.flow is not None:
+            self.flow.update_cell(index)
+        if self.components is not None:
+            self.components.update_cell(index)
 
     def reset(self):
         """
-        Resets the graph by reseting start, destination and all vertex objects.
+        Resets the graph by reseting start, destination and all vertices. The
+        storage of the grid is cleared in place rather than allocated again.
         """
         self.start = None
         self.end = None
         self.paths = {}
-        self.grid = self.init_grid()
+        self.planner = None
+        self.hierarchy = None
+        self.landmarks = None
+        self.flow = None
+        self.grid.clear()
+        self.cache.clear()
 
     def reset_discovered(self):
+        """
+        Resets all open, closed and path vertices while keeping start,
+        destination and barriers. Only the vertices changed by the searches
+        since the last reset are visited, see `Grid.clear_discovered`.
+        """
         self.paths = {}
-        for node in self.__get_discovered():
-            node.reset()
+        self.grid.clear_discovered()
+
+    def index_components(self) -> ComponentIndex:
+        """
+        Enables the index of connected components, see `components`. It is
+        kept up to date by `set_barrier` and `remove_barrier` and rebuilt if
+        the grid was changed otherwise.
+
+        Returns
+        -------
+        ComponentIndex
+            The new index.
+        """
+        self.components = ComponentIndex(self.grid)
+        return self.components
+
+    def __unreachable(self) -> bool:
+        """Whether the index of components rules out a path from the start to the destination."""
+        if self.components is None or self.start is None or self.end is None:
+            return False
+        if self.components.grid is not self.grid or self.components.version != self.grid.version:
+            self.index_components()
+        return not self.components.connected(self.start.index, self.end.index)
+
+    def __no_path(self) -> SearchResult:
+        """Result of a search which was not run since the destination is unreachable."""
+        self.paths = {}
+        return SearchResult([], float('inf'), 0, 0)
+
+    def solve(self, start: Vertex, end: Vertex = None, algorithm: str = "a_star",
+              observer=None, **options) -> SearchResult:
+        """
+        Headless entry point for finding the shortest path between two vertices.
+
+        Parameters
+        ----------
+        start: Vertex
+            Vertex to start the search at.
+        end: Vertex
+            Destination vertex. May be omitted for Dijkstra in which case the
+            shortest paths to all reachable vertices are computed.
+        algorithm: str
+            One of "a_star", "dijkstra", "jps", "bidirectional_dijkstra",
+            "bidirectional_a_star", "hpa_star" and "ara_star".
+        observer: callable
+            Optional callback invoked after every expanded node, e.g. a
+            GUI's draw method. Searches run without it use pure algorithm time.
+        options
+            Further keyword arguments passed on to the solver, e.g. the
+            engine used by Dijkstra.
 
-    def dijkstra(self, gui) -> dict:
+        Returns
+        -------
+        SearchResult
+            Path, distance and expansion statistics of the search.
+        """
+        solvers: dict = {
+            "a_star": self.a_star,
+            "dijkstra": self.dijkstra,
+            "jps": self.jump_point_search,
+            "bidirectional_dijkstra": self.bidirectional_dijkstra,
+            "bidirectional_a_star": self.bidirectional_a_star,
+            "hpa_star": self.hpa_star,
+            "ara_star": self.ara_star,
+        }
+        if algorithm not in solvers:
+            raise ValueError("Unknown algorithm: {}".format(algorithm))
+        if algorithm != "dijkstra" and end is None:
+            raise ValueError("{} requires a destination".format(algorithm))
+
+        self.set_start(start)
+        if end is not None:
+            self.set_end(end)
+        return solvers[algorithm](observer, **options)
+
+    def dijkstra(self, observer=None, engine: str = "bucket") -> SearchResult:
         """
         Finds the shortest path(s) to either one destination or to all other nodes
         starting at a source node.
@@ -129,217 +382,924 @@ class Graph:
         nodes. At first only the source node is in the queue. New nodes will be added
         after they have been discovered  (are neighbors of visited nodes).
 
-        gui
-            GUI object for accessing the drawing method to redraw the window.
+        observer: callable
+            Optional callback invoked after every expanded node, e.g. for
+            redrawing the window.
+        engine: str
+            "bucket" for Dial's algorithm keeping the nodes in a bucket queue,
+            "queue" for a binary heap or "wavefront" for a vectorized breadth
+            first search which expands whole frontiers at once. The latter
+            requires NumPy, only calls the observer once and does not support
+            weighted grids.
+        """
+        if engine == "wavefront":
+            return self.__dijkstra_wavefront(observer)
+        if engine not in ("bucket", "queue"):
+            raise ValueError("Unknown engine: {}".format(engine))
+        return self.run(self.dijkstra_steps(engine == "bucket"), observer, self.stats)
+
+    def dijkstra_steps(self, bucket: bool = True):
         """
+        Generator version of `dijkstra` which expands one node per step.
 
-        # Containing pairs of vertix and distance to the starting vertix where
-        # the vertix is the key and the distance the key.
-        dist: dict = {}
-        # Dictionary with pairs of (vertix: previous_vertix)
+        Parameters
+        ----------
+        bucket: bool
+            Whether to use a bucket queue, which is faster for the small
+            integer weights of the cells, or a binary heap. The binary heap
+            is always used on 8-connected grids.
+
+        Yields
+        ------
+        list
+            (index, State) pairs of the cells changed by the step. They have
+            been applied to the grid already.
+
+        Returns
+        -------
+        SearchResult
+            Result of the search once the generator is exhausted.
+        """
+        grid: Grid = self.grid
+        states: bytearray = grid.states
+        weights: bytearray = grid.weights
+        rows, columns = grid.rows, grid.columns
+        offsets: tuple = grid.offsets
+        stats: SearchStats = self.stats
+        if self.__unreachable():
+            return self.__no_path()
+        start: int = self.start.index
+        end: int = self.end.index if self.end else -1
+        # Diagonal moves have irrational lengths which cannot be bucketed
+        bucket = bucket and not grid.diagonal
+
+        # Distance of each node to the starting node indexed by the node. The
+        # array is reused, every node has to be recorded in touched before its
+        # distance is set for the first time.
+        scratch: SearchScratch = grid.scratch()
+        dist: list = scratch.dist
+        touched: list = scratch.touched
+        # Dictionary with pairs of (node: previous_node)
         prev: dict = {}
         # Containing all yet to visit nodes.
-        queue: PriorityQueue = PriorityQueue()
-
-        # Init dicts and queue
-        dist[self.start] = 0
-        for row in self.grid:
-            for node in row:
-                if node != self.start:
-                    dist[node] = float('inf')
-                    prev[node] = None
-                
+        if stats is not None:
+            queue = stats.queue(bucket)
+        else:
+            queue = BucketQueue() if bucket else PriorityQueue()
+        expanded: int = 0
+        opened: int = 1
+
+        touched.append(start)
+        dist[start] = 0
         # Add the starting node to the queue with the distance as metric. In case of
-        # a tie the current time will be used as a tie breaker so that the least recently
-        # added element wins.
-        queue.put((dist[self.start], time.time(), self.start))
+        # a tie the least recently added element wins.
+        queue.push(start, dist[start])
 
-        while not queue.empty():
-            # Get element with minimum distance from the queue.
-            crrnt: Vertex = queue.get()[2]
+        try:
+            while not queue.empty():
+                events: list = []
+                # Get element with minimum distance from the queue.
+                crrnt: int = queue.pop()[0]
+                expanded += 1
+                if stats is not None:
+                    stats.expanded += 1
+                    stats.order.append(crrnt)
 
-            # Mark as visited
-            if crrnt != self.start and crrnt != self.end:
-                crrnt.set_closed()
+                # If the end is reached the shortest path has been found
+                if crrnt == end:
+                    break
 
-            # If the end is reached the shortest path has been found
-            if crrnt == self.end:
-                break
+                # Mark as visited
+                if crrnt != start:
+                    events.append((crrnt, State.CLOSED))
 
-            # Discover neighbors:
-            for neighbor in crrnt.get_neighbors(self).values():
+                # Discover neighbors:
+                row, col = divmod(crrnt, columns)
+                for d_row, d_col, offset, length in offsets:
+                    # Skip nodes outside of the grid and those that cannot be visited
+                    if not (0 <= row + d_row < rows and 0 <= col + d_col < columns):
+                        continue
+                    neighbor: int = crrnt + offset
+                    if states[neighbor] == BARRIER:
+                        continue
+                    if d_row and d_col and grid.corner_blocked(crrnt, d_row, d_col):
+                        continue
 
-                # Skip nodes that either cannot be visited or already have been visited
-                if neighbor.state == State.BARRIER or neighbor.state == State.CLOSED:
-                    continue
+                    # Check whether there's a faster path by comparing known
+                    # to newly discovered distances
+                    alt_dist = dist[crrnt] + weights[neighbor] * length
+                    if alt_dist < dist[neighbor]:
+                        if dist[neighbor] == INF:
+                            touched.append(neighbor)
+                        dist[neighbor] = alt_dist
+                        prev[neighbor] = crrnt
+                        if stats is not None:
+                            stats.relaxed += 1
+                        # Add newly discovered neighbor to the queue and mark it as open
+                        # or lower its priority if it has been discovered already.
+                        if neighbor in queue:
+                            queue.decrease_key(neighbor, alt_dist)
+                        else:
+                            queue.push(neighbor, alt_dist)
+                            opened += 1
+                            if neighbor != end and neighbor != start:
+                                events.append((neighbor, State.OPEN))
 
-                # Mark nodes as open
-                if neighbor != self.end and neighbor != self.start:
-                    neighbor.set_open()
+                grid.apply(events)
+                yield events
 
-                # Check whether there's a faster path by comparing known
-                # to newly discovered distances
-                alt_dist = dist[crrnt] + 1
-                if alt_dist < dist[neighbor]:
-                    dist[neighbor] = alt_dist
-                    prev[neighbor] = crrnt
-                    # Add newly discovered neighbor to the queue.
-                    queue.put((dist[neighbor], time.time(), neighbor))
+            self.paths = prev
+            # Without a destination all reachable nodes have been visited
+            if end < 0:
+                self.cache.put(start, prev)
+            result: SearchResult = self.__result(dist, expanded, opened)
+        finally:
+            scratch.release()
+        return result
+
+    def __dijkstra_wavefront(self, observer=None) -> SearchResult:
+        """
+        Dijkstra for unit edge costs by means of `pathfinder.wavefront`.
+        """
+        import numpy as np
+        from pathfinder.wavefront import wavefront
+
+        grid: Grid = self.grid
+        if grid.weighted or grid.diagonal:
+            raise ValueError("The wavefront engine requires unit weights and 4-connectivity")
+        if self.__unreachable():
+            return self.__no_path()
+        start: int = self.start.index
+        end: int = self.end.index if self.end else -1
+        dist, prev = wavefront(grid, start, end)
+
+        reached = np.flatnonzero(dist > 0)
+        self.paths = dict(zip(reached.tolist(), prev[reached].tolist()))
+        if end < 0:
+            self.cache.put(start, self.paths)
+        # Mark all reached nodes as visited
+        states = np.frombuffer(grid.states, dtype=np.uint8)
+        states[reached] = State.CLOSED.value
+        states[start] = State.START.value
+        if end >= 0:
+            states[end] = State.END.value
+        grid.invalidate()
+        if observer is not None:
+            observer()
 
-            # Redraw the grid
-            gui.draw()
+        distances: dict = {}
+        if end >= 0:
+            distances[end] = int(dist[end]) if dist[end] >= 0 else float('inf')
+        return self.__result(distances, reached.size + 1, reached.size + 1)
 
-        self.paths = prev
+    def shortest_path(self, start: Vertex, end: Vertex) -> SearchResult:
+        """
+        Answers a shortest path query from the cache of shortest path trees.
+        If no up to date tree of the start is cached it is computed with the
+        wavefront engine and cached, later queries from the same start are
+        answered in O(path length). Neither the grid's states nor `paths`
+        are changed. On weighted or 8-connected grids the tree has to be
+        cached by running `dijkstra` without a destination first.
+
+        Parameters
+        ----------
+        start: Vertex
+            Source of the path.
+        end: Vertex
+            Destination of the path.
+
+        Returns
+        -------
+        SearchResult
+            Path and distance. The number of expanded nodes is 0 if the
+            query has been answered from the cache.
+        """
+        source: int = start.index
+        expanded: int = 0
+        if self.cache.get(source) is None:
+            if self.grid.weighted or self.grid.diagonal:
+                raise ValueError("No shortest path tree of the start is cached")
+            import numpy as np
+            from pathfinder.wavefront import wavefront
+
+            dist, prev = wavefront(self.grid, source)
+            reached = np.flatnonzero(dist > 0)
+            self.cache.put(source, dict(zip(reached.tolist(), prev[reached].tolist())))
+            expanded = reached.size + 1
+
+        path: list = self.cache.path(source, end.index)
+        if path is None:
+            # The tree exceeds the cache's bound
+            path = []
+        if not path:
+            return SearchResult([], float('inf'), expanded, expanded)
+        return SearchResult(
+            [self.grid.position(node) for node in path], len(path) - 1, expanded, expanded
+        )
+
+    def a_star(self, observer=None, landmarks: int = 0, epsilon: float = 1.0) -> SearchResult:
+        """
+        Finds the shortest path between the start and the destination guided by
+        a heuristic estimating the remaining distance to the destination.
+
+        observer: callable
+            Optional callback invoked after every expanded node, e.g. for
+            redrawing the window.
+        landmarks: int
+            Number of landmarks of the ALT heuristic, 0 to only use the
+            manhattan or octile distance. See `pathfinder.alt.Landmarks`.
+        epsilon: float
+            Factor the heuristic is inflated by (Weighted A*). Values above 1
+            trade the length of the path, which is at most epsilon times the
+            shortest one, for fewer expanded nodes. The factor is returned as
+            the bound of the result.
+        """
+        return self.run(self.a_star_steps(landmarks, epsilon), observer, self.stats)
+
+    def a_star_steps(self, landmarks: int = 0, epsilon: float = 1.0):
+        """
+        Generator version of `a_star` which expands one node per step.
+
+        Parameters
+        ----------
+        landmarks: int
+            Number of landmarks of the ALT heuristic. The distance table is
+            computed by the first search and kept until the grid changes.
+        epsilon: float
+            Factor the heuristic is inflated by, at least 1.
+
+        Yields
+        ------
+        list
+            (index, State) pairs of the cells changed by the step. They have
+            been applied to the grid already.
+
+        Returns
+        -------
+        SearchResult
+            Result of the search once the generator is exhausted.
+        """
+        if epsilon < 1:
+            raise ValueError("epsilon must be at least 1, got {}".format(epsilon))
+        if self.__unreachable():
+            return self.__no_path()
+        grid: Grid = self.grid
+        states: bytearray = grid.states
+        weights: bytearray = grid.weights
+        rows, columns = grid.rows, grid.columns
+        offsets: tuple = grid.offsets
+        stats: SearchStats = self.stats
+        start: int = self.start.index
+        end: int = self.end.index
+        heuristic = self.__heuristic(landmarks)
 
-    def a_star(self, gui):
         # Open priority queue
-        open_queue: PriorityQueue = PriorityQueue()
+        open_queue: PriorityQueue = PriorityQueue() if stats is None else stats.queue()
 
         # Dict containing shortest path
         prev: dict = {}
+        expanded: int = 0
+        opened: int = 1
 
         # For node n, gScore[n] is the cost of the cheapest path from start to n currently known.
-        gScore: dict = {node: float('inf') for rows in self.grid for node in rows}
-        gScore[self.start] = 0
-
-        # For node n, fScore[n] := gScore[n] + h(n). fScore[n] represents our current best guess as to
-        # how short a path from start to finish can be if it goes through n.
-        fScore: dict = gScore.copy()
-        fScore[self.start] = self.__manhattan_distance(self.start)
-
-        # Add source node to the queue
-        open_queue.put((fScore[self.start], time.time(), self.start))
-
-        while not open_queue.empty():
-            # Pop node with lowest f-score and explore its neighbors
-            current: Vertex = open_queue.get()[2]
-            # If the destination has been reached the shortest path has been found
-            if current == self.end:
+        # The array is reused like the one of `dijkstra_steps`.
+        scratch: SearchScratch = grid.scratch()
+        gScore: list = scratch.dist
+        touched: list = scratch.touched
+        touched.append(start)
+        gScore[start] = 0
+
+        # Add source node to the queue with its f-score gScore[n] + h(n), the
+        # current best guess of how short a path from start to finish can be
+        # if it goes through n. Among nodes with the same f-score the one
+        # closest to the destination is expanded first, otherwise whole
+        # plateaus of equal f-scores are expanded on open grids.
+        estimate = heuristic(start)
+        open_queue.push(start, (epsilon * estimate, estimate))
+
+        try:
+            while not open_queue.empty():
+                events: list = []
+                # Pop node with lowest f-score and explore its neighbors
+                current: int = open_queue.pop()[0]
+                expanded += 1
+                if stats is not None:
+                    stats.expanded += 1
+                    stats.order.append(current)
+                # If the destination has been reached the shortest path, or one at
+                # most epsilon times as long, has been found
+                if current == end:
+                    break
+
+                # Explore the current node's neighbors
+                row, col = divmod(current, columns)
+                for d_row, d_col, offset, length in offsets:
+                    if not (0 <= row + d_row < rows and 0 <= col + d_col < columns):
+                        continue
+                    neighbor: int = current + offset
+                    # Barrierer nodes are not visitable and therefore cannot be considered
+                    # for the shortest path
+                    if states[neighbor] == BARRIER:
+                        continue
+                    if d_row and d_col and grid.corner_blocked(current, d_row, d_col):
+                        continue
+                    # Moving onto the neighbor costs its weight times the length of the move
+                    alt_dist = gScore[current] + weights[neighbor] * length
+
+                    # Update the g score if the distance via the neighbor is lower than previously known
+                    if alt_dist < gScore[neighbor]:
+                        if gScore[neighbor] == INF:
+                            touched.append(neighbor)
+                        prev[neighbor] = current
+                        gScore[neighbor] = alt_dist
+                        if stats is not None:
+                            stats.relaxed += 1
+                        estimate = heuristic(neighbor)
+                        priority: tuple = (alt_dist + epsilon * estimate, estimate)
+
+                        # If the node is not already in the queue add it for consideration in the
+                        # following iterations, otherwise move it up in the queue.
+                        if neighbor in open_queue:
+                            open_queue.decrease_key(neighbor, priority)
+                        else:
+                            open_queue.push(neighbor, priority)
+                            opened += 1
+                            # Set the neighbor as open
+                            if neighbor != end and neighbor != start:
+                                events.append((neighbor, State.OPEN))
+                # Mark the current node as closed however it might be re-opened later on
+                if current != start:
+                    events.append((current, State.CLOSED))
+
+                grid.apply(events)
+                yield events
+            self.paths = prev
+            result: SearchResult = self.__result(gScore, expanded, opened, epsilon)
+        finally:
+            scratch.release()
+        return result
+
+    def __heuristic(self, landmarks: int = 0):
+        """
+        Returns the heuristic of A* estimating the distance from a node to the
+        destination, which never overestimates and is consistent.
+
+        Parameters
+        ----------
+        landmarks: int
+            Number of landmarks of the ALT heuristic, 0 to only use the
+            manhattan or octile distance.
+        """
+        grid: Grid = self.grid
+        end: int = self.end.index
+        # Every step costs at least the smallest weight, scaling the manhattan
+        # or octile distance by it keeps it from overestimating on weighted grids.
+        scale: int = grid.min_weight()
+        if landmarks:
+            # The better of both lower bounds is still a lower bound
+            bound = self.__landmarks(landmarks).heuristic(end)
+            return lambda node: max(scale * grid.distance(node, end), bound(node))
+        return lambda node: scale * grid.distance(node, end)
+
+    def __landmarks(self, count: int) -> Landmarks:
+        """Returns the up to date distance table of the given number of landmarks."""
+        if (
+            self.landmarks is None or self.landmarks.grid is not self.grid
+            or self.landmarks.version != self.grid.version
+            or self.landmarks.count != count
+        ):
+            self.landmarks = Landmarks(self.grid, count)
+        return self.landmarks
+
+    def ara_star(self, observer=None, epsilon: float = 3.0, decrease: float = 0.5,
+                 time_limit: float = None, max_expanded: int = None, landmarks: int = 0) -> SearchResult:
+        """
+        Finds a path between the start and the destination with Anytime
+        Repairing A* (ARA*) within a time or expansion budget. A first path
+        at most epsilon times as long as the shortest one is found quickly
+        and improved while the budget lasts, see `pathfinder.ara.AnytimeAStar`.
+        The `bound` of the result tells how much longer than the shortest
+        path the returned one may be.
+
+        observer: callable
+            Optional callback invoked after every improved path.
+        epsilon: float
+            Inflation factor of the heuristic of the first search.
+        decrease: float
+            Amount the factor is lowered by after each search.
+        time_limit: float
+            Optional number of seconds after which the search stops.
+        max_expanded: int
+            Optional number of expanded nodes after which the search stops.
+        landmarks: int
+            Number of landmarks of the ALT heuristic, see `a_star`.
+        """
+        result: SearchResult = None
+        for result in self.ara_star_solutions(epsilon, decrease, time_limit, max_expanded, landmarks):
+            if observer is not None:
+                observer()
+        return result
+
+    def ara_star_solutions(self, epsilon: float = 3.0, decrease: float = 0.5, time_limit: float = None,
+                           max_expanded: int = None, landmarks: int = 0):
+        """
+        Generator version of `ara_star` which yields the best path after every
+        search, and once more with the final statistics if the budget runs out
+        during a search, so that a caller can use a path as soon as it is good
+        enough. The expanded cells are marked as closed. Parameters as for
+        `ara_star`.
+
+        Yields
+        ------
+        SearchResult
+            Path, distance, bound and expansion statistics of all searches so
+            far. If the budget runs out before the first path is found, a
+            single result without a path and with an infinite bound is
+            yielded. Proven unreachable destinations have a bound of 1.
+        """
+        if self.__unreachable():
+            yield self.__no_path()
+            return
+        start: int = self.start.index
+        end: int = self.end.index
+        planner: AnytimeAStar = AnytimeAStar(
+            self.grid, start, end, self.__heuristic(landmarks), epsilon, decrease
+        )
+        deadline: float = None if time_limit is None else time.perf_counter() + time_limit
+        marked: int = 0
+        found: bool = False
+        for _ in planner.solutions(deadline, max_expanded):
+            found = True
+            yield self.__anytime_result(planner, marked)
+            marked = len(planner.order)
+        if not found or marked < len(planner.order):
+            yield self.__anytime_result(planner, marked)
+
+    def __anytime_result(self, planner: AnytimeAStar, marked: int) -> SearchResult:
+        """
+        Marks the cells expanded by an anytime planner since the last result
+        as closed and returns the best path it has found.
+        """
+        start: int = planner.start
+        end: int = planner.end
+        expanded: list = planner.order[marked:]
+        if self.stats is not None:
+            self.stats.expanded += len(expanded)
+            self.stats.order += expanded
+        self.grid.apply([
+            (node, State.CLOSED) for node in expanded
+            if node != start and node != end
+        ])
+        path: list = planner.path()
+        self.paths = dict(zip(path[1:], path))
+        return SearchResult(
+            [self.grid.position(node) for node in path], planner.distance,
+            planner.expanded, planner.opened, planner.bound
+        )
+
+    def bidirectional_dijkstra(self, observer=None) -> SearchResult:
+        """
+        Finds the shortest path between the start and the destination by
+        growing one search from each of them until they meet.
+
+        observer: callable
+            Optional callback invoked after every expanded node.
+        """
+        return self.run(self.bidirectional_steps(False), observer, self.stats)
+
+    def bidirectional_a_star(self, observer=None) -> SearchResult:
+        """
+        Bidirectional variant of A* where the forward search is guided towards
+        the destination and the backward search towards the start.
+
+        observer: callable
+            Optional callback invoked after every expanded node.
+        """
+        return self.run(self.bidirectional_steps(True), observer, self.stats)
+
+    def bidirectional_steps(self, guided: bool):
+        """
+        Runs a forward search from the start and a backward search from the
+        destination, always expanding the side with fewer open nodes.
+
+        Every node at which both searches meet yields a candidate path. The
+        search stops once no open node can lead to a shorter one: for Dijkstra
+        this is the case once the smallest distances of both queues add up to
+        the best candidate and for A* with its consistent heuristic, the
+        manhattan or octile distance scaled by the smallest weight, once the
+        smallest key of either queue reaches it.
+
+        Parameters
+        ----------
+        guided: bool
+            Whether to use a heuristic (A*) or not (Dijkstra).
+
+        Yields
+        ------
+        list
+            (index, State) pairs of the cells changed by expanding one node.
+
+        Returns
+        -------
+        SearchResult
+            Result of the search once the generator is exhausted.
+        """
+        if self.__unreachable():
+            return self.__no_path()
+        grid: Grid = self.grid
+        states: bytearray = grid.states
+        weights: bytearray = grid.weights
+        rows, columns = grid.rows, grid.columns
+        offsets: tuple = grid.offsets
+        start: int = self.start.index
+        end: int = self.end.index
+        targets: tuple = (end, start)
+        scale: int = grid.min_weight()
+
+        # Distances, predecessors, closed sets and queues of the forward (0)
+        # and the backward (1) search.
+        dists: tuple = ({start: 0}, {end: 0})
+        prevs: tuple = ({}, {})
+        closed: tuple = (set(), set())
+        queues: tuple = (PriorityQueue(), PriorityQueue())
+
+        def heuristic(node: int, side: int) -> float:
+            if not guided:
+                return 0
+            return scale * grid.distance(node, targets[side])
+
+        queues[0].push(start, heuristic(start, 0))
+        queues[1].push(end, heuristic(end, 1))
+        expanded: int = 0
+        opened: int = 2
+        # Length of the shortest path found so far and the node it goes through
+        best: float = float('inf')
+        meeting: int = -1
+
+        while not queues[0].empty() and not queues[1].empty():
+            top_forward = queues[0].peek()[1]
+            top_backward = queues[1].peek()[1]
+            if guided:
+                if top_forward >= best or top_backward >= best:
+                    break
+            elif top_forward + top_backward >= best:
                 break
-            
-            # Explore the current node's neighbors
-            for neighbor in current.get_neighbors(self).values():
-                # Barrierer nodes are not visitable and therefore cannot be considered
-                # for the shortest path
-                if neighbor.state == State.BARRIER:
-                    continue
-                # Since this is a grid like graph where all distances to neighbors are the
-                # same 1 is chosen as distance between the current and neighbor node
-                alt_dist = gScore[current] + 1
 
-                # Update the g score if the distance via the neighbor is lower than previously known
-                if alt_dist < gScore[neighbor]:
+            events: list = []
+            side: int = 0 if len(queues[0]) <= len(queues[1]) else 1
+            dist, prev, queue = dists[side], prevs[side], queues[side]
+            other_dist: dict = dists[1 - side]
+            current: int = queue.pop()[0]
+            closed[side].add(current)
+            expanded += 1
+            if current != start and current != end:
+                events.append((current, State.CLOSED))
+
+            row, col = divmod(current, columns)
+            for d_row, d_col, offset, length in offsets:
+                if not (0 <= row + d_row < rows and 0 <= col + d_col < columns):
+                    continue
+                neighbor: int = current + offset
+                if states[neighbor] == BARRIER or neighbor in closed[side]:
+                    continue
+                if d_row and d_col and grid.corner_blocked(current, d_row, d_col):
+                    continue
+                # The backward search follows the edges in reverse, an edge
+                # costs the weight of the cell it leads onto.
+                alt_dist = dist[current] + weights[current if side else neighbor] * length
+                if alt_dist < dist.get(neighbor, float('inf')):
+                    dist[neighbor] = alt_dist
                     prev[neighbor] = current
-                    gScore[neighbor] = alt_dist
-                    fScore[neighbor] = gScore[neighbor] + self.__euclidean_distance(neighbor)
-
-                    # If the node is not already in the queue add it for consideration in the
-                    # following iterations
-                    if not open_queue.is_element(neighbor, key=lambda x: x[2]):
-                        open_queue.put((fScore[neighbor], time.time(), neighbor))
-                        # Set the neighbor as open
-                        if neighbor != self.end and neighbor != self.start:
-                            neighbor.set_open()
-            # Mark the current node as closed however it might be re-opened later on
-            if current != self.start and current != self.end:
-                current.set_closed()
-                
-            gui.draw()
-        self.paths = prev
-
-    def __euclidean_distance(self, node: Vertex) -> float:
-        """
-        Calculates the euclidean distance between a given node and the graph's destination.
+                    priority = alt_dist + heuristic(neighbor, side)
+                    if neighbor in queue:
+                        queue.decrease_key(neighbor, priority)
+                    else:
+                        queue.push(neighbor, priority)
+                        opened += 1
+                        if neighbor != start and neighbor != end:
+                            events.append((neighbor, State.OPEN))
+                    # Both searches met at the neighbor
+                    if neighbor in other_dist and alt_dist + other_dist[neighbor] < best:
+                        best = alt_dist + other_dist[neighbor]
+                        meeting = neighbor
+
+            grid.apply(events)
+            yield events
+
+        # Join the forward predecessors with the reversed backward ones
+        self.paths = prevs[0]
+        if meeting >= 0:
+            node: int = meeting
+            while node != end:
+                self.paths[prevs[1][node]] = node
+                node = prevs[1][node]
+        return self.__result({end: best}, expanded, opened)
+
+    def replan(self, observer=None) -> SearchResult:
+        """
+        Finds the shortest path between the start and the destination with
+        Lifelong Planning A*. The planner is kept between calls so that after
+        barriers have been edited with `set_barrier` and `remove_barrier` or
+        the destination has been moved only the affected part of the previous
+        search is repaired. Moving the start requires a search from scratch.
+
+        The expanded cells are marked as closed. In the returned result
+        `opened` holds the number of cells whose lookahead distance had to be
+        updated, which includes the updates caused by the edits.
+
+        observer: callable
+            Optional callback invoked once the search is done.
+        """
+        start: int = self.start.index
+        end: int = self.end.index
+        if (
+            self.planner is None or self.planner.start != start or self.planner.grid is not self.grid
+            # Edits which bypassed the planner, e.g. a maze or direct state changes
+            or self.planner.version != self.grid.version
+            # A lighter cell may turn the heuristic inadmissible
+            or self.grid.min_weight() < self.planner.scale
+        ):
+            self.planner = LPAStar(self.grid, start, end)
+        elif self.planner.end != end:
+            self.planner.set_end(end)
+        # The planner catches up with the edits by the next computation
+        if self.__unreachable():
+            self.reset_discovered()
+            return self.__no_path()
+        distance: float = self.planner.compute()
+        path: list = self.planner.path()
+        if distance != INF and not path:
+            # States written directly leave no trace in the version, the
+            # planner only notices once its distances lead nowhere
+            self.planner = LPAStar(self.grid, start, end)
+            distance = self.planner.compute()
+            path = self.planner.path()
+
+        self.reset_discovered()
+        states: bytearray = self.grid.states
+        self.grid.apply([
+            (node, State.CLOSED) for node in self.planner.closed
+            if node != start and node != end and states[node] != BARRIER
+        ])
+        self.paths = dict(zip(path[1:], path))
+        if observer is not None:
+            observer()
+        return self.__result({end: distance}, self.planner.expanded, self.planner.updated)
+
+    def hpa_star(self, observer=None, cluster_size: int = 16) -> SearchResult:
+        """
+        Finds a path between the start and the destination with hierarchical
+        path finding A* (HPA*). The abstract graph of the clusters is built by
+        the first call and kept up to date by `set_barrier`, `remove_barrier`
+        and `set_weight`, so later queries only search the abstract graph and
+        the clusters of the start and the destination. The path is close to
+        but not always the shortest one.
+
+        observer: callable
+            Optional callback invoked once the search is done.
+        cluster_size: int
+            Number of rows and columns of a cluster.
+        """
+        if self.__unreachable():
+            return self.__no_path()
+        if (
+            self.hierarchy is None or self.hierarchy.grid is not self.grid
+            or self.hierarchy.version != self.grid.version
+            or self.hierarchy.cluster_size != cluster_size
+        ):
+            self.hierarchy = HierarchicalPlanner(self.grid, cluster_size)
+        start: int = self.start.index
+        end: int = self.end.index
+        distance, path = self.hierarchy.path(start, end)
+
+        self.paths = dict(zip(path[1:], path))
+        if observer is not None:
+            observer()
+        return self.__result({end: distance}, self.hierarchy.expanded, self.hierarchy.opened)
+
+    def flow_field(self, targets: list = None) -> FlowField:
+        """
+        Returns the flow field towards one or more targets, which is kept and
+        repaired by `set_barrier`, `remove_barrier` and `set_weight` until a
+        field towards other targets is requested.
 
         Parameters
         ----------
-        node: Vertex
+        targets: list
+            Target vertices, by default the destination.
 
         Returns
         -------
-        float
-            Euclidean distance between given and destination node.
+        FlowField
+            Distances and first moves of all vertices towards the closest target.
         """
-        return math.sqrt(
-            (node.x - self.end.x) ** 2 + (node.y - self.end.y) ** 2
-        )
+        if targets is None:
+            if self.end is None:
+                raise ValueError("No destination and no targets given")
+            targets = [self.end]
+        indices: tuple = tuple(v.index for v in targets)
+        if (
+            self.flow is None or self.flow.grid is not self.grid
+            or self.flow.version != self.grid.version or self.flow.targets != indices
+        ):
+            self.flow = FlowField(self.grid, indices)
+        return self.flow
+
+    def jump_point_search(self, observer=None) -> SearchResult:
+        """
+        Finds the shortest path between the start and the destination with
+        Jump Point Search. Paths have the same length as those found by A*
+        but only jump points, cells at which the path may turn, are expanded.
+        Weighted and 8-connected grids are not supported.
 
-    def __manhattan_distance(self, node: Vertex) -> int:
+        observer: callable
+            Optional callback invoked after every expanded jump point.
         """
-        Calculates the manhattan distance between a given node and the destination of
-        the current graph.
+        return self.run(self.jump_point_search_steps(), observer, self.stats)
+
+    def jump_point_search_steps(self):
+        """
+        Generator version of `jump_point_search` which expands one jump point
+        per step.
+
+        Yields
+        ------
+        list
+            (index, State) pairs of the cells changed by the step.
+
+        Returns
+        -------
+        SearchResult
+            Result of the search once the generator is exhausted.
+        """
+        if self.grid.weighted or self.grid.diagonal:
+            raise ValueError("Jump Point Search requires unit weights and 4-connectivity")
+        if self.__unreachable():
+            return self.__no_path()
+        start: int = self.start.index
+        end: int = self.end.index
+        jps: JumpPointSearch = JumpPointSearch(self.grid)
+        distance, prev = yield from jps.steps(start, end)
+
+        self.paths = jps.expand(prev)
+        # Make sure the cells between the jump points of the shortest path
+        # point along that path.
+        if distance != float('inf'):
+            node: int = end
+            path_prev: dict = {}
+            while node != start:
+                path_prev[node] = prev[node]
+                node = prev[node]
+            self.paths.update(jps.expand(path_prev))
+        return self.__result({end: distance}, jps.expanded, jps.opened)
+
+    @staticmethod
+    def run(steps, observer=None, stats: SearchStats = None):
+        """
+        Exhausts the steps of a solver or the maze generator.
 
         Parameters
         ----------
-        node: Vertex
+        steps: generator
+            Generator as returned by e.g. `dijkstra_steps`.
+        observer: callable
+            Optional callback invoked after every step.
+        stats: SearchStats
+            Optional instrumentation timing the steps as "search" and the
+            observer as "draw" phase and profiling the steps if requested.
 
         Returns
         -------
-        int
-            Distance between given node and the graph's destination node.
+        The value returned by the generator.
         """
-        return abs(node.x - self.end.x) + abs(node.y - self.end.y)
+        if stats is not None:
+            return Graph.__run_instrumented(steps, observer, stats)
+        while True:
+            try:
+                next(steps)
+            except StopIteration as stop:
+                return stop.value
+            if observer is not None:
+                observer()
+
+    @staticmethod
+    def __run_instrumented(steps, observer, stats: SearchStats):
+        """Version of `run` measuring the time spent in each phase."""
+        clock = time.perf_counter
+        profiler = stats.profiler
+        search: float = 0.0
+        draw: float = 0.0
+        try:
+            while True:
+                begin: float = clock()
+                if profiler is not None:
+                    profiler.enable()
+                try:
+                    next(steps)
+                except StopIteration as stop:
+                    return stop.value
+                finally:
+                    if profiler is not None:
+                        profiler.disable()
+                    search += clock() - begin
+                if observer is not None:
+                    begin = clock()
+                    observer()
+                    draw += clock() - begin
+        finally:
+            stats.add_time("search", search)
+            if observer is not None:
+                stats.add_time("draw", draw)
+
+    def __result(self, dist, expanded: int, opened: int, bound: float = 1.0) -> SearchResult:
+        """
+        Builds the result of a finished search from its distances, indexable
+        by node, and the predecessors stored in `self.paths`. The bound is the
+        suboptimality bound of the path, 1 for shortest paths.
+        """
+        if self.end is None or dist[self.end.index] == float('inf'):
+            return SearchResult([], float('inf'), expanded, opened)
+
+        start: int = self.start.index
+        current: int = self.end.index
+        path: list = [self.grid.position(current)]
+        while current != start:
+            current = self.paths[current]
+            path.append(self.grid.position(current))
+        path.reverse()
+        return SearchResult(path, dist[self.end.index], expanded, opened, bound)
 
     def mark_path(self, delete: bool):
         """
+        Marks the shortest path from the start to the destination found by
+        the last search.
+
         Parameters
         ----------
-        path: dict
-            Dictionary containing the shortest path to each cell.
-        graph: Graph
-            Graph object of the current graph.
-        """
-        current: Vertex = self.paths[self.end]
-        while current != self.start:
-            if delete:
-                current.set_closed()
-            else:
-                current.set_path()
+        delete: bool
+            Whether to unmark a previously marked path instead.
+        """
+        state: State = State.CLOSED if delete else State.PATH
+        start: int = self.start.index
+        current: int = self.paths[self.end.index]
+        while current != start:
+            self.grid.set_state(current, state)
             current = self.paths[current]
 
     def __set_all_barriers(self):
         """Marks all nodes in the grid as a barrier."""
-        for rows in self.grid:
-            for node in rows:
-                node.set_barrier()
+        self.grid.states[:] = bytes([BARRIER]) * self.grid.size
+        self.grid.invalidate()
 
-    def generate_maze(self, gui):
+    def generate_maze(self, observer=None, algorithm: str = "backtracker", seed: int = None):
         """
-        Iterative maze generator utilizing a LIFO queue for all unvisited cells.
+        Replaces the grid with a perfect maze, see `pathfinder.maze`.
 
         Parameters
         ----------
-        gui: GUI
-            GUI object used for updating the grid while the maze is being made.
+        observer: callable
+            Optional callback invoked after every carved cell, e.g. for
+            updating the window while the maze is being made.
+        algorithm: str
+            "backtracker", "kruskal" or "eller".
+        seed: int
+            Seed of the random numbers. The same seed always yields the same
+            maze of a given size and algorithm.
         """
+        if observer is None and self.stats is None:
+            # Nobody watches the steps, write the whole maze at once
+            grid: Grid = self.grid
+            grid.states[:] = maze.generate(grid.rows, grid.columns, algorithm, seed)
+            grid.invalidate()
+            self.__maze_done()
+            return
+        self.run(self.generate_maze_steps(algorithm, seed), observer, self.stats)
+
+    def generate_maze_steps(self, algorithm: str = "backtracker", seed: int = None):
+        """
+        Generator version of `generate_maze` which carves one cell or a few
+        per step.
+
+        Yields
+        ------
+        list
+            (index, State) pairs of the cells changed by the step.
+        """
+        grid: Grid = self.grid
         self.__set_all_barriers()
-        # LIFO queue for mananging nodes with unvisited neighbors
-        queue: LifoQueue = LifoQueue()
-        # Select top left as start node
-        start: Vertex = self.grid[0][0]
-        queue.put(start)
-        start.reset()
-        gui.draw()
-        # While there are still nodes in the queue with unvisited neighbors. 
-        # This assures that all nodes will reachable.
-        while not queue.empty():
-            # Pop the last recently added node
-            current: Vertex = queue.get()
-            # List of all neighbors not yet visited
-            neighbors = [node for node in current.get_neighbors(self, 2).values() if node.state == State.BARRIER] 
-            # If there are still unvisited neighbors push current node into the queue again
-            if neighbors:
-                queue.put(current)
-                # Select a random neighbor and remove wall between current and neighbor
-                neighbor: Vertex = random.choice(neighbors)
-                wall_pos = (
-                    (current.row + neighbor.row) // 2, (current.column + neighbor.column) // 2
-                )
-                # Determine wall between current and neighbor to connect both by removing the wall.
-                wall: Vertex = self.grid[wall_pos[0]][wall_pos[1]]
-                wall.reset()
-                # Mark neighbor as open and put it in the queue to discover its neighbors.
-                neighbor.reset()
-                queue.put(neighbor)
-                # Redraw the grid
-                gui.draw()
\ No newline at end of file
+        for carved in maze.carve(grid.states, grid.rows, grid.columns, algorithm, seed):
+            events: list = [(index, State.EMPTY) for index in carved]
+            grid.apply(events)
+            if self.stats is not None:
+                self.stats.carved += len(carved)
+            yield events
+        self.__maze_done()
+
+    def __maze_done(self):
+        """Invalidates everything derived from the grid after a maze has been carved."""
+        self.grid.version += 1
+        self.cache.clear()
+        self.planner = None
+        # Every carved cell has to be reachable from all others
+        if self.components is not None and self.index_components().count != 1:
+            raise RuntimeError("The maze is not connected")
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+import math
+from pathfinder.util.scratch import SearchScratch
+from pathfinder.util.state import State
+from pathfinder.vertex import Vertex
+
+# Largest traversal weight a cell can have.
+MAX_WEIGHT: int = 255
+
+# Length of a diagonal move.
+SQRT2: float = math.sqrt(2)
+
+# (d_row, d_col) of the up, down, left and right neighbors in the order the
+# solvers visit them, followed by the diagonal neighbors on 8-connected grids.
+ORTHOGONAL: tuple = ((-1, 0), (1, 0), (0, -1), (0, 1))
+DIAGONAL: tuple = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+BARRIER: int = State.BARRIER.value
+EMPTY: int = State.EMPTY.value
+
+# Translation table mapping the states of discovered cells to empty.
+DISCOVERED_TO_EMPTY: bytes = bytes(
+    EMPTY if value in (State.OPEN.value, State.CLOSED.value, State.PATH.value) else value
+    for value in range(256)
+)
+
+
+class Grid:
+    """
+    Compact storage for the cells of a graph. The state of every cell is
+    kept in a flat bytearray indexed by `row * columns + column` so that a
+    cell costs a single byte. Colours and pixel coordinates are derived on
+    demand and `Vertex` objects are only created as views when requested.
+
+    Every cell also has an integer traversal weight between 1 and
+    `MAX_WEIGHT`, stored in a second bytearray, which is the cost of moving
+    onto the cell. On 8-connected grids diagonal moves cost the weight times
+    the square root of 2.
+
+    Attributes
+    ----------
+    rows: int
+        Total number of rows.
+    columns: int
+        Total number of columns.
+    vertex_width: int
+        Width of square representing a vertex.
+    size: int
+        Total number of cells.
+    states: bytearray
+        Value of the state of each cell.
+    weights: bytearray
+        Traversal weight of each cell, 1 unless terrain has been painted.
+    dirty: set
+        Indices of the cells whose state changed since they were last drawn.
+    discovered: list
+        Indices of the cells whose state changed since discovered cells were
+        last cleared, possibly repeated, or None if states have been written
+        directly or too many changed to keep track of them.
+    redraw: bool
+        Whether the whole grid needs to be drawn again, e.g. after states
+        have been changed in bulk.
+    version: int
+        Counter increased whenever barriers or weights are edited.
+    connectivity: int
+        4 if only the orthogonal neighbors of a cell can be reached, 8 if the
+        diagonal ones can be reached as well.
+    corner_cutting: bool
+        Whether a diagonal move may pass a barrier at one of its corners. A
+        move between two barriers touching at their corners is never allowed.
+    offsets: tuple
+        (d_row, d_col, offset, length) of every possible move, where offset
+        is the difference of the indices of the two cells.
+    """
+
+    def __init__(self, rows: int, columns: int, vertex_width: int, connectivity: int = 4,
+                 corner_cutting: bool = False):
+        """
+        Parameters
+        ----------
+        rows: int
+            Total number of rows.
+        columns: int
+            Total number of columns.
+        vertex_width: int
+            Width of the square representing a vertex.
+        connectivity: int
+            4 or 8 neighbors per cell.
+        corner_cutting: bool
+            Whether diagonal moves may pass a barrier at one corner.
+        """
+        self.rows: int = rows
+        self.columns: int = columns
+        self.vertex_width: int = vertex_width
+        self.size: int = rows * columns
+        self.states: bytearray = bytearray([State.EMPTY.value]) * self.size
+        self.weights: bytearray = bytearray([1]) * self.size
+        self.dirty: set = set()
+        self.discovered: list = []
+        self.redraw: bool = True
+        self.version: int = 0
+        self.__scratch: SearchScratch = None
+        self.set_connectivity(connectivity, corner_cutting)
+
+    def set_connectivity(self, connectivity: int, corner_cutting: bool = False):
+        """
+        Chooses between 4 and 8 neighbors per cell and computes the offsets of
+        the possible moves.
+
+        Parameters
+        ----------
+        connectivity: int
+            4 or 8.
+        corner_cutting: bool
+            Whether diagonal moves may pass a barrier at one corner.
+        """
+        if connectivity not in (4, 8):
+            raise ValueError("Connectivity must be 4 or 8, got {}".format(connectivity))
+        self.connectivity: int = connectivity
+        self.corner_cutting: bool = corner_cutting
+        directions: tuple = ORTHOGONAL + DIAGONAL if connectivity == 8 else ORTHOGONAL
+        self.offsets: tuple = tuple(
+            (d_row, d_col, d_row * self.columns + d_col, SQRT2 if d_row and d_col else 1)
+            for d_row, d_col in directions
+        )
+
+    @property
+    def diagonal(self) -> bool:
+        """Whether diagonal moves are allowed."""
+        return self.connectivity == 8
+
+    def index(self, row: int, column: int) -> int:
+        """Returns the index of the cell in the given row and column."""
+        return row * self.columns + column
+
+    def position(self, index: int) -> tuple:
+        """Returns the row and column of the cell with the given index."""
+        return divmod(index, self.columns)
+
+    def get_state(self, index: int) -> State:
+        """Returns the state of the cell with the given index."""
+        return State(self.states[index])
+
+    def set_state(self, index: int, state: State):
+        """Sets the state of the cell with the given index and marks it as dirty."""
+        self.states[index] = state.value
+        self.dirty.add(index)
+        if self.discovered is not None:
+            self.discovered.append(index)
+
+    def get_weight(self, index: int) -> int:
+        """Returns the traversal weight of the cell with the given index."""
+        return self.weights[index]
+
+    def set_weight(self, index: int, weight: int):
+        """
+        Sets the traversal weight of the cell with the given index and marks
+        it as dirty.
+
+        Parameters
+        ----------
+        index: int
+            Index of the cell.
+        weight: int
+            Cost of moving onto the cell between 1 and `MAX_WEIGHT`.
+        """
+        if not 1 <= weight <= MAX_WEIGHT:
+            raise ValueError("Weight must be between 1 and {}, got {}".format(MAX_WEIGHT, weight))
+        self.weights[index] = weight
+        self.dirty.add(index)
+
+    @property
+    def weighted(self) -> bool:
+        """Whether any cell has a weight other than 1."""
+        return self.weights.count(1) != self.size
+
+    def min_weight(self) -> int:
+        """Returns the smallest weight of all cells, which scales the heuristics."""
+        weights: bytearray = self.weights
+        for weight in range(1, MAX_WEIGHT + 1):
+            if weight in weights:
+                return weight
+        return 1
+
+    def max_weight(self) -> int:
+        """Returns the largest weight of all cells."""
+        weights: bytearray = self.weights
+        for weight in range(MAX_WEIGHT, 0, -1):
+            if weight in weights:
+                return weight
+        return 1
+
+    def apply(self, events: list):
+        """
+        Applies a batch of state changes.
+
+        Parameters
+        ----------
+        events: list
+            (index, State) pairs as yielded by the steps of the solvers.
+        """
+        states: bytearray = self.states
+        dirty: set = self.dirty
+        discovered: list = self.discovered
+        for index, state in events:
+            states[index] = state.value
+            dirty.add(index)
+        if discovered is not None:
+            discovered.extend(index for index, _ in events)
+            # Beyond this a scan of all cells is cheaper than the list
+            if len(discovered) > self.size:
+                self.discovered = None
+
+    def clear_discovered(self):
+        """
+        Turns all open, closed and path cells back into empty ones. Only the
+        cells changed since the last call are visited, so the work is paid
+        for by the searches which discovered them, unless states have been
+        written directly in which case all cells are scanned.
+        """
+        states: bytearray = self.states
+        discovered: list = self.discovered
+        if discovered is None or len(discovered) > self.size // 8:
+            states[:] = states.translate(DISCOVERED_TO_EMPTY)
+            self.invalidate()
+        else:
+            table: bytes = DISCOVERED_TO_EMPTY
+            dirty: set = self.dirty
+            for index in discovered:
+                state: int = states[index]
+                if table[state] != state:
+                    states[index] = table[state]
+                    dirty.add(index)
+        self.discovered = []
+
+    def clear(self):
+        """
+        Turns all cells into empty ones of weight 1 in place, so that the
+        storage and the scratch arrays of the searches are reused.
+        """
+        self.states[:] = bytes([EMPTY]) * self.size
+        self.weights[:] = bytes([1]) * self.size
+        self.version += 1
+        self.invalidate()
+        self.discovered = []
+
+    def scratch(self) -> SearchScratch:
+        """
+        Returns the scratch arrays of a search, which have to be released by
+        it. Searches running while the arrays are busy get arrays of their own.
+        """
+        if self.__scratch is None:
+            self.__scratch = SearchScratch(self.size)
+        elif self.__scratch.busy:
+            return SearchScratch(self.size).acquire()
+        return self.__scratch.acquire()
+
+    def invalidate(self):
+        """
+        Requests the whole grid to be drawn again. Must be called after
+        writing to `states` directly.
+        """
+        self.redraw = True
+        self.dirty.clear()
+        self.discovered = None
+
+    def neighbors(self, index: int, dist: int = 1) -> list:
+        """
+        Returns the indices of the upper, lower, left and right neighbors of a
+        cell in that order, regardless of the connectivity.
+
+        Parameters
+        ----------
+        index: int
+            Index of the cell.
+        dist: int
+            Distance to choose which neighbors. 1 for direct neighbors, 2 for
+            neighbors of neighbors and so on.
+
+        Returns
+        -------
+        list
+            Indices of the neighbors within the grid.
+        """
+        row, col = divmod(index, self.columns)
+        neighbors: list = []
+        if row - dist >= 0:
+            neighbors.append(index - dist * self.columns)
+        if row + dist < self.rows:
+            neighbors.append(index + dist * self.columns)
+        if col - dist >= 0:
+            neighbors.append(index - dist)
+        if col + dist < self.columns:
+            neighbors.append(index + dist)
+        return neighbors
+
+    def adjacent(self, index: int) -> list:
+        """
+        Returns the indices of all cells next to a cell, i.e. the orthogonal
+        and on 8-connected grids also the diagonal neighbors, regardless of
+        barriers.
+        """
+        row, col = divmod(index, self.columns)
+        rows, columns = self.rows, self.columns
+        return [
+            index + offset for d_row, d_col, offset, _ in self.offsets
+            if 0 <= row + d_row < rows and 0 <= col + d_col < columns
+        ]
+
+    def moves(self, index: int) -> list:
+        """
+        Returns the cells which can be reached from a cell in a single move.
+        Moves are symmetric, so these are also the cells from which the cell
+        can be reached.
+
+        Parameters
+        ----------
+        index: int
+            Index of the cell.
+
+        Returns
+        -------
+        list
+            (neighbor, length) pairs of all neighbors which are not barriers
+            and, for diagonal moves, whose corners allow the move.
+        """
+        states: bytearray = self.states
+        row, col = divmod(index, self.columns)
+        moves: list = []
+        for d_row, d_col, offset, length in self.offsets:
+            n_row: int = row + d_row
+            n_col: int = col + d_col
+            if not (0 <= n_row < self.rows and 0 <= n_col < self.columns):
+                continue
+            neighbor: int = index + offset
+            if states[neighbor] == BARRIER:
+                continue
+            if d_row and d_col and self.corner_blocked(index, d_row, d_col):
+                continue
+            moves.append((neighbor, length))
+        return moves
+
+    def corner_blocked(self, index: int, d_row: int, d_col: int) -> bool:
+        """
+        Returns whether the barriers next to a diagonal move forbid it: one
+        barrier without corner cutting or two with it.
+        """
+        states: bytearray = self.states
+        vertical: bool = states[index + d_row * self.columns] == BARRIER
+        horizontal: bool = states[index + d_col] == BARRIER
+        if self.corner_cutting:
+            return vertical and horizontal
+        return vertical or horizontal
+
+    def distance(self, a: int, b: int) -> float:
+        """
+        Returns the length of the shortest path between two cells on an empty
+        grid with unit weights: the manhattan distance on 4-connected grids
+        and the octile distance on 8-connected ones.
+        """
+        columns: int = self.columns
+        d_row: int = abs(a // columns - b // columns)
+        d_col: int = abs(a % columns - b % columns)
+        if self.connectivity == 4:
+            return d_row + d_col
+        return max(d_row, d_col) + (SQRT2 - 1) * min(d_row, d_col)
+
+    def vertex(self, index: int) -> Vertex:
+        """Returns a vertex view of the cell with the given index."""
+        row, col = divmod(index, self.columns)
+        return Vertex(row, col, self.vertex_width, self, index)
+
+    def __getitem__(self, row: int):
+        if not 0 <= row < self.rows:
+            raise IndexError("row index out of range")
+        return GridRow(self, row)
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __iter__(self):
+        for row in range(self.rows):
+            yield GridRow(self, row)
+
+
+class GridRow:
+    """
+    View of a single row of a grid so that cells can be accessed via
+    `grid[row][column]`.
+    """
+
+    __slots__ = ("grid", "row")
+
+    def __init__(self, grid: Grid, row: int):
+        self.grid: Grid = grid
+        self.row: int = row
+
+    def __getitem__(self, column: int) -> Vertex:
+        if not 0 <= column < self.grid.columns:
+            raise IndexError("column index out of range")
+        return Vertex(
+            self.row, column, self.grid.vertex_width, self.grid,
+            self.row * self.grid.columns + column
+        )
+
+    def __len__(self) -> int:
+        return self.grid.columns
+
+    def __iter__(self):
+        for column in range(self.grid.columns):
+            yield self[column]
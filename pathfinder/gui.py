@@ -1,8 +1,32 @@
 #!/usr/bin/env python3
+import time
 import pygame
-from pathfinder.util.colour import Colour
+from pathfinder.alt import Landmarks
+from pathfinder.util.colour import Colour, STATE_COLOURS, heat, terrain
+from pathfinder.util.result import SearchResult
 from pathfinder.util.state import State
+from pathfinder.util.stats import SearchStats
 from pathfinder.graph import Graph
+from pathfinder.mapfile import load
+from pathfinder.viewport import Viewport
+from pathfinder.worker import BATCH_STEPS, SearchWorker
+
+# Upper bound of the steps advanced per frame. The time budget of a frame
+# usually ends a frame's steps much earlier.
+MAX_STEPS_PER_FRAME: int = 2 ** 20
+
+# Factor the zoom changes by per step of the mouse wheel.
+ZOOM_STEP: float = 1.25
+
+EMPTY: int = State.EMPTY.value
+
+# Direction the camera is moved in by the arrow keys as (x, y).
+PAN: dict = {
+    pygame.K_LEFT: (-1, 0),
+    pygame.K_RIGHT: (1, 0),
+    pygame.K_UP: (0, -1),
+    pygame.K_DOWN: (0, 1),
+}
 
 
 class GUI:
@@ -16,34 +40,68 @@ class GUI:
     columns: int
         Total number of columns starting at 0.
     width: int
-        Width of the window.
+        Width the window was requested with.
     vertex_width: int
         Width of cell representing a node in a graph.
     graph: Graph
         Containing all nodes of graph plus methods for managing the graph.
     win
         Main window.
+    viewport: Viewport
+        Part of the grid shown in the window. Grids with more columns than
+        the window has pixels are shown zoomed out.
+    fps: int
+        Targeted number of frames per second.
+    budget: float
+        Fraction of each frame which may be spent on advancing a running
+        solver or the maze generator.
+    steps_per_frame: int
+        Maximum number of steps advanced per frame, i.e. the animation speed.
+    paused: bool
+        Whether the running solver is paused.
+    steps: generator
+        Steps of the running maze generator, None if idle.
+    worker: SearchWorker
+        Solver running in the background, None if idle. Its events are
+        applied to the grid by the main loop.
+    heatmap: bool
+        Whether the solvers are instrumented and the closed cells are
+        coloured by the order in which they were expanded.
+    brush: int
+        Weight painted onto cells by the left mouse button, 0 for barriers.
     """
 
-    def __init__(self, rows: int, width: int):
+    def __init__(self, rows: int, width: int, columns: int = None):
         """
         Parameters
         ----------
         rows: int
-            Total number of rows. Since the window is a square the number of rows
-            equals the number of columns.
+            Total number of rows.
         width: int
             Width of the window used for calculating the width of the cells.
+            The height of the window follows from the number of rows. Grids
+            with more rows or columns than pixels are shrunk to fit.
+        columns: int
+            Total number of columns, by default the grid is square.
         """
         self.rows: int = rows
-        self.columns: int = rows
+        self.columns: int = rows if columns is None else columns
         self.width: int = width
-        self.vertex_width: int = round(width / rows)
-        self.graph: Graph = Graph(self.rows, self.vertex_width)
-
-        self.win = pygame.display.set_mode((width, width))
+        self.vertex_width: int = max(round(width / self.columns), 1)
+        self.graph: Graph = Graph(self.rows, self.vertex_width, columns=self.columns)
+        self.graph.index_components()
+        self.resize()
         pygame.display.set_caption("Pathfinder")
 
+        self.fps: int = 60
+        self.budget: float = 0.8
+        self.steps_per_frame: int = MAX_STEPS_PER_FRAME
+        self.paused: bool = False
+        self.steps = None
+        self.worker: SearchWorker = None
+        self.heatmap: bool = False
+        self.brush: int = 0
+
     def draw_grid(self):
         """
         Draws the grid lines.
@@ -53,34 +111,137 @@ class GUI:
                 self.win,
                 Colour.GREY,
                 (0, i * self.vertex_width),
-                (self.width, i * self.vertex_width)
+                (self.columns * self.vertex_width, i * self.vertex_width)
             )
             for j in range(self.columns):
                 pygame.draw.line(
                     self.win,
                     Colour.GREY,
                     (j * self.vertex_width, 0),
-                    (j * self.vertex_width, self.width)
+                    (j * self.vertex_width, self.rows * self.vertex_width)
                 )
 
+    def open_map(self, path: str):
+        """
+        Replaces the graph by a map loaded from a file and resizes the window
+        to fit it, see `pathfinder.mapfile.load` for the formats.
+
+        Parameters
+        ----------
+        path: str
+            Path of the map file.
+        """
+        self.stop()
+        graph: Graph = load(path)
+        self.rows, self.columns = graph.rows, graph.columns
+        self.vertex_width = max(round(self.width / self.columns), 1)
+        graph.vertex_width = graph.grid.vertex_width = self.vertex_width
+        graph.stats = self.graph.stats
+        graph.index_components()
+        self.graph = graph
+        self.resize()
+        self.graph.grid.invalidate()
+
+    def resize(self):
+        """
+        Sizes the window to show the whole grid, with cells of the vertex
+        width if the grid fits and shrunk below a pixel otherwise.
+        """
+        if self.width >= self.columns:
+            scale: float = self.vertex_width
+        else:
+            scale = self.width / max(self.rows, self.columns)
+        size: tuple = (max(round(self.columns * scale), 1), max(round(self.rows * scale), 1))
+        self.win = pygame.display.set_mode(size)
+        self.viewport: Viewport = Viewport(self.rows, self.columns, *size)
+
     def draw(self):
         """
-        Reponsible for drawing the cells and calling the draw_grid function
-        which draws the grid.
+        Reponsible for drawing the cells. Only cells whose state changed since
+        the last call are repainted and passed on to the display update unless
+        the whole grid has been invalidated. While zoomed out the window is
+        sampled again instead, which costs time in the number of pixels.
         """
-        self.win.fill(Colour.WHITE)
-        # Draw cells
-        for row in self.graph.grid:
-            for cell in row:
-                pygame.draw.rect(
-                    self.win,
-                    cell.colour,
-                    (cell.x, cell.y, self.vertex_width, self.vertex_width)
-                )
-        #self.draw_grid()
+        grid = self.graph.grid
+        if grid.redraw or grid.dirty and self.viewport.zoom < 1:
+            self.draw_all()
+            return
+        if not grid.dirty:
+            return
+
+        states: bytearray = grid.states
+        weights: bytearray = grid.weights
+        columns: int = grid.columns
+        first_row, end_row, first_col, end_col = self.viewport.visible()
+        rects: list = []
+        for index in grid.dirty:
+            row, col = divmod(index, columns)
+            if not (first_row <= row < end_row and first_col <= col < end_col):
+                continue
+            rect = pygame.Rect(self.viewport.cell_rect(row, col))
+            state: int = states[index]
+            if state == EMPTY and weights[index] != 1:
+                colour = terrain(weights[index])
+            else:
+                colour = STATE_COLOURS[state]
+            pygame.draw.rect(self.win, colour, rect)
+            rects.append(rect)
+        grid.dirty.clear()
+
+        pygame.display.update(rects)
+
+    def draw_all(self):
+        """
+        Draws every visible cell and updates the whole window.
+        """
+        grid = self.graph.grid
+        viewport: Viewport = self.viewport
+        if viewport.zoom < 1:
+            stats: SearchStats = self.graph.stats
+            order: list = stats.order if self.heatmap and stats is not None else None
+            self.win.blit(viewport.render(grid, order), (0, 0))
+        else:
+            self.win.fill(Colour.GREY)
+            # Draw cells
+            states: bytearray = grid.states
+            weights: bytearray = grid.weights
+            first_row, end_row, first_col, end_col = viewport.visible()
+            for row in range(first_row, end_row):
+                for index in range(row * grid.columns + first_col, row * grid.columns + end_col):
+                    state: int = states[index]
+                    if state == EMPTY and weights[index] != 1:
+                        colour = terrain(weights[index])
+                    else:
+                        colour = STATE_COLOURS[state]
+                    pygame.draw.rect(self.win, colour, viewport.cell_rect(row, index - row * grid.columns))
+            #self.draw_grid()
+            if self.heatmap:
+                self.draw_heatmap()
+        grid.redraw = False
+        grid.dirty.clear()
 
         pygame.display.update()
 
+    def draw_heatmap(self):
+        """
+        Colours the closed cells by the order in which they were expanded by
+        the last instrumented search, from yellow for the first to purple for
+        the last one. The display is not updated.
+        """
+        stats: SearchStats = self.graph.stats
+        if stats is None or not stats.order:
+            return
+        states: bytearray = self.graph.grid.states
+        columns: int = self.graph.grid.columns
+        first_row, end_row, first_col, end_col = self.viewport.visible()
+        last: int = max(len(stats.order) - 1, 1)
+        for rank, index in enumerate(stats.order):
+            if states[index] != State.CLOSED.value:
+                continue
+            row, col = divmod(index, columns)
+            if first_row <= row < end_row and first_col <= col < end_col:
+                pygame.draw.rect(self.win, heat(rank / last), self.viewport.cell_rect(row, col))
+
     def handle_events(self) -> bool:
         """
         Responsible for handling all mouse and key events and calling
@@ -91,84 +252,321 @@ class GUI:
             if event.type == pygame.QUIT:
                 return False
 
+            # Editing the grid cancels a search running in the background
+            if self.worker is not None and event.type == pygame.MOUSEBUTTONDOWN and event.button in (1, 2, 3):
+                self.stop()
+                self.graph.reset_discovered()
+
+            # Manage key press events
+            if event.type == pygame.KEYDOWN:
+                self.handle_key(event.key)
+
+            # Zoom in or out around the mouse pointer
+            elif event.type == pygame.MOUSEWHEEL:
+                self.viewport.zoom_at(ZOOM_STEP ** event.y, pygame.mouse.get_pos())
+                self.graph.grid.redraw = True
+
+            # The grid may not be edited while a maze is generated
+            elif self.steps is not None:
+                continue
+
             # Left click
-            if pygame.mouse.get_pressed()[0]:
+            elif pygame.mouse.get_pressed()[0]:
                 # Determine clicked node
-                pos = pygame.mouse.get_pos()
-                row, col = self.get_click_pos(pos)
-                node = self.graph.grid[row][col]
+                cell = self.get_click_pos(pygame.mouse.get_pos())
+                if cell is None:
+                    continue
+                node = self.graph.grid[cell[0]][cell[1]]
 
                 # Set start node
                 if not self.graph.start and node != self.graph.end:
                     self.graph.set_start(node)
-                # Set barrier
-                elif node != self.graph.end and node != self.graph.start and not self.graph.paths:
-                    node.set_barrier()
+                # Set barrier or paint terrain
+                elif (
+                    node != self.graph.end and node != self.graph.start
+                    and node.state != State.BARRIER
+                    and (not self.graph.paths or self.graph.planner)
+                    and node.weight != self.brush
+                    ):
+                    if self.brush:
+                        self.graph.set_weight(node, self.brush)
+                    else:
+                        self.graph.set_barrier(node)
+                    # Repair the path planned incrementally
+                    if self.graph.planner and self.graph.start and self.graph.end:
+                        self.replan()
 
             elif pygame.mouse.get_pressed()[1]:
                 # Determine clicked node
-                pos = pygame.mouse.get_pos()
-                row, col = self.get_click_pos(pos)
-                node = self.graph.grid[row][col]
+                cell = self.get_click_pos(pygame.mouse.get_pos())
+                if cell is None:
+                    continue
+                node = self.graph.grid[cell[0]][cell[1]]
 
                 if not self.graph.end and node != self.graph.start and node.state != State.BARRIER:
                     self.graph.set_end(node)
                     # Check whether the shortest path needs to be redrawn
-                    if self.graph.paths:
+                    if self.graph.planner and self.graph.start:
+                        self.replan()
+                    elif node.index in self.graph.paths:
                         self.graph.mark_path(False)
+                    # Reuse the tree of an earlier Dijkstra run from the start
+                    elif self.graph.start and not self.graph.paths:
+                        tree: dict = self.graph.cache.get(self.graph.start.index)
+                        if tree and node.index in tree:
+                            self.graph.paths = tree
+                            self.graph.mark_path(False)
 
             # Right click
             elif pygame.mouse.get_pressed()[2]:
                 # Determine clicked node
-                pos = pygame.mouse.get_pos()
-                row, col = self.get_click_pos(pos)
-                node = self.graph.grid[row][col]
+                cell = self.get_click_pos(pygame.mouse.get_pos())
+                if cell is None:
+                    continue
+                node = self.graph.grid[cell[0]][cell[1]]
 
                 # Determine if node can be deleted/reseted
                 if (
                     node.state == State.END or 
-                    (not self.graph.paths and node.state == State.BARRIER) or
+                    ((not self.graph.paths or self.graph.planner) and node.state == State.BARRIER) or
                     (not self.graph.paths and node.state == State.START)
                     ):
+                    if node.state == State.BARRIER:
+                        self.graph.remove_barrier(node)
+                        if self.graph.planner and self.graph.start and self.graph.end:
+                            self.replan()
+                        continue
                     node.reset()
                     if node == self.graph.start:
                         self.graph.start = None
                     elif node == self.graph.end:
-                        if self.graph.paths:
+                        if node.index in self.graph.paths:
                             self.graph.mark_path(True)
                             node.set_closed()
                         self.graph.end = None
                 
-            # Manage key press events
-            elif event.type == pygame.KEYDOWN:
-                # Reset with ESC
-                if event.key == pygame.K_ESCAPE:
-                    self.graph.reset()
-                # Partly reset
-                elif event.key == pygame.K_c:
-                    self.graph.reset_discovered()
-                # Start A* algorithm
-                elif self.graph.start and self.graph.end and event.key == pygame.K_a:
-                    self.graph.a_star(self)
-                    if self.graph.end:
-                        self.graph.mark_path(False)
-                # Start Dijkstra algorithm
-                elif self.graph.start and event.key == pygame.K_d:
-                    self.graph.dijkstra(self)
-                    if self.graph.end:
-                        self.graph.mark_path(False)
-                # Generate maze
-                elif event.key == pygame.K_m:
-                    self.graph.reset()
-                    self.graph.generate_maze(self)
         return True
 
+    def handle_key(self, key: int):
+        """
+        Handles a key press.
+
+        Parameters
+        ----------
+        key: int
+            Pygame key code of the pressed key.
+        """
+        # Reset with ESC
+        if key == pygame.K_ESCAPE:
+            self.stop()
+            self.graph.reset()
+        # Partly reset
+        elif key == pygame.K_c:
+            self.stop()
+            self.graph.reset_discovered()
+        # Pan with the arrow keys while shift is held
+        elif key in PAN and pygame.key.get_mods() & pygame.KMOD_SHIFT:
+            d_x, d_y = PAN[key]
+            self.viewport.pan(d_x * self.viewport.width / 4, d_y * self.viewport.height / 4)
+            self.graph.grid.redraw = True
+        # Zoom in or out around the center or show the whole grid
+        elif key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_MINUS):
+            factor: float = ZOOM_STEP if key != pygame.K_MINUS else 1 / ZOOM_STEP
+            self.viewport.zoom_at(factor, (self.viewport.width / 2, self.viewport.height / 2))
+            self.graph.grid.redraw = True
+        elif key == pygame.K_f:
+            self.viewport.fit()
+            self.graph.grid.redraw = True
+        # Pause or resume the running solver
+        elif key == pygame.K_SPACE:
+            self.paused = not self.paused
+        # Advance a paused solver by a single step
+        elif key == pygame.K_RIGHT and self.paused:
+            self.advance(1)
+        # Change the animation speed
+        elif key == pygame.K_UP:
+            self.steps_per_frame = min(self.steps_per_frame * 2, MAX_STEPS_PER_FRAME)
+        elif key == pygame.K_DOWN:
+            self.steps_per_frame = max(self.steps_per_frame // 2, 1)
+        # Choose the weight painted by the left mouse button, 0 for barriers
+        elif pygame.K_0 <= key <= pygame.K_9:
+            self.brush = key - pygame.K_0
+        # Toggle the heat map of the expansion order
+        elif key == pygame.K_h:
+            self.heatmap = not self.heatmap
+            if self.heatmap and self.graph.stats is None:
+                self.graph.stats = SearchStats()
+            elif not self.heatmap:
+                self.graph.stats = None
+            self.graph.grid.invalidate()
+        # Nothing else may be started while a solver is running
+        elif self.steps is not None or self.worker is not None:
+            return
+        # Start A* algorithm
+        elif self.graph.start and self.graph.end and key == pygame.K_a:
+            self.search("a_star_steps")
+        # Start A* with the landmark heuristic
+        elif self.graph.start and self.graph.end and key == pygame.K_l:
+            self.search("a_star_steps", landmarks=8)
+        # Start bidirectional A* algorithm
+        elif self.graph.start and self.graph.end and key == pygame.K_b:
+            self.search("bidirectional_steps", True)
+        # Plan incrementally with Lifelong Planning A*
+        elif self.graph.start and self.graph.end and key == pygame.K_r:
+            self.replan()
+        # Start Jump Point Search
+        elif (
+            self.graph.start and self.graph.end and key == pygame.K_j
+            and not self.graph.grid.weighted and not self.graph.grid.diagonal
+        ):
+            self.search("jump_point_search_steps")
+        # Start Dijkstra algorithm
+        elif self.graph.start and key == pygame.K_d:
+            self.search("dijkstra_steps")
+        # Switch between 4 and 8 neighbors per node
+        elif key == pygame.K_n:
+            self.graph.reset_discovered()
+            self.graph.set_connectivity(12 - self.graph.connectivity, self.graph.corner_cutting)
+        # Generate maze
+        elif key == pygame.K_m:
+            self.graph.reset()
+            self.start(self.graph.generate_maze_steps())
+
+    def replan(self):
+        """
+        Repairs the shortest path with the graph's incremental planner and
+        marks it.
+        """
+        if self.graph.replan().found:
+            self.graph.mark_path(False)
+
+    def start(self, steps):
+        """
+        Schedules the steps of a solver or the maze generator to be advanced
+        by the main loop.
+
+        Parameters
+        ----------
+        steps: generator
+            Generator as returned by e.g. `Graph.generate_maze_steps`.
+        """
+        self.steps = steps
+        self.paused = False
+        if self.heatmap:
+            self.graph.stats.reset()
+
+    def search(self, solver: str, *args, **kwargs):
+        """
+        Starts a solver in a background worker on a snapshot of the graph,
+        so that the window keeps responding however long the search takes.
+
+        Parameters
+        ----------
+        solver: str
+            Name of the steps method of the graph, e.g. "a_star_steps".
+        args, kwargs
+            Arguments of the steps method.
+        """
+        self.paused = False
+        if self.heatmap:
+            self.graph.stats.reset()
+        batch: int = min(self.steps_per_frame, BATCH_STEPS)
+        self.worker = SearchWorker(self.graph, solver, *args, batch=batch, **kwargs)
+
+    def stop(self):
+        """Cancels the running solver."""
+        if self.steps is not None:
+            self.steps.close()
+        if self.worker is not None:
+            self.worker.cancel()
+        self.steps = None
+        self.worker = None
+        self.paused = False
+
+    def advance(self, max_steps: int):
+        """
+        Advances the running solver by as many steps as fit into the time
+        budget of a frame, but at most `max_steps`, or applies as many steps
+        of the background worker. Once the solver is done the shortest path
+        is marked.
+
+        Parameters
+        ----------
+        max_steps: int
+            Maximum number of steps to advance.
+        """
+        begin: float = time.perf_counter()
+        deadline: float = begin + self.budget / self.fps
+        if self.worker is not None:
+            self.receive(max_steps, deadline)
+            return
+        if self.steps is None:
+            return
+        try:
+            for _ in range(max_steps):
+                try:
+                    next(self.steps)
+                except StopIteration as stop:
+                    self.steps = None
+                    self.finish(stop.value)
+                    return
+                if time.perf_counter() >= deadline:
+                    return
+        finally:
+            if self.graph.stats is not None:
+                self.graph.stats.add_time("search", time.perf_counter() - begin)
+
+    def receive(self, max_steps: int, deadline: float):
+        """
+        Applies the events of the steps the background worker has done so
+        far, at most `max_steps`. Once it is done its paths, the tables it
+        built for the unchanged grid and its stats are taken over and the
+        shortest path is marked.
+        """
+        worker: SearchWorker = self.worker
+        worker.batch = min(max_steps, BATCH_STEPS)
+        self.graph.grid.apply(worker.poll(max_steps, deadline))
+        if not worker.done:
+            return
+        self.worker = None
+        snapshot: Graph = worker.snapshot
+        self.graph.paths = snapshot.paths
+        # Keep the tree of a complete Dijkstra run for later destinations
+        tree: dict = snapshot.cache.get(snapshot.start.index)
+        if tree is not None:
+            self.graph.cache.put(self.graph.start.index, tree)
+        # Keep the landmark table built by the search while the grid is unchanged
+        landmarks: Landmarks = snapshot.landmarks
+        if landmarks is not None and landmarks.version == self.graph.grid.version:
+            landmarks.grid = self.graph.grid
+            self.graph.landmarks = landmarks
+        if snapshot.stats is not None and self.graph.stats is not None:
+            self.graph.stats.merge(snapshot.stats)
+        self.finish(worker.result)
+
+    def finish(self, result):
+        """Marks the shortest path once the running solver is done."""
+        if isinstance(result, SearchResult) and result.found:
+            self.graph.mark_path(False)
+        if self.heatmap:
+            self.graph.grid.invalidate()
+
     def loop(self):
         """
-        Main loop of the window.
+        Main loop of the window. Each frame handles the pending events, advances
+        the running solver within the frame's time budget and redraws the
+        changed cells. With instrumentation enabled the time spent on both is
+        added to the "search" and "draw" timers of the graph's stats.
         """
+        clock = pygame.time.Clock()
         while self.handle_events():
+            if not self.paused:
+                self.advance(self.steps_per_frame)
+            begin: float = time.perf_counter()
             self.draw()
+            if self.graph.stats is not None:
+                self.graph.stats.add_time("draw", time.perf_counter() - begin)
+            clock.tick(self.fps)
         pygame.quit()
 
     def get_click_pos(self, pos: tuple) -> tuple:
@@ -183,9 +581,7 @@ class GUI:
         Returns
         -------
         tuple
-            containing the row and column of the selected cell.
+            containing the row and column of the selected cell, None if no
+            cell is shown at the position.
         """
-        x, y = pos
-        row = y // self.vertex_width
-        col = x // self.vertex_width
-        return (row, col)
\ No newline at end of file
+        return self.viewport.cell_at(pos)
\ No newline at end of file
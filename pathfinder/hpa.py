@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+from itertools import chain
+from pathfinder.grid import Grid
+from pathfinder.util.priority_queue import PriorityQueue
+from pathfinder.util.state import State
+
+BARRIER: int = State.BARRIER.value
+INF: float = float('inf')
+# Entrances of at least this many cells get a transition at both ends
+# instead of a single one in the middle.
+LONG_ENTRANCE: int = 6
+
+
+class HierarchicalPlanner:
+    """
+    Hierarchical path finding A* (HPA*) on a grid split into square clusters.
+
+    Along every border between two neighboring clusters each maximal run of
+    free cell pairs is an entrance, which gets one or two transitions. The
+    cells of the transitions are the nodes of an abstract graph. It is
+    connected by the moves across the borders and by the distances between
+    the nodes of the same cluster, which are precomputed by searches
+    confined to the cluster. A query inserts the start and the destination
+    into their clusters, searches the much smaller abstract graph and only
+    refines the abstract path into cells when it is needed, again with
+    searches confined to one cluster at a time.
+
+    The paths are not always the shortest ones since they have to pass the
+    transitions and, on 8-connected grids, cross borders orthogonally.
+
+    Attributes
+    ----------
+    grid: Grid
+        Grid to plan on.
+    cluster_size: int
+        Number of rows and columns of a cluster.
+    version: int
+        Version of the grid the abstract graph is up to date with.
+    nodes: dict
+        Pairs of (cluster: set of the indices of its abstract nodes).
+    intra: dict
+        Pairs of (node: dict of (node of the same cluster: distance)).
+    inter: dict
+        Pairs of (node: dict of (node of a neighboring cluster: cost)).
+    expanded: int
+        Number of nodes, abstract or cells, expanded since the counters were
+        last reset by `find`.
+    opened: int
+        Number of times a node was put into a queue since the counters were
+        last reset by `find`.
+    """
+
+    def __init__(self, grid: Grid, cluster_size: int = 16):
+        """
+        Parameters
+        ----------
+        grid: Grid
+            Grid to plan on.
+        cluster_size: int
+            Number of rows and columns of a cluster.
+        """
+        if cluster_size < 2:
+            raise ValueError("Clusters need at least 2 rows and columns")
+        self.grid: Grid = grid
+        self.cluster_size: int = cluster_size
+        self.version: int = grid.version
+        self.nodes: dict = {}
+        self.intra: dict = {}
+        self.inter: dict = {}
+        self.expanded: int = 0
+        self.opened: int = 0
+        self.__cluster_rows: int = -(-grid.rows // cluster_size)
+        self.__cluster_columns: int = -(-grid.columns // cluster_size)
+        # Pairs of ((cluster, down): transitions) of the border below or to
+        # the right of a cluster. Transitions are (cell, cell of the
+        # neighboring cluster) pairs.
+        self.__borders: dict = {}
+
+        clusters: range = range(self.__cluster_rows * self.__cluster_columns)
+        for cluster in clusters:
+            for border in ((cluster, False), (cluster, True)):
+                if self.__neighbor(*border) >= 0:
+                    self.__set_border(border)
+        for cluster in clusters:
+            self.__update_cluster(cluster)
+
+    def cluster(self, index: int) -> int:
+        """Returns the cluster containing a cell."""
+        row, col = self.grid.position(index)
+        return (row // self.cluster_size) * self.__cluster_columns + col // self.cluster_size
+
+    def __bounds(self, cluster: int) -> tuple:
+        """Returns the first and past the last row and column of a cluster."""
+        row, col = divmod(cluster, self.__cluster_columns)
+        size: int = self.cluster_size
+        return (
+            row * size, min((row + 1) * size, self.grid.rows),
+            col * size, min((col + 1) * size, self.grid.columns),
+        )
+
+    def __neighbor(self, cluster: int, down: bool) -> int:
+        """Returns the cluster below or to the right of a cluster or -1."""
+        row, col = divmod(cluster, self.__cluster_columns)
+        if down:
+            return cluster + self.__cluster_columns if row + 1 < self.__cluster_rows else -1
+        return cluster + 1 if col + 1 < self.__cluster_columns else -1
+
+    def __touching(self, cluster: int) -> list:
+        """Returns the keys of all existing borders of a cluster."""
+        borders: list = [
+            (cluster, down) for down in (False, True) if self.__neighbor(cluster, down) >= 0
+        ]
+        row, col = divmod(cluster, self.__cluster_columns)
+        if col > 0:
+            borders.append((cluster - 1, False))
+        if row > 0:
+            borders.append((cluster - self.__cluster_columns, True))
+        return borders
+
+    def __set_border(self, border: tuple):
+        """Recomputes the transitions of a border and their moves."""
+        grid: Grid = self.grid
+        states: bytearray = grid.states
+        weights: bytearray = grid.weights
+        for node, other in self.__borders.get(border, ()):
+            self.inter[node].pop(other, None)
+            self.inter[other].pop(node, None)
+
+        cluster, down = border
+        first_row, last_row, first_col, last_col = self.__bounds(cluster)
+        if down:
+            pairs: list = [
+                (grid.index(last_row - 1, col), grid.index(last_row, col))
+                for col in range(first_col, last_col)
+            ]
+        else:
+            pairs = [
+                (grid.index(row, last_col - 1), grid.index(row, last_col))
+                for row in range(first_row, last_row)
+            ]
+        transitions: list = []
+        entrance: list = []
+        # The sentinel closes the last entrance
+        for pair in pairs + [None]:
+            if pair is not None and states[pair[0]] != BARRIER and states[pair[1]] != BARRIER:
+                entrance.append(pair)
+                continue
+            if len(entrance) >= LONG_ENTRANCE:
+                transitions += (entrance[0], entrance[-1])
+            elif entrance:
+                transitions.append(entrance[len(entrance) // 2])
+            entrance = []
+
+        self.__borders[border] = transitions
+        for node, other in transitions:
+            # Moving onto a cell costs its weight
+            self.inter.setdefault(node, {})[other] = weights[other]
+            self.inter.setdefault(other, {})[node] = weights[node]
+
+    def __cluster_nodes(self, cluster: int) -> set:
+        """Returns the cells of a cluster used by the transitions of its borders."""
+        nodes: set = set()
+        for border in self.__touching(cluster):
+            side: int = 0 if border[0] == cluster else 1
+            nodes.update(transition[side] for transition in self.__borders[border])
+        return nodes
+
+    def __update_cluster(self, cluster: int):
+        """Recomputes the nodes of a cluster and the distances between them."""
+        nodes: set = self.__cluster_nodes(cluster)
+        for node in self.nodes.get(cluster, ()):
+            if node not in nodes:
+                del self.intra[node]
+                if not self.inter.get(node, True):
+                    del self.inter[node]
+        self.nodes[cluster] = nodes
+        for node in nodes:
+            dist: dict = self.__search(node, cluster, nodes)[0]
+            self.intra[node] = {
+                other: dist[other] for other in nodes if other != node and other in dist
+            }
+
+    def update_cell(self, index: int):
+        """
+        Notifies the planner that a cell became or stopped being a barrier or
+        that its weight changed. Only the borders and distances of its
+        cluster and the nodes of the neighboring clusters are recomputed.
+
+        Parameters
+        ----------
+        index: int
+            Index of the edited cell.
+        """
+        cluster: int = self.cluster(index)
+        borders: list = self.__touching(cluster)
+        for border in borders:
+            self.__set_border(border)
+        self.__update_cluster(cluster)
+        # The distances within the neighboring clusters stay the same unless
+        # they gained or lost a transition.
+        for border in borders:
+            other: int = border[0] if border[0] != cluster else self.__neighbor(*border)
+            if self.__cluster_nodes(other) != self.nodes[other]:
+                self.__update_cluster(other)
+        self.version = self.grid.version
+
+    def __search(self, source: int, cluster: int, targets: set,
+                 reverse: bool = False, goal: int = -1) -> tuple:
+        """
+        Dijkstra, or A* towards a goal, confined to the cells of a cluster.
+        The search stops once all targets have been expanded.
+
+        Parameters
+        ----------
+        source: int
+            Index of the cell to start at.
+        cluster: int
+            Cluster the search may not leave.
+        targets: set
+            Indices of the cells whose distances are needed.
+        reverse: bool
+            Whether to compute the distances from the targets to the source
+            instead, which differ on weighted grids.
+        goal: int
+            Index of a single target guiding the search or -1.
+
+        Returns
+        -------
+        tuple
+            (dist, prev) where dist contains pairs of (target: distance) of
+            the reachable targets and prev pairs of (cell: previous cell).
+        """
+        grid: Grid = self.grid
+        states: bytearray = grid.states
+        weights: bytearray = grid.weights
+        columns: int = grid.columns
+        offsets: tuple = grid.offsets
+        first_row, last_row, first_col, last_col = self.__bounds(cluster)
+        scale: int = grid.min_weight() if goal >= 0 else 0
+
+        dist: dict = {source: 0}
+        prev: dict = {}
+        closed: set = set()
+        remaining: set = set(targets)
+        queue: PriorityQueue = PriorityQueue()
+        queue.push(source, scale and scale * grid.distance(source, goal))
+        self.opened += 1
+        while remaining and not queue.empty():
+            current: int = queue.pop()[0]
+            closed.add(current)
+            remaining.discard(current)
+            self.expanded += 1
+            row, col = divmod(current, columns)
+            for d_row, d_col, offset, length in offsets:
+                if not (first_row <= row + d_row < last_row and first_col <= col + d_col < last_col):
+                    continue
+                neighbor: int = current + offset
+                if states[neighbor] == BARRIER or neighbor in closed:
+                    continue
+                if d_row and d_col and grid.corner_blocked(current, d_row, d_col):
+                    continue
+                # Backwards the move from the neighbor onto the current cell is paid
+                alt_dist = dist[current] + weights[current if reverse else neighbor] * length
+                if alt_dist < dist.get(neighbor, INF):
+                    dist[neighbor] = alt_dist
+                    prev[neighbor] = current
+                    priority = alt_dist + (scale and scale * grid.distance(neighbor, goal))
+                    if neighbor in queue:
+                        queue.decrease_key(neighbor, priority)
+                    else:
+                        queue.push(neighbor, priority)
+                        self.opened += 1
+        return {target: dist[target] for target in targets if target in closed}, prev
+
+    def find(self, start: int, end: int) -> tuple:
+        """
+        Searches the abstract graph for a path between two cells. The
+        counters are reset first and afterwards contain the work of the
+        insertion of both cells and the abstract search.
+
+        Parameters
+        ----------
+        start: int
+            Index of the starting cell.
+        end: int
+            Index of the destination.
+
+        Returns
+        -------
+        tuple
+            (distance, abstract path) where the abstract path contains the
+            start, the nodes passed and the destination. The distance is
+            infinite and the path empty if the destination cannot be reached.
+        """
+        self.expanded = 0
+        self.opened = 0
+        if start == end:
+            return 0, [start]
+        grid: Grid = self.grid
+        start_cluster: int = self.cluster(start)
+        end_cluster: int = self.cluster(end)
+
+        # Temporary edges of the start to the nodes of its cluster and of the
+        # nodes of the destination's cluster, or the start, to the destination
+        if start in self.intra:
+            start_edges: dict = {}
+        else:
+            start_edges = self.__search(start, start_cluster, self.nodes[start_cluster])[0]
+        goal_edges: dict = {}
+        if end not in self.intra or start_cluster == end_cluster:
+            sources: set = set(self.nodes[end_cluster])
+            if start_cluster == end_cluster:
+                sources.add(start)
+            goal_edges = self.__search(end, end_cluster, sources, reverse=True)[0]
+            goal_edges.pop(end, None)
+
+        scale: int = grid.min_weight()
+        g_score: dict = {start: 0}
+        prev: dict = {}
+        closed: set = set()
+        queue: PriorityQueue = PriorityQueue()
+        queue.push(start, scale * grid.distance(start, end))
+        self.opened += 1
+        while not queue.empty():
+            current: int = queue.pop()[0]
+            closed.add(current)
+            self.expanded += 1
+            if current == end:
+                break
+            edges = chain(
+                start_edges.items() if current == start else (),
+                self.intra.get(current, {}).items(),
+                self.inter.get(current, {}).items(),
+            )
+            if current in goal_edges:
+                edges = chain(edges, ((end, goal_edges[current]),))
+            for neighbor, cost in edges:
+                if neighbor in closed:
+                    continue
+                alt_dist = g_score[current] + cost
+                if alt_dist < g_score.get(neighbor, INF):
+                    g_score[neighbor] = alt_dist
+                    prev[neighbor] = current
+                    priority = alt_dist + scale * grid.distance(neighbor, end)
+                    if neighbor in queue:
+                        queue.decrease_key(neighbor, priority)
+                    else:
+                        queue.push(neighbor, priority)
+                        self.opened += 1
+
+        if end not in closed:
+            return INF, []
+        path: list = [end]
+        while path[-1] != start:
+            path.append(prev[path[-1]])
+        path.reverse()
+        return g_score[end], path
+
+    def refine(self, abstract: list):
+        """
+        Lazily turns an abstract path into cells. Each step between two nodes
+        of the same cluster is only searched once the cells before it have
+        been consumed.
+
+        Parameters
+        ----------
+        abstract: list
+            Abstract path as returned by `find`.
+
+        Yields
+        ------
+        int
+            Indices of the cells of the path from the start to the destination.
+        """
+        if not abstract:
+            return
+        yield abstract[0]
+        for node, target in zip(abstract, abstract[1:]):
+            cluster: int = self.cluster(node)
+            if cluster != self.cluster(target):
+                # Move across a border
+                yield target
+                continue
+            prev: dict = self.__search(node, cluster, {target}, goal=target)[1]
+            segment: list = [target]
+            while segment[-1] != node:
+                segment.append(prev[segment[-1]])
+            yield from reversed(segment[:-1])
+
+    def path(self, start: int, end: int) -> tuple:
+        """
+        Finds a path between two cells and refines it completely.
+
+        Returns
+        -------
+        tuple
+            (distance, path) where the path contains the indices of all cells
+            from the start to the destination.
+        """
+        distance, abstract = self.find(start, end)
+        return distance, list(self.refine(abstract))
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+from pathfinder.grid import Grid
+from pathfinder.util.priority_queue import PriorityQueue
+from pathfinder.util.state import State
+
+BARRIER: int = State.BARRIER.value
+
+
+class JumpPointSearch:
+    """
+    Jump Point Search for 4-connected grids with uniform edge costs.
+
+    Among all shortest paths only those moving vertically first and turning
+    from a horizontal into a vertical direction only when forced by a
+    barrier are considered. Straight runs of cells are therefore skipped by
+    jumping to the next cell at which the path may turn, so only these jump
+    points are put into the queue.
+
+    Attributes
+    ----------
+    grid: Grid
+        Grid to search.
+    expanded: int
+        Number of jump points expanded by the last search.
+    opened: int
+        Number of times a jump point was put into the queue by the last search.
+    """
+
+    def __init__(self, grid: Grid):
+        """
+        Parameters
+        ----------
+        grid: Grid
+            Grid to search.
+        """
+        self.grid: Grid = grid
+        self.expanded: int = 0
+        self.opened: int = 0
+        self.__end: int = -1
+
+    def __free(self, row: int, col: int) -> bool:
+        """Whether the cell exists and is not a barrier."""
+        grid: Grid = self.grid
+        return (
+            0 <= row < grid.rows and 0 <= col < grid.columns
+            and grid.states[row * grid.columns + col] != BARRIER
+        )
+
+    def __jump_horizontal(self, row: int, col: int, d_col: int) -> int:
+        """
+        Moves horizontally until a jump point is found, which is either the
+        destination or a cell with a forced vertical neighbor.
+
+        Returns
+        -------
+        int
+            Index of the jump point or -1 if a barrier or the border was hit.
+        """
+        free = self.__free
+        while True:
+            col += d_col
+            if not free(row, col):
+                return -1
+            index: int = row * self.grid.columns + col
+            if index == self.__end:
+                return index
+            # A vertical neighbor is forced if it cannot be reached by going
+            # vertically first because the cell behind it is a barrier.
+            if (
+                (free(row - 1, col) and not free(row - 1, col - d_col))
+                or (free(row + 1, col) and not free(row + 1, col - d_col))
+            ):
+                return index
+
+    def __jump_vertical(self, row: int, col: int, d_row: int) -> int:
+        """
+        Moves vertically until a jump point is found, which is either the
+        destination or a cell from which a horizontal jump finds a jump point.
+
+        Returns
+        -------
+        int
+            Index of the jump point or -1 if a barrier or the border was hit.
+        """
+        free = self.__free
+        while True:
+            row += d_row
+            if not free(row, col):
+                return -1
+            index: int = row * self.grid.columns + col
+            if index == self.__end:
+                return index
+            if self.__jump_horizontal(row, col, 1) >= 0 or self.__jump_horizontal(row, col, -1) >= 0:
+                return index
+
+    def __directions(self, node: int, parent: int) -> list:
+        """Returns the (d_row, d_col) directions to jump to from a node."""
+        if parent < 0:
+            return [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        row, col = self.grid.position(node)
+        p_row, p_col = self.grid.position(parent)
+        if p_col == col:
+            d_row: int = 1 if row > p_row else -1
+            return [(d_row, 0), (0, -1), (0, 1)]
+        d_col: int = 1 if col > p_col else -1
+        directions: list = [(0, d_col)]
+        for d_row in (-1, 1):
+            if self.__free(row + d_row, col) and not self.__free(row + d_row, col - d_col):
+                directions.append((d_row, 0))
+        return directions
+
+    def steps(self, start: int, end: int):
+        """
+        Finds the shortest path between two cells expanding one jump point
+        per step.
+
+        Parameters
+        ----------
+        start: int
+            Index of the starting cell.
+        end: int
+            Index of the destination.
+
+        Yields
+        ------
+        list
+            (index, State) pairs of the cells changed by the step.
+
+        Returns
+        -------
+        tuple
+            (distance, prev) where prev contains pairs of
+            (jump point: previous jump point). The distance is infinite if
+            the destination cannot be reached.
+        """
+        grid: Grid = self.grid
+        self.__end = end
+        self.expanded = 0
+        self.opened = 1
+
+        g_score: dict = {start: 0}
+        prev: dict = {}
+        closed: set = set()
+        end_row, end_col = grid.position(end)
+        queue: PriorityQueue = PriorityQueue()
+        queue.push(start, abs(start // grid.columns - end_row) + abs(start % grid.columns - end_col))
+
+        while not queue.empty():
+            events: list = []
+            current: int = queue.pop()[0]
+            closed.add(current)
+            self.expanded += 1
+            if current == end:
+                return g_score[end], prev
+            if current != start:
+                events.append((current, State.CLOSED))
+
+            row, col = grid.position(current)
+            for d_row, d_col in self.__directions(current, prev.get(current, -1)):
+                if d_row:
+                    jump_point: int = self.__jump_vertical(row, col, d_row)
+                else:
+                    jump_point = self.__jump_horizontal(row, col, d_col)
+                if jump_point < 0 or jump_point in closed:
+                    continue
+                j_row, j_col = grid.position(jump_point)
+                alt_dist: int = g_score[current] + abs(j_row - row) + abs(j_col - col)
+                if alt_dist < g_score.get(jump_point, float('inf')):
+                    g_score[jump_point] = alt_dist
+                    prev[jump_point] = current
+                    priority: int = alt_dist + abs(j_row - end_row) + abs(j_col - end_col)
+                    if jump_point in queue:
+                        queue.decrease_key(jump_point, priority)
+                    else:
+                        queue.push(jump_point, priority)
+                        self.opened += 1
+                        if jump_point != end:
+                            events.append((jump_point, State.OPEN))
+
+            grid.apply(events)
+            yield events
+
+        return float('inf'), prev
+
+    def expand(self, prev: dict) -> dict:
+        """
+        Fills in the cells between consecutive jump points so that the
+        returned predecessors link neighboring cells like those of the other
+        solvers.
+
+        Parameters
+        ----------
+        prev: dict
+            Pairs of (jump point: previous jump point).
+
+        Returns
+        -------
+        dict
+            Pairs of (cell: previous cell).
+        """
+        columns: int = self.grid.columns
+        paths: dict = {}
+        for node, parent in prev.items():
+            if node // columns == parent // columns:
+                step: int = 1 if node > parent else -1
+            else:
+                step = columns if node > parent else -columns
+            cell: int = node
+            while cell != parent:
+                paths[cell] = cell - step
+                cell -= step
+        return paths
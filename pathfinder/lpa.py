@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+from pathfinder.grid import Grid
+from pathfinder.util.priority_queue import PriorityQueue
+from pathfinder.util.state import State
+
+BARRIER: int = State.BARRIER.value
+INF: float = float('inf')
+# Factor slightly below 1 applied to heuristics with irrational values.
+SLACK: float = 1 - 1e-9
+
+
+class LPAStar:
+    """
+    Lifelong Planning A* for the shortest path between a fixed start and a
+    destination on a grid whose barriers change between searches.
+
+    Every cell keeps its distance g from the start and a one step lookahead
+    rhs based on the g values of its neighbors. Both are kept between
+    searches so that after an edit only the cells whose distance is affected
+    by it become inconsistent (g != rhs) and are searched again.
+
+    Attributes
+    ----------
+    grid: Grid
+        Grid to plan on.
+    start: int
+        Index of the starting cell. Moving the start invalidates all
+        distances, a new planner has to be created instead.
+    end: int
+        Index of the destination.
+    version: int
+        Version of the grid the planner is up to date with. Edits which do
+        not notify the planner through `update_cell` leave it outdated, a new
+        planner has to be created then.
+    scale: int
+        Smallest weight of the grid when the planner was created, scaling the
+        heuristic. Once a lighter cell exists a new planner has to be created.
+    g: dict
+        Pairs of (cell: distance from the start), infinite if missing.
+    rhs: dict
+        Pairs of (cell: lookahead distance from the start), infinite if missing.
+    expanded: int
+        Number of cells expanded by the last call of `compute`.
+    closed: list
+        Indices of the cells expanded by the last call of `compute`.
+    updated: int
+        Number of cells whose rhs value was recomputed by the last call of
+        `compute`, including the updates caused by the edits before it.
+    """
+
+    def __init__(self, grid: Grid, start: int, end: int):
+        """
+        Parameters
+        ----------
+        grid: Grid
+            Grid to plan on.
+        start: int
+            Index of the starting cell.
+        end: int
+            Index of the destination.
+        """
+        self.grid: Grid = grid
+        self.start: int = start
+        self.end: int = end
+        self.version: int = grid.version
+        self.scale: int = grid.min_weight()
+        self.g: dict = {}
+        self.rhs: dict = {start: 0}
+        self.queue: PriorityQueue = PriorityQueue()
+        self.expanded: int = 0
+        self.updated: int = 0
+        self.closed: list = []
+        self.__updates: int = 0
+        self.queue.push(start, self.__key(start))
+
+    def __heuristic(self, node: int) -> float:
+        """Manhattan or octile distance to the destination scaled by the smallest weight."""
+        if self.grid.diagonal:
+            # Keep the octile distance consistent despite rounding errors,
+            # otherwise cells could be left inconsistent in ties.
+            return self.scale * self.grid.distance(node, self.end) * SLACK
+        return self.scale * self.grid.distance(node, self.end)
+
+    def __key(self, node: int) -> tuple:
+        dist = min(self.g.get(node, INF), self.rhs.get(node, INF))
+        return (dist + self.__heuristic(node), dist)
+
+    def __update_vertex(self, node: int):
+        """Recomputes the rhs value of a cell and queues it if it is inconsistent."""
+        self.__updates += 1
+        if node != self.start:
+            if self.grid.states[node] == BARRIER:
+                best = INF
+            else:
+                g: dict = self.g
+                weight: int = self.grid.weights[node]
+                best = INF
+                # Barriers, which may keep an outdated distance until they are
+                # expanded, are not among the moves.
+                for neighbor, length in self.grid.moves(node):
+                    # Moving onto the cell costs its weight times the length of the move
+                    dist = g.get(neighbor, INF) + weight * length
+                    if dist < best:
+                        best = dist
+            if best == INF:
+                self.rhs.pop(node, None)
+            else:
+                self.rhs[node] = best
+        if self.g.get(node, INF) != self.rhs.get(node, INF):
+            self.queue.push(node, self.__key(node))
+        elif node in self.queue:
+            self.queue.remove(node)
+
+    def update_cell(self, node: int):
+        """
+        Notifies the planner that a cell became or stopped being a barrier or
+        that its weight changed.
+
+        Parameters
+        ----------
+        node: int
+            Index of the edited cell.
+        """
+        self.version = self.grid.version
+        # The neighbors of the cell include both ends of the diagonal moves
+        # passing its corners.
+        self.__update_vertex(node)
+        for neighbor in self.grid.adjacent(node):
+            self.__update_vertex(neighbor)
+
+    def set_end(self, end: int):
+        """
+        Moves the destination. The distances from the start remain valid, only
+        the keys of the queued cells have to be recomputed.
+        """
+        self.end = end
+        for node in list(self.queue.position):
+            self.queue.update(node, self.__key(node))
+
+    def compute(self) -> float:
+        """
+        Repairs the distances until the one of the destination is known.
+
+        Returns
+        -------
+        float
+            Distance between start and destination, infinite if unreachable.
+        """
+        g: dict = self.g
+        rhs: dict = self.rhs
+        queue: PriorityQueue = self.queue
+        end: int = self.end
+        self.expanded = 0
+        self.closed = []
+
+        while not queue.empty() and (
+            queue.peek()[1] < self.__key(end) or rhs.get(end, INF) != g.get(end, INF)
+        ):
+            node: int = queue.pop()[0]
+            self.expanded += 1
+            self.closed.append(node)
+            if g.get(node, INF) > rhs.get(node, INF):
+                # Overconsistent: the cell got closer to the start
+                g[node] = rhs[node]
+                for neighbor in self.grid.adjacent(node):
+                    self.__update_vertex(neighbor)
+            else:
+                # Underconsistent: the cell got further away from the start
+                g.pop(node, None)
+                self.__update_vertex(node)
+                for neighbor in self.grid.adjacent(node):
+                    self.__update_vertex(neighbor)
+
+        self.updated = self.__updates
+        self.__updates = 0
+        return g.get(end, INF)
+
+    def path(self) -> list:
+        """
+        Returns the indices of the cells of the shortest path from start to
+        destination by following the neighbors with the lowest distance,
+        empty if the destination is unreachable or the distances are outdated
+        so that a step would not get closer to the start.
+        """
+        g: dict = self.g
+        if g.get(self.end, INF) == INF:
+            return []
+        path: list = [self.end]
+        node: int = self.end
+        while node != self.start:
+            weight: int = self.grid.weights[node]
+            closest: int = min(
+                self.grid.moves(node), key=lambda move: g.get(move[0], INF) + weight * move[1],
+                default=(node, 0)
+            )[0]
+            if g.get(closest, INF) >= g[node]:
+                return []
+            node = closest
+            path.append(node)
+        path.reverse()
+        return path
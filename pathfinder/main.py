@@ -1,5 +1,9 @@
+import sys
 from pathfinder.gui import GUI
 
 if __name__ == "__main__":
     window = GUI(80, 800)
-    window.loop()
\ No newline at end of file
+    # Optionally open a map file given on the command line
+    if len(sys.argv) > 1:
+        window.open_map(sys.argv[1])
+    window.loop()
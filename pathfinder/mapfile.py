@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+import os
+import struct
+from pathfinder.graph import Graph
+from pathfinder.util.state import State
+
+BARRIER: int = State.BARRIER.value
+EMPTY: int = State.EMPTY.value
+
+# Characters of MovingAI maps which can be traversed. Every other character,
+# e.g. '@', 'O', 'T' and 'W', is a barrier.
+PASSABLE: bytes = b".GS"
+
+# Translation table mapping the characters of a MovingAI map to states.
+MAP_TO_STATE: bytes = bytes(EMPTY if value in PASSABLE else BARRIER for value in range(256))
+
+# Translation table mapping states to the characters of a MovingAI map.
+STATE_TO_MAP: bytes = bytes(ord("@") if value == BARRIER else ord(".") for value in range(256))
+
+# Pairs of (connectivity: type) of the header of MovingAI maps.
+MOVINGAI_TYPES: dict = {4: "tile", 8: "octile"}
+
+# Header of the binary format: magic, rows, columns, connectivity and
+# corner cutting. It is followed by one byte per cell holding 0 for a
+# barrier and its weight otherwise.
+MAGIC: bytes = b"PFGRID1\n"
+HEADER: struct.Struct = struct.Struct("<8sIIBB2x")
+
+# Translation tables between the cells of the binary format and the
+# states and weights of a grid.
+CELL_TO_STATE: bytes = bytes(BARRIER if value == 0 else EMPTY for value in range(256))
+CELL_TO_WEIGHT: bytes = bytes(1 if value == 0 else value for value in range(256))
+# Mask clearing the weights of barriers, see `save_binary`.
+STATE_TO_MASK: bytes = bytes(0 if value == BARRIER else 255 for value in range(256))
+
+
+def load(path: str, vertex_width: int = 1, **options) -> Graph:
+    """
+    Loads a map choosing the format by the file extension: ".map" for
+    MovingAI maps, ".png" for bitmaps and the binary format otherwise.
+
+    Parameters
+    ----------
+    path: str
+        Path of the map file.
+    vertex_width: int
+        Width of the square representing a vertex.
+    options
+        Further keyword arguments passed on to the loader.
+
+    Returns
+    -------
+    Graph
+        Graph without start and destination.
+    """
+    extension: str = os.path.splitext(path)[1].lower()
+    if extension == ".map":
+        return load_movingai(path, vertex_width, **options)
+    if extension == ".png":
+        return load_png(path, vertex_width, **options)
+    return load_binary(path, vertex_width, **options)
+
+
+def save(graph: Graph, path: str):
+    """
+    Saves the barriers and weights of a graph choosing the format by the
+    file extension like `load`.
+    """
+    extension: str = os.path.splitext(path)[1].lower()
+    if extension == ".map":
+        save_movingai(graph, path)
+    elif extension == ".png":
+        save_png(graph, path)
+    else:
+        save_binary(graph, path)
+
+
+def load_movingai(path: str, vertex_width: int = 1, connectivity: int = None,
+                  corner_cutting: bool = False) -> Graph:
+    """
+    Loads a map in the format of the MovingAI benchmarks, i.e. a header of
+    "type", "height" and "width" lines followed by "map" and one line of
+    characters per row.
+
+    Parameters
+    ----------
+    path: str
+        Path of the map file.
+    vertex_width: int
+        Width of the square representing a vertex.
+    connectivity: int
+        4 or 8 neighbors per cell. By default octile maps are 8-connected
+        and all other maps, e.g. tile maps, 4-connected.
+    corner_cutting: bool
+        Whether diagonal moves may pass a barrier at one corner. The
+        benchmarks forbid it.
+
+    Returns
+    -------
+    Graph
+        Graph without start and destination.
+    """
+    with open(path, "rb") as file:
+        header: dict = {}
+        for line in file:
+            line = line.strip()
+            if line == b"map":
+                break
+            key, _, value = line.partition(b" ")
+            header[key.decode()] = value.strip().decode()
+        else:
+            raise ValueError("{} has no map section".format(path))
+        lines: list = [line.rstrip(b"\r\n") for line in file]
+
+    try:
+        rows, columns = int(header["height"]), int(header["width"])
+    except (KeyError, ValueError):
+        raise ValueError("{} has no valid height and width".format(path))
+    lines = lines[:rows]
+    if len(lines) != rows or any(len(line) != columns for line in lines):
+        raise ValueError("{} does not contain {} rows of {} cells".format(path, rows, columns))
+    if connectivity is None:
+        connectivity = 8 if header.get("type") == MOVINGAI_TYPES[8] else 4
+
+    graph: Graph = Graph(rows, vertex_width, connectivity, corner_cutting, columns)
+    graph.grid.states[:] = b"".join(lines).translate(MAP_TO_STATE)
+    return graph
+
+
+def save_movingai(graph: Graph, path: str):
+    """
+    Saves the barriers of a graph as a MovingAI map, of type octile if
+    the graph is 8-connected and tile otherwise, so that `load_movingai`
+    restores the connectivity. Weights and corner cutting cannot be
+    represented in this format and are lost.
+    """
+    grid = graph.grid
+    cells: bytes = grid.states.translate(STATE_TO_MAP)
+    header: str = "type {}\nheight {}\nwidth {}\nmap\n".format(
+        MOVINGAI_TYPES[grid.connectivity], grid.rows, grid.columns
+    )
+    with open(path, "wb") as file:
+        file.write(header.encode())
+        for row in range(grid.rows):
+            file.write(cells[row * grid.columns:(row + 1) * grid.columns])
+            file.write(b"\n")
+
+
+def load_binary(path: str, vertex_width: int = 1) -> Graph:
+    """
+    Loads a map saved by `save_binary`. The cells are read straight into
+    the weights of the new grid and converted into states and weights by
+    two bulk translations, so no object is created per cell and even
+    multi-megacell maps open in milliseconds.
+
+    Parameters
+    ----------
+    path: str
+        Path of the map file.
+    vertex_width: int
+        Width of the square representing a vertex.
+
+    Returns
+    -------
+    Graph
+        Graph without start and destination.
+    """
+    with open(path, "rb") as file:
+        header: bytes = file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError("{} is not a grid file".format(path))
+        magic, rows, columns, connectivity, corner_cutting = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError("{} is not a grid file".format(path))
+        if os.fstat(file.fileno()).st_size != HEADER.size + rows * columns:
+            raise ValueError("{} does not contain {} cells".format(path, rows * columns))
+        graph: Graph = Graph(rows, vertex_width, connectivity, bool(corner_cutting), columns)
+        cells: bytearray = graph.grid.weights
+        if file.readinto(cells) != len(cells):
+            raise ValueError("{} does not contain {} cells".format(path, rows * columns))
+
+    graph.grid.states[:] = cells.translate(CELL_TO_STATE)
+    cells[:] = cells.translate(CELL_TO_WEIGHT)
+    return graph
+
+
+def save_binary(graph: Graph, path: str):
+    """
+    Saves the barriers, weights and connectivity of a graph in the compact
+    binary format read by `load_binary`.
+    """
+    grid = graph.grid
+    # The weights with those of the barriers cleared by a single bitwise and
+    # of the whole grid instead of a loop over the cells
+    mask: bytes = grid.states.translate(STATE_TO_MASK)
+    cells: bytes = (
+        int.from_bytes(grid.weights, "little") & int.from_bytes(mask, "little")
+    ).to_bytes(grid.size, "little")
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, grid.rows, grid.columns, grid.connectivity, grid.corner_cutting))
+        file.write(cells)
+
+
+def load_png(path: str, vertex_width: int = 1, connectivity: int = 4,
+             corner_cutting: bool = False, weights: bool = False,
+             threshold: int = 128) -> Graph:
+    """
+    Loads a bitmap with one pixel per cell. Requires pygame and NumPy.
+
+    Parameters
+    ----------
+    path: str
+        Path of the image.
+    vertex_width: int
+        Width of the square representing a vertex.
+    connectivity: int
+        4 or 8 neighbors per cell.
+    corner_cutting: bool
+        Whether diagonal moves may pass a barrier at one corner.
+    weights: bool
+        Whether to read weights as saved by `save_png`, i.e. black pixels
+        are barriers and the weight of every other pixel is 256 minus its
+        brightness. Otherwise pixels darker than the threshold are barriers.
+    threshold: int
+        Brightness from 0 to 255 below which a pixel is a barrier.
+
+    Returns
+    -------
+    Graph
+        Graph without start and destination.
+    """
+    import numpy as np
+    import pygame
+
+    surface = pygame.image.load(path)
+    columns, rows = surface.get_size()
+    pixels: np.ndarray = np.frombuffer(pygame.image.tostring(surface, "RGB"), dtype=np.uint8)
+    brightness: np.ndarray = (
+        pixels.reshape(-1, 3).astype(np.uint32) @ np.array([299, 587, 114], dtype=np.uint32) // 1000
+    ).astype(np.uint8)
+
+    graph: Graph = Graph(rows, vertex_width, connectivity, corner_cutting, columns)
+    if weights:
+        barriers: np.ndarray = brightness == 0
+        graph.grid.weights[:] = np.where(barriers, 1, 256 - brightness.astype(np.int32)).astype(np.uint8).tobytes()
+    else:
+        barriers = brightness < threshold
+    graph.grid.states[:] = np.where(barriers, BARRIER, EMPTY).astype(np.uint8).tobytes()
+    return graph
+
+
+def save_png(graph: Graph, path: str):
+    """
+    Saves a graph as a greyscale bitmap with one pixel per cell. Barriers
+    are black and every other cell has a brightness of 256 minus its
+    weight, i.e. unweighted cells are white. Requires pygame and NumPy.
+    """
+    import numpy as np
+    import pygame
+
+    grid = graph.grid
+    states: np.ndarray = np.frombuffer(grid.states, dtype=np.uint8)
+    weights: np.ndarray = np.frombuffer(grid.weights, dtype=np.uint8)
+    grey: np.ndarray = np.where(states == BARRIER, 0, 256 - weights.astype(np.int32)).astype(np.uint8)
+    surface = pygame.image.frombuffer(np.repeat(grey, 3).tobytes(), (grid.columns, grid.rows), "RGB")
+    pygame.image.save(surface, path)
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Maze engines working on the flat state array of a grid. Cells are the
+vertices at even rows and columns, the vertices between two of them are
+walls. Every engine carves a perfect maze, i.e. exactly one path connects
+any two cells, and draws all its random numbers from a `random.Random`, so
+the same size, algorithm and seed always yield the same maze.
+"""
+import random
+from pathfinder.util.state import State
+
+BARRIER: int = State.BARRIER.value
+EMPTY: int = State.EMPTY.value
+
+
+def backtracker(states: bytearray, rows: int, columns: int, rng: random.Random):
+    """
+    Recursive backtracker: walks to a random unvisited cell as long as there
+    is one and backs up otherwise. Makes long corridors with few branches.
+
+    Parameters
+    ----------
+    states: bytearray
+        States of the grid, all of them barriers.
+    rows: int
+        Number of rows of the grid.
+    columns: int
+        Number of columns of the grid.
+    rng: random.Random
+        Source of the random choices.
+
+    Yields
+    ------
+    list
+        Indices of the vertices carved by the step.
+    """
+    states[0] = EMPTY
+    yield [0]
+    # Cells with possibly unvisited neighbors, the last one is extended first
+    stack: list = [0]
+    while stack:
+        current: int = stack[-1]
+        row, col = divmod(current, columns)
+        # Unvisited cells two steps above, below, left and right
+        neighbors: list = []
+        if row >= 2 and states[current - 2 * columns] == BARRIER:
+            neighbors.append(current - 2 * columns)
+        if row + 2 < rows and states[current + 2 * columns] == BARRIER:
+            neighbors.append(current + 2 * columns)
+        if col >= 2 and states[current - 2] == BARRIER:
+            neighbors.append(current - 2)
+        if col + 2 < columns and states[current + 2] == BARRIER:
+            neighbors.append(current + 2)
+        if not neighbors:
+            stack.pop()
+            continue
+        neighbor: int = neighbors[rng.randrange(len(neighbors))]
+        # Remove the wall between both cells
+        wall: int = (current + neighbor) // 2
+        states[wall] = states[neighbor] = EMPTY
+        stack.append(neighbor)
+        yield [wall, neighbor]
+
+
+def kruskal(states: bytearray, rows: int, columns: int, rng: random.Random):
+    """
+    Randomized Kruskal: removes the walls in random order unless the cells
+    on both sides are connected already, which is tracked by union-find.
+    Makes many short dead ends. Parameters as for `backtracker`.
+    """
+    cells: list = [
+        row * columns + col for row in range(0, rows, 2) for col in range(0, columns, 2)
+    ]
+    for cell in cells:
+        states[cell] = EMPTY
+    yield cells
+
+    walls: list = [cell + 1 for cell in cells if cell % columns + 2 < columns]
+    walls += [cell + columns for cell in cells if cell // columns + 2 < rows]
+    rng.shuffle(walls)
+    # Union-find forest over the cells, walls are never looked up
+    parent: list = list(range(rows * columns))
+
+    def find(cell: int) -> int:
+        while parent[cell] != cell:
+            # Path halving
+            parent[cell] = parent[parent[cell]]
+            cell = parent[cell]
+        return cell
+
+    for wall in walls:
+        # Walls in cell rows separate horizontal neighbors, the others vertical ones
+        step: int = 1 if wall // columns % 2 == 0 else columns
+        a, b = find(wall - step), find(wall + step)
+        if a != b:
+            parent[a] = b
+            states[wall] = EMPTY
+            yield [wall]
+
+
+def eller_rows(rows: int, columns: int, rng: random.Random):
+    """
+    Eller's algorithm, which makes the maze one row at a time keeping only
+    the sets of the cells of the current row, i.e. O(columns) memory
+    however many rows are made.
+
+    The cells of a row are joined randomly with their right neighbor if
+    they are in different sets and every set is extended into the next row
+    at least once. In the last row all different sets are joined.
+
+    Parameters
+    ----------
+    rows: int
+        Number of rows of the maze.
+    columns: int
+        Number of columns of the maze.
+    rng: random.Random
+        Source of the random choices.
+
+    Yields
+    ------
+    bytearray
+        States of each row of the maze.
+    """
+    width: int = (columns + 1) // 2
+    height: int = (rows + 1) // 2
+    # Set of every cell of the current row, 0 if it has none yet
+    sets: list = [0] * width
+    # Cells of the current row in every set
+    members: dict = {}
+    label: int = 0
+    for cell_row in range(height):
+        last: bool = cell_row == height - 1
+        for col in range(width):
+            if not sets[col]:
+                label += 1
+                sets[col] = label
+                members[label] = [col]
+
+        row: bytearray = bytearray([BARRIER]) * columns
+        row[::2] = bytes([EMPTY]) * width
+        for col in range(width - 1):
+            a, b = sets[col], sets[col + 1]
+            if a != b and (last or rng.random() < 0.5):
+                # Relabel the smaller set
+                if len(members[a]) < len(members[b]):
+                    a, b = b, a
+                for member in members[b]:
+                    sets[member] = a
+                members[a] += members.pop(b)
+                row[2 * col + 1] = EMPTY
+        yield row
+        if last:
+            break
+
+        below: bytearray = bytearray([BARRIER]) * columns
+        sets = [0] * width
+        extended: dict = {}
+        for key, cols in members.items():
+            down: list = [col for col in cols if rng.random() < 0.5]
+            if not down:
+                down = [cols[rng.randrange(len(cols))]]
+            for col in down:
+                below[2 * col] = EMPTY
+                sets[col] = key
+            extended[key] = down
+        members = extended
+        yield below
+
+    if rows % 2 == 0:
+        yield bytearray([BARRIER]) * columns
+
+
+def eller(states: bytearray, rows: int, columns: int, rng: random.Random):
+    """
+    `eller_rows` writing the rows into a grid one by one. Parameters as for
+    `backtracker`.
+    """
+    for row, values in enumerate(eller_rows(rows, columns, rng)):
+        begin: int = row * columns
+        states[begin:begin + columns] = values
+        yield [begin + col for col, value in enumerate(values) if value == EMPTY]
+
+
+def random_source(seed: int = None) -> random.Random:
+    """
+    Returns the random numbers of a maze. Without a seed one is drawn from
+    the `random` module, so seeding that makes the maze reproducible as well.
+    """
+    if seed is None:
+        seed = random.getrandbits(64)
+    return random.Random(seed)
+
+
+# Pairs of (name: engine) of all maze algorithms.
+ENGINES: dict = {
+    "backtracker": backtracker,
+    "kruskal": kruskal,
+    "eller": eller,
+}
+
+
+def carve(states: bytearray, rows: int, columns: int, algorithm: str = "backtracker",
+          seed: int = None):
+    """
+    Carves a maze into the states of a grid step by step.
+
+    Parameters
+    ----------
+    states: bytearray
+        States of the grid, all of them barriers.
+    rows: int
+        Number of rows of the grid.
+    columns: int
+        Number of columns of the grid.
+    algorithm: str
+        Name of the engine, see `ENGINES`.
+    seed: int
+        Seed of the random numbers, see `random_source`.
+
+    Returns
+    -------
+    generator
+        Generator carving the maze and yielding the indices carved by each
+        step.
+    """
+    if algorithm not in ENGINES:
+        raise ValueError("Unknown maze algorithm {!r}".format(algorithm))
+    return ENGINES[algorithm](states, rows, columns, random_source(seed))
+
+
+def generate(rows: int, columns: int, algorithm: str = "backtracker", seed: int = None) -> bytearray:
+    """
+    Makes a maze without a grid. Parameters as for `carve`.
+
+    Returns
+    -------
+    bytearray
+        States of the maze indexed like those of a grid.
+    """
+    if algorithm == "eller":
+        # Joining the rows skips the detour through the carved indices
+        return bytearray().join(eller_rows(rows, columns, random_source(seed)))
+    states: bytearray = bytearray([BARRIER]) * (rows * columns)
+    for _ in carve(states, rows, columns, algorithm, seed):
+        pass
+    return states
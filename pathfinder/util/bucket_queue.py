@@ -0,0 +1,123 @@
+class BucketQueue:
+    """
+    Monotone bucket queue for small non-negative integer priorities as used
+    by Dial's algorithm. Every priority has a bucket of items and the
+    smallest non-empty bucket is found by moving a cursor upwards, so with
+    edge costs of at most C an operation costs O(1) amortized plus at most C
+    empty buckets skipped per pop instead of the O(log n) of a binary heap.
+
+    Priorities may be pushed below the cursor, which only moves it back.
+    Items with the same priority are returned in the order they were pushed
+    or updated, like in `PriorityQueue`, whose interface is implemented.
+
+    Attributes
+    ----------
+    buckets: dict
+        Pairs of (priority: bucket) where every bucket is a dict used as an
+        ordered set of items.
+    position: dict
+        Pairs of (item: priority).
+    """
+
+    def __init__(self):
+        self.buckets: dict = {}
+        self.position: dict = {}
+        self.__cursor: int = 0
+
+    def __len__(self) -> int:
+        return len(self.position)
+
+    def __contains__(self, item) -> bool:
+        return item in self.position
+
+    def empty(self) -> bool:
+        """Returns whether the queue is empty."""
+        return not self.position
+
+    def priority(self, item) -> int:
+        """Returns the priority of a queued item."""
+        return self.position[item]
+
+    def push(self, item, priority: int):
+        """
+        Adds an item to the queue. If the item is queued already its priority
+        is updated instead.
+
+        Parameters
+        ----------
+        item
+            Hashable item to add.
+        priority: int
+            Non-negative integer priority. Lower values are returned first.
+        """
+        if item in self.position:
+            self.update(item, priority)
+            return
+        self.__insert(item, priority)
+
+    def decrease_key(self, item, priority: int):
+        """
+        Lowers the priority of a queued item. Priorities which are not lower
+        than the current one are ignored.
+        """
+        if priority < self.position[item]:
+            self.update(item, priority)
+
+    def update(self, item, priority: int):
+        """Sets the priority of a queued item to an arbitrary value."""
+        self.__discard(item)
+        self.__insert(item, priority)
+
+    def peek(self) -> tuple:
+        """Returns the (item, priority) pair with the lowest priority without removing it."""
+        bucket: dict = self.__first()
+        return next(iter(bucket)), self.__cursor
+
+    def pop(self) -> tuple:
+        """
+        Removes and returns the item with the lowest priority.
+
+        Returns
+        -------
+        tuple
+            (item, priority) pair.
+        """
+        bucket: dict = self.__first()
+        priority: int = self.__cursor
+        item = next(iter(bucket))
+        del bucket[item]
+        if not bucket:
+            del self.buckets[priority]
+        del self.position[item]
+        return item, priority
+
+    def remove(self, item):
+        """Removes a queued item regardless of its priority."""
+        self.__discard(item)
+
+    def __insert(self, item, priority: int):
+        bucket: dict = self.buckets.get(priority)
+        if bucket is None:
+            bucket = self.buckets[priority] = {}
+        bucket[item] = None
+        self.position[item] = priority
+        if priority < self.__cursor:
+            self.__cursor = priority
+
+    def __discard(self, item):
+        priority: int = self.position.pop(item)
+        bucket: dict = self.buckets[priority]
+        del bucket[item]
+        if not bucket:
+            del self.buckets[priority]
+
+    def __first(self) -> dict:
+        """Moves the cursor to the smallest non-empty bucket and returns it."""
+        if not self.position:
+            raise IndexError("pop from an empty queue")
+        buckets: dict = self.buckets
+        cursor: int = self.__cursor
+        while cursor not in buckets:
+            cursor += 1
+        self.__cursor = cursor
+        return buckets[cursor]
@@ -1,3 +1,6 @@
+from pathfinder.util.state import State
+
+
 class Colour:
     WHITE = (248, 248, 255)
     BLACK = (0, 0, 10)
@@ -10,3 +13,46 @@ class Colour:
     RED = (220, 20, 60)
     BLUE = (0, 20, 220)
     LIGHT_BLUE = (0, 144, 224)
+    BROWN = (120, 80, 40)
+
+
+# Colour a cell is drawn with depending on the value of its state.
+STATE_COLOURS: dict = {
+    State.START.value: Colour.RED,
+    State.END.value: Colour.BLUE,
+    State.BARRIER.value: Colour.BLACK,
+    State.PATH.value: Colour.GREEN,
+    State.OPEN.value: Colour.LIGHT_BLUE,
+    State.CLOSED.value: Colour.LIGHT_GREY,
+    State.EMPTY.value: Colour.WHITE,
+}
+
+
+def heat(fraction: float) -> tuple:
+    """
+    Colour of a heat map ranging from yellow for 0 to purple for 1.
+
+    Parameters
+    ----------
+    fraction: float
+        Position on the scale between 0 and 1.
+
+    Returns
+    -------
+    tuple
+        RGB colour.
+    """
+    return tuple(
+        round(low + (high - low) * fraction) for low, high in zip(Colour.YELLOW, Colour.PURPLE)
+    )
+
+
+def terrain(weight: int) -> tuple:
+    """
+    Colour of an empty cell with the given traversal weight, getting darker
+    from white for weight 1 to brown for weight 9 and above.
+    """
+    fraction: float = min((weight - 1) / 8, 1)
+    return tuple(
+        round(low + (high - low) * fraction) for low, high in zip(Colour.WHITE, Colour.BROWN)
+    )
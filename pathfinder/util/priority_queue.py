@@ -1,13 +1,147 @@
-import queue
+class PriorityQueue:
+    """
+    Indexed binary min-heap. Unlike `queue.PriorityQueue` it does not take a
+    lock on every operation and keeps track of the position of each item so
+    that membership tests are O(1) and the priority of a queued item can be
+    decreased in O(log n). Items with the same priority are returned in the
+    order they were pushed.
+
+    Attributes
+    ----------
+    heap: list
+        Entries of (priority, counter, item) ordered as a binary heap.
+    position: dict
+        Pairs of (item: index of its entry in the heap).
+    """
 
-class PriorityQueue(queue.PriorityQueue):
     def __init__(self):
-        super().__init__()
-        
-    def is_element(self, element, key=id):
-        for entry in self.queue:
-            if key(entry) == element:
-                return True
-        return False
-
-    
\ No newline at end of file
+        self.heap: list = []
+        self.position: dict = {}
+        self.counter: int = 0
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def __contains__(self, item) -> bool:
+        return item in self.position
+
+    def empty(self) -> bool:
+        """Returns whether the queue is empty."""
+        return not self.heap
+
+    def priority(self, item):
+        """Returns the priority of a queued item."""
+        return self.heap[self.position[item]][0]
+
+    def push(self, item, priority):
+        """
+        Adds an item to the queue. If the item is queued already its priority
+        is updated instead.
+
+        Parameters
+        ----------
+        item
+            Hashable item to add.
+        priority
+            Priority of the item. Lower values are returned first.
+        """
+        if item in self.position:
+            self.update(item, priority)
+            return
+        self.counter += 1
+        self.heap.append((priority, self.counter, item))
+        self.position[item] = len(self.heap) - 1
+        self.__sift_up(len(self.heap) - 1)
+
+    def decrease_key(self, item, priority):
+        """
+        Lowers the priority of a queued item. Priorities which are not lower
+        than the current one are ignored.
+        """
+        if priority < self.heap[self.position[item]][0]:
+            self.update(item, priority)
+
+    def update(self, item, priority):
+        """Sets the priority of a queued item to an arbitrary value."""
+        pos: int = self.position[item]
+        old_priority = self.heap[pos][0]
+        self.counter += 1
+        self.heap[pos] = (priority, self.counter, item)
+        if priority < old_priority:
+            self.__sift_up(pos)
+        else:
+            self.__sift_down(pos)
+
+    def peek(self) -> tuple:
+        """Returns the (item, priority) pair with the lowest priority without removing it."""
+        priority, _, item = self.heap[0]
+        return item, priority
+
+    def pop(self) -> tuple:
+        """
+        Removes and returns the item with the lowest priority.
+
+        Returns
+        -------
+        tuple
+            (item, priority) pair.
+        """
+        heap: list = self.heap
+        last: tuple = heap.pop()
+        if heap:
+            priority, _, item = heap[0]
+            heap[0] = last
+            self.position[last[2]] = 0
+            self.__sift_down(0)
+        else:
+            priority, _, item = last
+        del self.position[item]
+        return item, priority
+
+    def remove(self, item):
+        """Removes a queued item regardless of its priority."""
+        heap: list = self.heap
+        pos: int = self.position.pop(item)
+        last: tuple = heap.pop()
+        if pos < len(heap):
+            heap[pos] = last
+            self.position[last[2]] = pos
+            self.__sift_up(pos)
+            self.__sift_down(self.position[last[2]])
+
+    def __sift_up(self, pos: int):
+        heap: list = self.heap
+        position: dict = self.position
+        entry: tuple = heap[pos]
+        while pos > 0:
+            parent_pos: int = (pos - 1) >> 1
+            parent: tuple = heap[parent_pos]
+            if entry < parent:
+                heap[pos] = parent
+                position[parent[2]] = pos
+                pos = parent_pos
+            else:
+                break
+        heap[pos] = entry
+        position[entry[2]] = pos
+
+    def __sift_down(self, pos: int):
+        heap: list = self.heap
+        position: dict = self.position
+        size: int = len(heap)
+        entry: tuple = heap[pos]
+        child_pos: int = 2 * pos + 1
+        while child_pos < size:
+            right_pos: int = child_pos + 1
+            if right_pos < size and heap[right_pos] < heap[child_pos]:
+                child_pos = right_pos
+            child: tuple = heap[child_pos]
+            if child < entry:
+                heap[pos] = child
+                position[child[2]] = pos
+                pos = child_pos
+                child_pos = 2 * pos + 1
+            else:
+                break
+        heap[pos] = entry
+        position[entry[2]] = pos
@@ -0,0 +1,37 @@
+class SearchResult:
+    """
+    Outcome of a search run by one of the graph's solvers.
+
+    Attributes
+    ----------
+    path: list
+        (row, column) tuples from the start to the destination. Empty if no
+        destination was given or it could not be reached.
+    distance: float
+        Length of the path or infinity if the destination is unreachable.
+    expanded: int
+        Number of nodes taken from the queue and expanded.
+    opened: int
+        Number of times a node was put into the queue.
+    bound: float
+        Factor by which the distance may at most exceed the shortest one, 1
+        for solvers which find shortest paths. Infinite if a bounded search
+        ran out of budget before it found a path.
+    """
+
+    def __init__(self, path: list, distance: float, expanded: int, opened: int, bound: float = 1.0):
+        self.path: list = path
+        self.distance: float = distance
+        self.expanded: int = expanded
+        self.opened: int = opened
+        self.bound: float = bound
+
+    @property
+    def found(self) -> bool:
+        """Whether a path to the destination has been found."""
+        return self.distance != float('inf')
+
+    def __repr__(self):
+        return "SearchResult(distance={}, expanded={}, opened={}, path_length={}, bound={})".format(
+            self.distance, self.expanded, self.opened, len(self.path), self.bound
+        )
@@ -0,0 +1,182 @@
+import cProfile
+import io
+import pstats
+from pathfinder.util.bucket_queue import BucketQueue
+from pathfinder.util.priority_queue import PriorityQueue
+
+
+class CountingQueue:
+    """
+    Mixin counting the operations of a priority queue in a `SearchStats`
+    object. The counting queues are only used while instrumentation is
+    enabled so the plain queues do not pay for the counting.
+    """
+
+    def __init__(self, stats):
+        super().__init__()
+        self.stats = stats
+
+    def __contains__(self, item) -> bool:
+        self.stats.lookups += 1
+        return item in self.position
+
+    def push(self, item, priority):
+        self.stats.pushes += 1
+        super().push(item, priority)
+
+    def decrease_key(self, item, priority):
+        self.stats.decrease_keys += 1
+        super().decrease_key(item, priority)
+
+    def update(self, item, priority):
+        self.stats.updates += 1
+        super().update(item, priority)
+
+    def pop(self) -> tuple:
+        self.stats.pops += 1
+        return super().pop()
+
+    def remove(self, item):
+        self.stats.removals += 1
+        super().remove(item)
+
+
+class CountingPriorityQueue(CountingQueue, PriorityQueue):
+    """Binary heap counting its operations."""
+
+
+class CountingBucketQueue(CountingQueue, BucketQueue):
+    """Bucket queue counting its operations."""
+
+
+class SearchStats:
+    """
+    Counters, timers and the expansion order collected while it is assigned
+    to `Graph.stats`. Values accumulate over all runs until `reset` is
+    called. Without a stats object the solvers only check for None.
+
+    Attributes
+    ----------
+    expanded: int
+        Number of nodes expanded by the solvers.
+    relaxed: int
+        Number of edges which lowered the distance of a neighbor.
+    carved: int
+        Number of cells carved by the maze generator.
+    pushes: int
+        Number of `push` calls on the priority queues.
+    pops: int
+        Number of `pop` calls on the priority queues.
+    decrease_keys: int
+        Number of `decrease_key` calls on the priority queues.
+    updates: int
+        Number of priority changes including those by `decrease_key`.
+    removals: int
+        Number of `remove` calls on the priority queues.
+    lookups: int
+        Number of membership tests on the priority queues.
+    timers: dict
+        Pairs of (phase: seconds), e.g. "search" and "draw".
+    order: list
+        Indices of the expanded nodes in the order they were expanded.
+    profiler: cProfile.Profile
+        Profile of the search phases, None unless profiling was requested.
+    """
+
+    def __init__(self, profile: bool = False):
+        """
+        Parameters
+        ----------
+        profile: bool
+            Whether to capture a cProfile of the search phases.
+        """
+        self.profiler: cProfile.Profile = cProfile.Profile() if profile else None
+        self.reset()
+
+    def reset(self):
+        """Resets all counters, timers and the profile."""
+        self.expanded: int = 0
+        self.relaxed: int = 0
+        self.carved: int = 0
+        self.pushes: int = 0
+        self.pops: int = 0
+        self.decrease_keys: int = 0
+        self.updates: int = 0
+        self.removals: int = 0
+        self.lookups: int = 0
+        self.timers: dict = {}
+        self.order: list = []
+        if self.profiler is not None:
+            self.profiler = cProfile.Profile()
+
+    def queue(self, bucket: bool = False):
+        """
+        Returns a new priority queue counting its operations.
+
+        Parameters
+        ----------
+        bucket: bool
+            Whether to return a bucket queue instead of a binary heap.
+        """
+        return CountingBucketQueue(self) if bucket else CountingPriorityQueue(self)
+
+    def add_time(self, phase: str, seconds: float):
+        """Adds the time spent in a phase."""
+        self.timers[phase] = self.timers.get(phase, 0.0) + seconds
+
+    def merge(self, other: 'SearchStats'):
+        """
+        Adds the counters, timers and expansion order of another stats
+        object, e.g. one collected by a search in another thread. Its
+        profile is not merged.
+        """
+        for name in (
+            "expanded", "relaxed", "carved", "pushes", "pops", "decrease_keys", "updates",
+            "removals", "lookups",
+        ):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        for phase, seconds in other.timers.items():
+            self.add_time(phase, seconds)
+        self.order += other.order
+
+    def as_dict(self) -> dict:
+        """Returns the counters and timers, e.g. for saving them as JSON."""
+        return {
+            "expanded": self.expanded,
+            "relaxed": self.relaxed,
+            "carved": self.carved,
+            "pushes": self.pushes,
+            "pops": self.pops,
+            "decrease_keys": self.decrease_keys,
+            "updates": self.updates,
+            "removals": self.removals,
+            "lookups": self.lookups,
+            "timers": dict(self.timers),
+        }
+
+    def report(self, sort: str = "cumulative", limit: int = 20) -> str:
+        """
+        Formats the captured profile.
+
+        Parameters
+        ----------
+        sort: str
+            Key to sort the functions by, see `pstats.Stats.sort_stats`.
+        limit: int
+            Maximum number of functions listed.
+
+        Returns
+        -------
+        str
+            The profile as printed by pstats.
+        """
+        if self.profiler is None:
+            raise ValueError("Profiling has not been enabled")
+        stream: io.StringIO = io.StringIO()
+        pstats.Stats(self.profiler, stream=stream).sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
+
+    def __repr__(self):
+        return "SearchStats({})".format(
+            ", ".join("{}={}".format(key, value) for key, value in self.as_dict().items())
+        )
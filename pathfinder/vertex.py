@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
-from pathfinder.util.colour import Colour
+from pathfinder.util.colour import STATE_COLOURS
 from pathfinder.util.state import State
 
 class Vertex:
     """
-    Class representing a vertex in graph/grid.
+    Class representing a vertex in graph/grid. A vertex created by a grid is
+    a thin view of one of its cells: its state is read from and written to
+    the grid's storage while the colour and coordinates are derived on demand.
+    A vertex created on its own stores its state itself.
 
     Attributes
     ----------
@@ -23,9 +26,13 @@ class Vertex:
     state: State
         State of the vertex. Check the State class for more
         information.
+    weight: int
+        Cost of moving onto the vertex.
     """
 
-    def __init__(self, row: int, column: int, width: int):
+    __slots__ = ("row", "column", "width", "_grid", "_index", "_state")
+
+    def __init__(self, row: int, column: int, width: int, grid=None, index: int = 0):
         """
         Parameters
         ----------
@@ -35,50 +42,82 @@ class Vertex:
             Column of the vertex.
         width: int
             Width of the cell which represents a vertex.
+        grid: Grid
+            Grid storing the state of the vertex. If omitted the vertex
+            stores its state itself.
+        index: int
+            Index of the vertex within the grid.
         """
         self.row: int = row
         self.column: int = column
-        self.x: int = column * width
-        self.y: int = row * width
         self.width: int = width
-
-        self.colour: Colour = Colour.WHITE
-        self.state: State = State.EMPTY
+        self._grid = grid
+        self._index: int = index
+        self._state: State = State.EMPTY
+
+    @property
+    def x(self) -> int:
+        return self.column * self.width
+
+    @property
+    def y(self) -> int:
+        return self.row * self.width
+
+    @property
+    def index(self) -> int:
+        """Index of the vertex within its grid."""
+        return self._index
+
+    @property
+    def state(self) -> State:
+        if self._grid is None:
+            return self._state
+        return State(self._grid.states[self._index])
+
+    @property
+    def weight(self) -> int:
+        """Cost of moving onto the vertex, always 1 without a grid."""
+        if self._grid is None:
+            return 1
+        return self._grid.weights[self._index]
+
+    @property
+    def colour(self) -> tuple:
+        return STATE_COLOURS[self.state.value]
+
+    def __set_state(self, state: State):
+        if self._grid is None:
+            self._state = state
+        else:
+            self._grid.set_state(self._index, state)
 
     def set_start(self):
         """Marks the vertex as the starting point by colouring it red."""
-        self.colour = Colour.RED
-        self.state = State.START
+        self.__set_state(State.START)
 
     def set_end(self):
         """Marks the vertex as the destination point by colouring it blue."""
-        self.colour = Colour.BLUE
-        self.state = State.END
+        self.__set_state(State.END)
 
     def set_barrier(self):
         """Marks the vertex as barrier which cannot be visited by colouring it black."""
-        self.colour = Colour.BLACK
-        self.state = State.BARRIER
+        self.__set_state(State.BARRIER)
 
     def set_path(self):
         """Marks the vertex as one of the vertices of the shortest path."""
-        self.colour = Colour.GREEN
-        self.state = State.PATH
+        self.__set_state(State.PATH)
 
     def set_open(self):
         """Marks the vertex as discovered but not yet visited by colouring in light blue."""
-        self.colour = Colour.LIGHT_BLUE
-        self.state = State.OPEN
+        self.__set_state(State.OPEN)
 
     def set_closed(self):
         """Marks the vertex visited by colouring it light grey."""
-        self.colour = Colour.LIGHT_GREY
-        self.state = State.CLOSED
+        self.__set_state(State.CLOSED)
 
     def reset(self):
         """Marks the vertex as empty by colouring it white."""
-        self.colour = Colour.WHITE
-        self.state = State.EMPTY
+        self.__set_state(State.EMPTY)
 
     def get_neighbors(self, graph, dist: int = 1) -> dict:
         """
@@ -96,17 +135,18 @@ class Vertex:
         Returns
         -------
         dict
-            Neighbors of the current vertex.
+            Neighbors of the current vertex keyed by their direction. On
+            8-connected grids the diagonal neighbors are included.
         """
+        directions: tuple = NEIGHBOR_DIRECTIONS
+        if graph.grid.diagonal:
+            directions += DIAGONAL_DIRECTIONS
         neighbors: dict = {}
-        if self.row - dist >= 0:
-            neighbors["upper"] = graph.grid[self.row - dist][self.column]
-        if self.row + dist < graph.rows:
-            neighbors["lower"] = graph.grid[self.row + dist][self.column]
-        if self.column - dist >= 0:
-            neighbors["left"] = graph.grid[self.row][self.column - dist]
-        if self.column + dist < graph.columns:
-            neighbors["right"] = graph.grid[self.row][self.column + dist]
+        for name, d_row, d_col in directions:
+            row: int = self.row + d_row * dist
+            column: int = self.column + d_col * dist
+            if 0 <= row < graph.rows and 0 <= column < graph.columns:
+                neighbors[name] = graph.grid[row][column]
 
         return neighbors
 
@@ -114,5 +154,23 @@ class Vertex:
         """Returns the row and column the vertex is in"""
         return (self.row, self.column)
 
+    def __eq__(self, other):
+        if not isinstance(other, Vertex):
+            return NotImplemented
+        return (
+            self.row == other.row and self.column == other.column
+            and self._grid is other._grid
+        )
+
+    def __hash__(self):
+        return hash((self.row, self.column))
+
     def __str__(self):
         return str(self.get_position())
+
+
+# (name, d_row, d_col) of the orthogonal and the diagonal neighbors.
+NEIGHBOR_DIRECTIONS: tuple = (("upper", -1, 0), ("lower", 1, 0), ("left", 0, -1), ("right", 0, 1))
+DIAGONAL_DIRECTIONS: tuple = (
+    ("upper_left", -1, -1), ("upper_right", -1, 1), ("lower_left", 1, -1), ("lower_right", 1, 1)
+)
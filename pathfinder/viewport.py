@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+import math
+from pathfinder.grid import Grid
+from pathfinder.util.colour import Colour, STATE_COLOURS, heat, terrain
+from pathfinder.util.state import State
+
+# Largest number of pixels per cell.
+MAX_ZOOM: float = 64.0
+
+EMPTY: int = State.EMPTY.value
+CLOSED: int = State.CLOSED.value
+
+
+class Viewport:
+    """
+    Camera showing a part of a grid in a window. The zoom is the width of a
+    cell in pixels and may be below 1, in which case each pixel shows one
+    of several cells. Only the cells inside the window are ever looked at,
+    so drawing costs time in the number of pixels rather than cells.
+
+    Attributes
+    ----------
+    rows: int
+        Number of rows of the grid.
+    columns: int
+        Number of columns of the grid.
+    width: int
+        Width of the window in pixels.
+    height: int
+        Height of the window in pixels.
+    min_zoom: float
+        Zoom at which the whole grid fits into the window.
+    zoom: float
+        Width of a cell in pixels.
+    x: float
+        Column shown at the left edge of the window, fractions included.
+    y: float
+        Row shown at the top edge of the window, fractions included.
+    """
+
+    def __init__(self, rows: int, columns: int, width: int, height: int):
+        """
+        Parameters
+        ----------
+        rows: int
+            Number of rows of the grid.
+        columns: int
+            Number of columns of the grid.
+        width: int
+            Width of the window in pixels.
+        height: int
+            Height of the window in pixels.
+        """
+        self.rows: int = rows
+        self.columns: int = columns
+        self.width: int = width
+        self.height: int = height
+        self.min_zoom: float = min(width / columns, height / rows, MAX_ZOOM)
+        self.zoom: float = self.min_zoom
+        self.x: float = 0.0
+        self.y: float = 0.0
+        # NumPy tables of `render`, built by its first call: the state and
+        # terrain colours, the heat map colours and the rank of every cell
+        # in the expansion order together with the order they were read from
+        # and the number of its entries they cover.
+        self.__palettes: tuple = None
+        self.__heat = None
+        self.__ranks = None
+        self.__order: list = None
+        self.__ranked: int = 0
+
+    def fit(self):
+        """Shows the whole grid."""
+        self.zoom = self.min_zoom
+        self.x = self.y = 0.0
+
+    def zoom_at(self, factor: float, pos: tuple):
+        """
+        Zooms in by a factor, or out if it is below 1, keeping the cell under
+        a pixel in place.
+
+        Parameters
+        ----------
+        factor: float
+            Factor the width of a cell is multiplied by.
+        pos: tuple
+            x and y coordinates of the pixel, e.g. the mouse position.
+        """
+        px, py = pos
+        col: float = self.x + px / self.zoom
+        row: float = self.y + py / self.zoom
+        self.zoom = min(max(self.zoom * factor, self.min_zoom), MAX_ZOOM)
+        self.x = col - px / self.zoom
+        self.y = row - py / self.zoom
+        self.__clamp()
+
+    def pan(self, dx: float, dy: float):
+        """Moves the camera by the given number of pixels."""
+        self.x += dx / self.zoom
+        self.y += dy / self.zoom
+        self.__clamp()
+
+    def __clamp(self):
+        """Keeps the camera from leaving the grid."""
+        self.x = min(max(self.x, 0.0), max(self.columns - self.width / self.zoom, 0.0))
+        self.y = min(max(self.y, 0.0), max(self.rows - self.height / self.zoom, 0.0))
+
+    def visible(self) -> tuple:
+        """
+        Returns the cells inside the window as (first row, end row, first
+        column, end column), the ends being exclusive.
+        """
+        return (
+            int(self.y),
+            min(math.ceil(self.y + self.height / self.zoom), self.rows),
+            int(self.x),
+            min(math.ceil(self.x + self.width / self.zoom), self.columns),
+        )
+
+    def cell_at(self, pos: tuple) -> tuple:
+        """
+        Returns the cell shown at a pixel as (row, column) or None if there
+        is no cell at the pixel.
+        """
+        px, py = pos
+        row: int = math.floor(self.y + py / self.zoom)
+        col: int = math.floor(self.x + px / self.zoom)
+        if 0 <= row < self.rows and 0 <= col < self.columns:
+            return row, col
+        return None
+
+    def cell_rect(self, row: int, col: int) -> tuple:
+        """
+        Returns the pixels covered by a cell as (left, top, width, height).
+        Neighboring cells neither overlap nor leave gaps at any zoom.
+        """
+        left: int = math.floor((col - self.x) * self.zoom)
+        top: int = math.floor((row - self.y) * self.zoom)
+        right: int = math.floor((col + 1 - self.x) * self.zoom)
+        bottom: int = math.floor((row + 1 - self.y) * self.zoom)
+        return left, top, right - left, bottom - top
+
+    def render(self, grid: Grid, order: list = None):
+        """
+        Draws the window by sampling the cell at the center of every pixel
+        from the state array, which requires NumPy. Used while zoomed out,
+        where cells are smaller than a pixel. The colour tables are built
+        once and the ranks of the heat map only extended by the cells
+        expanded since the last call, so a frame costs time in the number
+        of pixels.
+
+        Parameters
+        ----------
+        grid: Grid
+            Grid to draw.
+        order: list
+            Optional expansion order of the last search, whose closed cells
+            are coloured as a heat map then.
+
+        Returns
+        -------
+        pygame.Surface
+            Surface of the size of the window.
+        """
+        import numpy as np
+        import pygame
+
+        cols = (self.x + (np.arange(self.width) + 0.5) / self.zoom).astype(np.intp)
+        rows = (self.y + (np.arange(self.height) + 0.5) / self.zoom).astype(np.intp)
+        outside = (rows >= self.rows)[:, None] | (cols >= self.columns)[None, :]
+        index = np.minimum(rows, self.rows - 1)[:, None] * self.columns + np.minimum(cols, self.columns - 1)
+
+        states = np.frombuffer(grid.states, dtype=np.uint8)[index]
+        weights = np.frombuffer(grid.weights, dtype=np.uint8)[index]
+        if self.__palettes is None:
+            self.__palettes = palettes()
+        state_colours, terrain_colours = self.__palettes
+        pixels = state_colours[states]
+        weighted = (states == EMPTY) & (weights != 1)
+        pixels[weighted] = terrain_colours[weights[weighted]]
+        if order:
+            ranks = self.__rank(grid, order)[index]
+            hot = (states == CLOSED) & (ranks >= 0)
+            if self.__heat is None:
+                self.__heat = np.array([heat(fraction) for fraction in np.linspace(0, 1, 256)], dtype=np.uint8)
+            pixels[hot] = self.__heat[ranks[hot] * 255 // max(len(order) - 1, 1)]
+        pixels[outside] = Colour.GREY
+        # Surfaces are indexed by x first
+        return pygame.surfarray.make_surface(pixels.transpose(1, 0, 2))
+
+    def __rank(self, grid: Grid, order: list):
+        """
+        Returns the position of every cell in the expansion order, -1 for
+        cells not expanded. Only the entries added to the order since the
+        last call are written unless it is a different order.
+        """
+        import numpy as np
+
+        if (
+            self.__ranks is None or self.__order is not order or len(order) < self.__ranked
+            or len(self.__ranks) != grid.size
+        ):
+            self.__ranks = np.full(grid.size, -1, dtype=np.int64)
+            self.__order = order
+            self.__ranked = 0
+        if len(order) > self.__ranked:
+            self.__ranks[np.asarray(order[self.__ranked:], dtype=np.intp)] = np.arange(self.__ranked, len(order))
+            self.__ranked = len(order)
+        return self.__ranks
+
+
+def palettes() -> tuple:
+    """
+    Returns the colours of the states and of the terrain of empty cells as
+    two NumPy arrays of 256 RGB colours indexed by state and weight.
+    """
+    import numpy as np
+
+    state_colours = np.zeros((256, 3), dtype=np.uint8)
+    for state, colour in STATE_COLOURS.items():
+        state_colours[state] = colour
+    terrain_colours = np.array([terrain(max(weight, 1)) for weight in range(256)], dtype=np.uint8)
+    return state_colours, terrain_colours
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+import numpy as np
+from pathfinder.grid import Grid
+from pathfinder.util.state import State
+
+
+def wavefront(grid: Grid, source: int, target: int = -1) -> tuple:
+    """
+    Breadth first search expanding the whole frontier at once with NumPy.
+    Since every edge of the grid costs 1 the n-th frontier contains exactly
+    the cells at distance n from the source, which yields the same distances
+    as Dijkstra without the need for a priority queue.
+
+    Parameters
+    ----------
+    grid: Grid
+        Grid to search.
+    source: int
+        Index of the cell to start at.
+    target: int
+        Optional index of a destination. If given the search stops as soon
+        as it has been reached, otherwise distances to all cells are computed.
+
+    Returns
+    -------
+    tuple
+        (dist, prev) flat arrays indexed by cell. dist holds the distance to
+        the source or -1 for unreachable cells and prev the index of the
+        previous cell on a shortest path or -1.
+    """
+    if grid.weighted or grid.diagonal:
+        raise ValueError("The wavefront requires unit weights and 4-connectivity")
+    rows, columns = grid.rows, grid.columns
+    states: np.ndarray = np.frombuffer(grid.states, dtype=np.uint8)
+    # Cells which can still be discovered
+    unvisited: np.ndarray = states != State.BARRIER.value
+    dist: np.ndarray = np.full(grid.size, -1, dtype=np.int32)
+    prev: np.ndarray = np.full(grid.size, -1, dtype=np.int64)
+
+    dist[source] = 0
+    unvisited[source] = False
+    frontier: np.ndarray = np.array([source], dtype=np.int64)
+    step: int = 0
+
+    while frontier.size and not (target >= 0 and dist[target] >= 0):
+        step += 1
+        rows_f: np.ndarray = frontier // columns
+        cols_f: np.ndarray = frontier - rows_f * columns
+        discovered: list = []
+        # Neighbors in the same order as `Grid.neighbors`: upper, lower, left, right.
+        # Cells discovered through an earlier direction are not rediscovered.
+        for offset, valid in (
+            (-columns, rows_f > 0),
+            (columns, rows_f < rows - 1),
+            (-1, cols_f > 0),
+            (1, cols_f < columns - 1),
+        ):
+            src: np.ndarray = frontier[valid]
+            neighbors: np.ndarray = src + offset
+            new: np.ndarray = unvisited[neighbors]
+            src, neighbors = src[new], neighbors[new]
+            unvisited[neighbors] = False
+            dist[neighbors] = step
+            prev[neighbors] = src
+            discovered.append(neighbors)
+        frontier = np.concatenate(discovered)
+
+    return dist, prev
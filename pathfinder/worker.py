@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+import queue
+import threading
+import time
+from pathfinder.graph import Graph
+
+# Number of batches of events buffered before the search waits for them
+# to be drained.
+QUEUE_SIZE: int = 64
+# Largest number of steps of the search sent as one batch.
+BATCH_STEPS: int = 256
+# Seconds a blocked search waits before checking whether it was cancelled.
+POLL_INTERVAL: float = 0.05
+
+
+class SearchWorker:
+    """
+    Runs the steps of a solver in a background thread on a snapshot of a
+    graph, see `Graph.snapshot`, so that the thread drawing the graph never
+    waits for the search. The events of the steps are sent back in batches
+    through a bounded queue. The search pauses while the queue is full, so
+    a slow consumer holds up the search rather than letting events pile up.
+
+    Attributes
+    ----------
+    snapshot: Graph
+        Copy of the graph the search runs on.
+    batch: int
+        Number of steps sent as one batch, may be changed while running.
+    result
+        Value returned by the solver once it is done.
+    done: bool
+        Whether the last batch has been received.
+    """
+
+    def __init__(self, graph: Graph, solver: str, *args, batch: int = BATCH_STEPS, **kwargs):
+        """
+        Parameters
+        ----------
+        graph: Graph
+            Graph to search. It may be edited while the search runs, which
+            does not affect the search.
+        solver: str
+            Name of the steps method of the graph, e.g. "a_star_steps".
+        args, kwargs
+            Arguments of the steps method.
+        batch: int
+            Number of steps sent as one batch.
+        """
+        self.snapshot: Graph = graph.snapshot()
+        self.batch: int = batch
+        self.result = None
+        self.done: bool = False
+        self.__steps = getattr(self.snapshot, solver)(*args, **kwargs)
+        self.__queue: queue.Queue = queue.Queue(QUEUE_SIZE)
+        self.__cancelled: threading.Event = threading.Event()
+        self.__error: BaseException = None
+        self.__thread: threading.Thread = threading.Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+    def __run(self):
+        """Advances the search and sends its events until it is done or cancelled."""
+        steps = self.__steps
+        stats = self.snapshot.stats
+        try:
+            while not self.__cancelled.is_set():
+                begin: float = time.perf_counter()
+                count: int = 0
+                events: list = []
+                try:
+                    while count < self.batch:
+                        events += next(steps)
+                        count += 1
+                except StopIteration as stop:
+                    self.result = stop.value
+                    self.__put((count, events))
+                    self.__put(None)
+                    return
+                finally:
+                    # Nothing draws the snapshot
+                    self.snapshot.grid.dirty.clear()
+                    if stats is not None:
+                        stats.add_time("search", time.perf_counter() - begin)
+                self.__put((count, events))
+        except BaseException as error:
+            self.__error = error
+            self.__put(None)
+        finally:
+            steps.close()
+
+    def __put(self, item):
+        """Waits until the item fits into the queue unless the search is cancelled."""
+        while not self.__cancelled.is_set():
+            try:
+                self.__queue.put(item, timeout=POLL_INTERVAL)
+                return
+            except queue.Full:
+                continue
+
+    def poll(self, max_steps: int, deadline: float = None) -> list:
+        """
+        Receives the events of the steps done so far without waiting.
+
+        Parameters
+        ----------
+        max_steps: int
+            Number of steps after which no further batch is received.
+        deadline: float
+            Optional `time.perf_counter` value after which no further
+            batch is received.
+
+        Returns
+        -------
+        list
+            (index, State) pairs of the received steps in order.
+        """
+        events: list = []
+        steps: int = 0
+        while not self.done and steps < max_steps:
+            try:
+                item = self.__queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                self.done = True
+                self.__thread.join()
+                if self.__error is not None:
+                    raise self.__error
+                break
+            count, batch = item
+            steps += count
+            events += batch
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        return events
+
+    def cancel(self):
+        """Stops the search and waits for the thread to end."""
+        self.__cancelled.set()
+        self.__thread.join()
+        self.done = True
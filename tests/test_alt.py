@@ -0,0 +1,80 @@
+import pytest
+import random
+from pathfinder.alt import Landmarks, distances, unreachable
+from pathfinder.graph import Graph
+from pathfinder.util.state import State
+
+
+def maze(rows: int, seed: int) -> Graph:
+    g: Graph = Graph(rows, 1)
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        g.generate_maze()
+    finally:
+        random.setstate(state)
+    return g
+
+@pytest.mark.parametrize("connectivity, weighted", [(4, False), (4, True), (8, False), (8, True)])
+def test_a_star_landmarks_exact(connectivity: int, weighted: bool):
+    rng: random.Random = random.Random(connectivity)
+    g: Graph = Graph(20, 1, connectivity)
+    for index in range(g.grid.size):
+        if rng.random() < 0.25:
+            g.grid.states[index] = State.BARRIER.value
+        elif weighted:
+            g.grid.weights[index] = rng.randint(1, 6)
+    free: list = [index for index in range(g.grid.size) if g.grid.states[index] != State.BARRIER.value]
+    for _ in range(10):
+        start, end = (g.grid.vertex(index) for index in rng.sample(free, 2))
+        g.reset_discovered()
+        expected = g.solve(start, end, algorithm="dijkstra").distance
+        g.reset_discovered()
+        assert g.solve(start, end, algorithm="a_star", landmarks=4).distance == pytest.approx(expected)
+
+def test_landmarks_cut_expansions_in_mazes():
+    g: Graph = maze(41, 3)
+    start, end = g.grid[0][0], g.grid[40][40]
+    plain = g.solve(start, end, algorithm="a_star")
+    g.reset_discovered()
+    alt = g.solve(start, end, algorithm="a_star", landmarks=8)
+    assert alt.distance == plain.distance
+    assert alt.expanded < plain.expanded
+
+def test_table_kept_until_grid_changes():
+    g: Graph = Graph(10, 1)
+    g.solve(g.grid[0][0], g.grid[9][9], algorithm="a_star", landmarks=2)
+    table: Landmarks = g.landmarks
+    g.reset_discovered()
+    g.a_star(landmarks=2)
+    assert g.landmarks is table
+    g.set_barrier(g.grid[5][5])
+    g.reset_discovered()
+    assert g.a_star(landmarks=2).distance == 18
+    assert g.landmarks is not table
+
+def test_compact_tables():
+    g: Graph = Graph(10, 1)
+    g.set_barrier(g.grid[0][1])
+    g.set_barrier(g.grid[1][0])
+    table: Landmarks = Landmarks(g.grid, 3)
+    assert len(table) == 3
+    assert table.forward[0].typecode == "H"
+    assert table.backward == table.forward
+    assert table.nbytes == 3 * 2 * g.grid.size
+    # The enclosed corner cannot be reached
+    assert all(forward[0] == unreachable(forward) for forward in table.forward)
+    assert table.heuristic(0)(55) == 0
+
+    g.set_weight(g.grid[5][5], 4)
+    weighted: Landmarks = Landmarks(g.grid, 3)
+    assert weighted.backward != weighted.forward
+    assert weighted.nbytes == 2 * 3 * 2 * g.grid.size
+
+def test_distances_reverse():
+    g: Graph = Graph(1, 1, columns=3)
+    g.grid.weights[:] = bytes([1, 5, 2])
+    assert distances(g.grid, 0) == [0, 5, 7]
+    assert distances(g.grid, 0, reverse=True) == [0, 1, 6]
+    with pytest.raises(ValueError):
+        Landmarks(g.grid, 0)
@@ -0,0 +1,118 @@
+import pytest
+import random
+from pathfinder.ara import AnytimeAStar
+from pathfinder.graph import Graph
+from pathfinder.util.state import State
+
+
+def random_graph(rows: int, connectivity: int, seed: int) -> Graph:
+    rng: random.Random = random.Random(seed)
+    g: Graph = Graph(rows, 1, connectivity)
+    for index in range(g.grid.size):
+        if rng.random() < 0.25:
+            g.grid.states[index] = State.BARRIER.value
+        else:
+            g.grid.weights[index] = rng.choice((1, 1, 2, 5))
+    g.grid.states[0] = g.grid.states[-1] = State.EMPTY.value
+    return g
+
+def path_cost(g: Graph, path: list) -> float:
+    cells: list = [g.grid.index(row, col) for row, col in path]
+    return sum(g.grid.weights[b] * g.grid.distance(a, b) for a, b in zip(cells, cells[1:]))
+
+@pytest.mark.parametrize("connectivity", [4, 8])
+@pytest.mark.parametrize("seed", range(5))
+def test_weighted_a_star_within_epsilon(connectivity: int, seed: int):
+    g: Graph = random_graph(30, connectivity, seed)
+    start, end = g.grid.vertex(0), g.grid.vertex(g.grid.size - 1)
+    shortest = g.solve(start, end, algorithm="dijkstra").distance
+    g.reset_discovered()
+    result = g.solve(start, end, algorithm="a_star", epsilon=2.0)
+    if not result.found:
+        assert shortest == float('inf')
+        return
+    assert result.bound == 2.0
+    assert shortest <= result.distance <= 2.0 * shortest + 1e-9
+    assert result.distance == pytest.approx(path_cost(g, result.path))
+
+def test_weighted_a_star_expands_less():
+    g: Graph = Graph(60, 1)
+    for row in range(1, 59):
+        g.grid.states[g.grid.index(row, 30)] = State.BARRIER.value
+    start, end = g.grid[30][0], g.grid[30][59]
+    optimal = g.solve(start, end, algorithm="a_star")
+    g.reset_discovered()
+    weighted = g.solve(start, end, algorithm="a_star", epsilon=3.0)
+    assert weighted.expanded < optimal.expanded
+    assert optimal.bound == 1.0
+
+def test_epsilon_below_one():
+    g: Graph = Graph(10, 1)
+    with pytest.raises(ValueError):
+        g.solve(g.grid[0][0], g.grid[9][9], algorithm="a_star", epsilon=0.5)
+    with pytest.raises(ValueError):
+        g.solve(g.grid[0][0], g.grid[9][9], algorithm="ara_star", epsilon=0.5)
+
+@pytest.mark.parametrize("connectivity", [4, 8])
+@pytest.mark.parametrize("seed", range(5))
+def test_anytime_converges(connectivity: int, seed: int):
+    g: Graph = random_graph(30, connectivity, seed)
+    start, end = g.grid.vertex(0), g.grid.vertex(g.grid.size - 1)
+    shortest = g.solve(start, end, algorithm="dijkstra").distance
+    g.reset_discovered()
+    g.set_start(start)
+    g.set_end(end)
+    results: list = list(g.ara_star_solutions(epsilon=4.0))
+    distances: list = [result.distance for result in results]
+    assert distances == sorted(distances, reverse=True)
+    for result in results:
+        # Every path keeps its bound
+        assert result.distance <= result.bound * shortest + 1e-9
+        if result.found:
+            assert result.distance == pytest.approx(path_cost(g, result.path))
+    assert results[-1].bound == 1.0
+    assert results[-1].distance == pytest.approx(shortest)
+
+def test_budget():
+    g: Graph = random_graph(60, 8, 1)
+    start, end = g.grid.vertex(0), g.grid.vertex(g.grid.size - 1)
+    full = g.solve(start, end, algorithm="ara_star")
+    assert full.found and full.bound == 1.0
+
+    g.reset_discovered()
+    # Too small for even the first path
+    result = g.solve(start, end, algorithm="ara_star", max_expanded=5)
+    assert result.expanded == 5
+    assert not result.found and result.bound == float('inf')
+
+    g.reset_discovered()
+    first = next(g.ara_star_solutions(epsilon=3.0))
+    g.reset_discovered()
+    result = g.solve(start, end, algorithm="ara_star", epsilon=3.0, max_expanded=first.expanded + 1)
+    assert result.found and result.expanded == first.expanded + 1
+    assert 1.0 <= result.bound <= 3.0
+
+    g.reset_discovered()
+    assert g.solve(start, end, algorithm="ara_star", time_limit=0).bound == float('inf')
+
+def test_resume_reuses_distances():
+    g: Graph = random_graph(40, 4, 2)
+    start, end = 0, g.grid.size - 1
+    planner: AnytimeAStar = AnytimeAStar(g.grid, start, end, lambda node: g.grid.distance(node, end), 5.0)
+    first = next(planner.solutions())
+    expanded: int = planner.expanded
+    assert first == planner.distance and planner.bound <= 5.0
+    # A new call continues with the distances of the earlier searches
+    for _ in planner.solutions():
+        pass
+    assert planner.bound == 1.0
+    assert planner.expanded > expanded
+    assert planner.path()[0] == start and planner.path()[-1] == end
+
+def test_unreachable():
+    g: Graph = Graph(10, 1)
+    for row in range(10):
+        g.grid.states[g.grid.index(row, 5)] = State.BARRIER.value
+    result = g.solve(g.grid[0][0], g.grid[9][9], algorithm="ara_star")
+    assert not result.found and result.bound == 1.0
+    assert g.grid.states[g.grid.index(0, 1)] == State.CLOSED.value
@@ -0,0 +1,49 @@
+import pytest
+import random
+from pathfinder.batch import GridSnapshot, batch_query
+from pathfinder.graph import Graph
+from pathfinder.util.state import State
+
+
+def barrier_graph(rows: int, percent_barriers: float, seed: int) -> Graph:
+    rng: random.Random = random.Random(seed)
+    g: Graph = Graph(rows, 10)
+    for row in g.grid:
+        for node in row:
+            if rng.random() < percent_barriers:
+                node.set_barrier()
+    return g
+
+def test_snapshot_is_frozen():
+    g: Graph = barrier_graph(10, 0.3, 0)
+    snapshot: GridSnapshot = GridSnapshot.from_grid(g.grid)
+    barriers: int = g.grid.states.count(State.BARRIER.value)
+    g.grid[0][0].set_barrier()
+    g.grid[0][1].set_barrier()
+
+    assert isinstance(snapshot.blocked, bytes)
+    assert snapshot.blocked.count(1) == barriers
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_matches_dijkstra(processes: int):
+    g: Graph = barrier_graph(15, 0.25, 1)
+    snapshot: GridSnapshot = GridSnapshot.from_grid(g.grid)
+    rng: random.Random = random.Random(2)
+    free: list = [i for i in range(g.grid.size) if not snapshot.blocked[i]]
+    queries: list = [tuple(rng.sample(free, 2)) for _ in range(30)]
+    results: list = batch_query(snapshot, queries, processes=processes, chunksize=4)
+
+    assert len(results) == len(queries)
+    for (start, end), (distance, path) in zip(queries, results):
+        g.reset_discovered()
+        expected = g.solve(g.grid.vertex(start), g.grid.vertex(end), algorithm="dijkstra")
+        assert distance == expected.distance
+        if expected.found:
+            assert path[0] == start and path[-1] == end and len(path) == distance + 1
+        g.grid.vertex(start).reset()
+        g.grid.vertex(end).reset()
+
+def test_rejects_queries_outside_grid():
+    snapshot: GridSnapshot = GridSnapshot(2, 2, bytes(4))
+    with pytest.raises(IndexError):
+        batch_query(snapshot, [(0, 4)], processes=1)
@@ -0,0 +1,38 @@
+import pytest
+import random
+from pathfinder.graph import Graph
+
+
+def barrier_graph(rows: int, percent_barriers: float, seed: int) -> Graph:
+    rng: random.Random = random.Random(seed)
+    g: Graph = Graph(rows, 10)
+    for row in g.grid:
+        for node in row:
+            if rng.random() < percent_barriers:
+                node.set_barrier()
+    return g
+
+@pytest.mark.parametrize("algorithm", ["bidirectional_dijkstra", "bidirectional_a_star"])
+@pytest.mark.parametrize("seed", range(20))
+def test_same_length_as_dijkstra(algorithm: str, seed: int):
+    g: Graph = barrier_graph(15, 0.3, seed)
+    g.grid[0][0].reset()
+    g.grid[14][14].reset()
+    expected = g.solve(g.grid[0][0], g.grid[14][14], algorithm="dijkstra")
+    g.reset_discovered()
+    result = g.solve(g.grid[0][0], g.grid[14][14], algorithm=algorithm)
+
+    assert result.distance == expected.distance
+    if result.found:
+        assert result.path[0] == (0, 0) and result.path[-1] == (14, 14)
+        assert len(result.path) == result.distance + 1
+        g.mark_path(False)
+
+def test_fewer_expansions_than_dijkstra():
+    g: Graph = Graph(41, 10)
+    expected = g.solve(g.grid[20][0], g.grid[20][40], algorithm="dijkstra")
+    g.reset_discovered()
+    result = g.solve(g.grid[20][0], g.grid[20][40], algorithm="bidirectional_dijkstra")
+
+    assert result.distance == expected.distance == 40
+    assert result.expanded < expected.expanded
@@ -0,0 +1,55 @@
+import pytest
+import random
+from pathfinder.util.bucket_queue import BucketQueue
+
+
+def test_pop_order():
+    queue: BucketQueue = BucketQueue()
+    items: list = list(range(100))
+    random.Random(1).shuffle(items)
+    for item in items:
+        queue.push(item, item * 2)
+
+    popped: list = [queue.pop() for _ in range(len(items))]
+    assert popped == [(i, i * 2) for i in range(100)]
+    assert queue.empty()
+
+def test_fifo_tie_breaking():
+    queue: BucketQueue = BucketQueue()
+    for item in "abc":
+        queue.push(item, 1)
+    queue.update("a", 1)
+
+    assert [queue.pop()[0] for _ in range(3)] == ["b", "c", "a"]
+
+def test_membership_and_decrease_key():
+    queue: BucketQueue = BucketQueue()
+    queue.push("a", 5)
+    queue.push("b", 3)
+
+    assert "a" in queue and "c" not in queue
+    queue.decrease_key("a", 1)
+    queue.decrease_key("b", 10)
+    assert queue.priority("b") == 3
+    assert queue.peek() == ("a", 1)
+    assert queue.pop() == ("a", 1)
+    assert "a" not in queue and len(queue) == 1
+
+def test_push_below_cursor():
+    queue: BucketQueue = BucketQueue()
+    queue.push("a", 5)
+    assert queue.pop() == ("a", 5)
+    queue.push("b", 7)
+    queue.push("c", 2)
+    assert queue.pop() == ("c", 2)
+
+def test_remove():
+    queue: BucketQueue = BucketQueue()
+    for item in range(10):
+        queue.push(item, 10 - item)
+    queue.remove(9)
+    queue.remove(4)
+
+    assert [queue.pop()[0] for _ in range(8)] == [8, 7, 6, 5, 3, 2, 1, 0]
+    with pytest.raises(IndexError):
+        queue.pop()
@@ -0,0 +1,62 @@
+import pytest
+from pathfinder.cache import PathTreeCache
+from pathfinder.graph import Graph
+from pathfinder.grid import Grid
+
+
+def test_repeated_queries_hit_cache():
+    g: Graph = Graph(20, 10)
+    first = g.shortest_path(g.grid[0][0], g.grid[19][19])
+    second = g.shortest_path(g.grid[0][0], g.grid[5][7])
+
+    assert first.distance == 38 and first.expanded == 400
+    assert second.distance == 12 and second.expanded == 0
+    assert second.path[0] == (0, 0) and second.path[-1] == (5, 7)
+
+def test_dijkstra_without_end_is_cached():
+    g: Graph = Graph(10, 10)
+    g.set_start(g.grid[0][0])
+    g.dijkstra()
+    result = g.shortest_path(g.grid[0][0], g.grid[9][9])
+
+    assert result.expanded == 0 and result.distance == 18
+
+def test_edits_invalidate_only_stale_trees():
+    g: Graph = Graph(10, 10)
+    # Wall off the right part of the grid
+    for row in range(10):
+        g.set_barrier(g.grid[row][5])
+    g.shortest_path(g.grid[0][0], g.grid[9][0])
+    g.shortest_path(g.grid[0][9], g.grid[9][9])
+
+    # Blocking a cell on the left only affects the left tree
+    g.set_barrier(g.grid[3][2])
+    assert g.grid.index(0, 0) not in g.cache
+    assert g.grid.index(0, 9) in g.cache
+
+    # Opening the wall affects both trees
+    g.shortest_path(g.grid[0][0], g.grid[9][0])
+    g.remove_barrier(g.grid[4][5])
+    assert len(g.cache) == 0
+    assert g.shortest_path(g.grid[0][0], g.grid[0][9]).distance == 17
+
+def test_unreachable_and_removed_isolated_barrier():
+    g: Graph = Graph(10, 10)
+    for node in (g.grid[8][9], g.grid[9][8], g.grid[9][9]):
+        g.set_barrier(node)
+    assert not g.shortest_path(g.grid[0][0], g.grid[9][9]).found
+
+    # The barrier in the corner has no reachable neighbor
+    g.remove_barrier(g.grid[9][9])
+    assert g.grid.index(0, 0) in g.cache
+
+def test_lru_memory_bound():
+    grid: Grid = Grid(10, 10, 10)
+    cache: PathTreeCache = PathTreeCache(grid, max_nodes=5)
+    cache.put(0, {1: 0, 2: 1})
+    cache.put(5, {4: 5, 3: 4})
+    cache.get(0)
+    cache.put(9, {8: 9, 7: 8})
+
+    assert 5 not in cache and 0 in cache and 9 in cache
+    assert cache.size == 4
@@ -0,0 +1,89 @@
+import pytest
+import random
+from pathfinder.components import ComponentIndex
+from pathfinder.graph import Graph
+from pathfinder.util.state import State
+
+
+def walled_graph() -> Graph:
+    """Two halves separated by a vertical wall in column 5."""
+    g: Graph = Graph(10, 1)
+    for row in range(10):
+        g.grid[row][5].set_barrier()
+    return g
+
+def same_partition(a: ComponentIndex, b: ComponentIndex) -> bool:
+    pairs: dict = {}
+    for index in range(a.grid.size):
+        if (a.component(index) < 0) != (b.component(index) < 0):
+            return False
+        if a.component(index) >= 0 and pairs.setdefault(a.component(index), b.component(index)) != b.component(index):
+            return False
+    return a.count == b.count == len(set(pairs.values()))
+
+def test_build():
+    index: ComponentIndex = ComponentIndex(walled_graph().grid)
+    assert index.count == 2
+    assert index.connected(0, 94)
+    assert not index.connected(0, 9)
+    assert index.component(5) == -1
+    assert not index.connected(5, 5)
+
+@pytest.mark.parametrize("algorithm", ["dijkstra", "a_star", "jps", "bidirectional_a_star", "hpa_star"])
+def test_unreachable_without_search(algorithm: str):
+    g: Graph = walled_graph()
+    g.index_components()
+    result = g.solve(g.grid[0][0], g.grid[9][9], algorithm=algorithm)
+    assert not result.found
+    assert result.expanded == 0 and result.path == []
+    g.remove_barrier(g.grid[3][5])
+    g.reset_discovered()
+    assert g.solve(g.grid[0][0], g.grid[9][9], algorithm=algorithm).distance == 18
+
+def test_replan_unreachable():
+    g: Graph = walled_graph()
+    g.index_components()
+    g.set_start(g.grid[0][0])
+    g.set_end(g.grid[0][9])
+    assert g.replan().expanded == 0
+    g.remove_barrier(g.grid[0][5])
+    assert g.replan().distance == 9
+
+@pytest.mark.parametrize("seed", range(10))
+def test_updates_match_rebuild(seed: int):
+    rng: random.Random = random.Random(seed)
+    g: Graph = Graph(12, 1)
+    for index in range(g.grid.size):
+        if rng.random() < 0.4:
+            g.grid.states[index] = State.BARRIER.value
+    g.index_components()
+    for _ in range(40):
+        vertex = g.grid.vertex(rng.randrange(g.grid.size))
+        if vertex.state == State.BARRIER:
+            g.remove_barrier(vertex)
+        else:
+            g.set_barrier(vertex)
+        assert g.components.version == g.grid.version
+        assert same_partition(g.components, ComponentIndex(g.grid))
+
+def test_rebuilt_after_direct_edits():
+    g: Graph = Graph(10, 1)
+    g.index_components()
+    g.generate_maze()
+    assert g.components.count == 1
+    g.reset()
+    for row in range(10):
+        g.grid[row][5].set_barrier()
+    assert not g.solve(g.grid[0][0], g.grid[0][9]).found
+    assert g.components.count == 2
+
+@pytest.mark.parametrize("end_on_barrier", [False, True])
+def test_endpoint_on_barrier(end_on_barrier: bool):
+    g: Graph = Graph(5, 1)
+    g.index_components()
+    blocked = g.grid[4][4] if end_on_barrier else g.grid[0][0]
+    g.set_barrier(blocked)
+    result = g.solve(g.grid[0][0], g.grid[4][4])
+    assert result.distance == 8
+    assert g.components.version == g.grid.version
+    assert same_partition(g.components, ComponentIndex(g.grid))
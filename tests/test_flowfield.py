@@ -0,0 +1,81 @@
+import pytest
+import random
+from pathfinder.flowfield import FlowField
+from pathfinder.graph import Graph
+from pathfinder.util.state import State
+
+
+def test_single_target():
+    g: Graph = Graph(10, 1)
+    for row in range(9):
+        g.grid[row][5].set_barrier()
+    field: FlowField = FlowField(g.grid, [g.grid.index(0, 9)])
+
+    assert field.cost(0) == 27
+    assert field.cost(g.grid.index(0, 5)) == float('inf')
+    path: list = field.path(0)
+    assert len(path) == 28 and path[-1] == 9
+    assert field.next_step(0) == path[1]
+    assert field.next_step(9) == -1
+
+def test_closest_of_many_targets():
+    g: Graph = Graph(10, 1)
+    targets: list = [g.grid.index(0, 0), g.grid.index(9, 9)]
+    field: FlowField = FlowField(g.grid, targets)
+
+    assert field.cost(g.grid.index(1, 2)) == 3
+    assert field.path(g.grid.index(8, 7))[-1] == targets[1]
+    assert max(field.cost(index) for index in range(g.grid.size)) == 9
+
+@pytest.mark.parametrize("connectivity", [4, 8])
+def test_matches_dijkstra(connectivity: int):
+    rng: random.Random = random.Random(connectivity)
+    g: Graph = Graph(15, 1, connectivity)
+    for index in range(g.grid.size):
+        if rng.random() < 0.25:
+            g.grid.states[index] = State.BARRIER.value
+        else:
+            g.grid.weights[index] = rng.randint(1, 4)
+    end = g.grid[14][14]
+    end.reset()
+    field: FlowField = g.flow_field([end])
+    for row in range(0, 15, 3):
+        start = g.grid[row][0]
+        if start.state == State.BARRIER:
+            continue
+        g.reset_discovered()
+        assert field.cost(start.index) == pytest.approx(g.solve(start, end, "dijkstra").distance)
+
+@pytest.mark.parametrize("seed", range(10))
+def test_updates_match_rebuild(seed: int):
+    rng: random.Random = random.Random(seed)
+    g: Graph = Graph(12, 1, rng.choice([4, 8]))
+    for index in range(g.grid.size):
+        if rng.random() < 0.3:
+            g.grid.states[index] = State.BARRIER.value
+    targets: list = [g.grid.vertex(index) for index in rng.sample(range(g.grid.size), 2)]
+    field: FlowField = g.flow_field(targets)
+    for _ in range(40):
+        vertex = g.grid.vertex(rng.randrange(g.grid.size))
+        if rng.random() < 0.3:
+            if vertex.state != State.BARRIER:
+                g.set_weight(vertex, rng.randint(1, 5))
+        elif vertex.state == State.BARRIER:
+            g.remove_barrier(vertex)
+        else:
+            g.set_barrier(vertex)
+        assert g.flow_field(targets) is field
+        rebuilt: FlowField = FlowField(g.grid, field.targets)
+        for index in range(g.grid.size):
+            assert field.cost(index) == pytest.approx(rebuilt.cost(index))
+
+def test_rebuilt_for_other_targets():
+    g: Graph = Graph(6, 1)
+    g.set_end(g.grid[5][5])
+    field: FlowField = g.flow_field()
+    assert g.flow_field() is field
+    assert g.flow_field([g.grid[0][0]]) is not field
+    g.set_connectivity(8)
+    assert g.flow is None
+    with pytest.raises(ValueError):
+        Graph(3, 1).flow_field()
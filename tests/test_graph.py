@@ -2,12 +2,14 @@ import pytest
 import random
 from pathfinder.vertex import Vertex
 from pathfinder.graph import Graph
+from pathfinder.grid import Grid
 from pathfinder.util.colour import Colour
 from pathfinder.util.state import State
 
 def test_init_grid():
     g: Graph = Graph(10, 10)
-    assert type(g.grid) == list
+    assert type(g.grid) == Grid
+    assert len(g.grid.states) == g.rows * g.columns
     assert len(g.grid) == g.rows == g.columns == 10
     assert len(g.grid[0]) == g.columns == g.rows == 10
 
@@ -42,22 +44,152 @@ def test_reset():
             assert node.colour == Colour.WHITE
     assert g.paths == {}
 
-def random_graph(rows: int, percent_barriers: float):
+def random_graph(rows: int, percent_barriers: float, seed: int = None) -> Graph:
+    rng: random.Random = random.Random(seed)
     g: Graph = Graph(rows, 10)
     g.set_start(
-        g.grid[random.randint(0, rows-1)][random.randint(0, rows-1)]
+        g.grid[rng.randint(0, rows-1)][rng.randint(0, rows-1)]
     )
-    g.set_end(
-        g.grid[random.randint(0, rows-1)][random.randint(0, rows-1)]
-    )
-    num_barriers: int = (rows ** 2) * percent_barriers
+    while True:
+        end: Vertex = g.grid[rng.randint(0, rows-1)][rng.randint(0, rows-1)]
+        if end != g.start:
+            break
+    g.set_end(end)
+    num_barriers: int = int((rows ** 2) * percent_barriers)
 
-    for i in range(num_barriers - 1):
+    for i in range(num_barriers):
         while True:
-            rand_row: int = random.randint(0, rows)
-            rand_col: int = random.randint(0, rows)
+            rand_row: int = rng.randint(0, rows-1)
+            rand_col: int = rng.randint(0, rows-1)
             rand_v: Vertex = g.grid[rand_row][rand_col]
 
             if rand_v not in [g.start, g.end]:
                 break
-        rand_v.set_barrier()
\ No newline at end of file
+        rand_v.set_barrier()
+    return g
+
+def test_random_graph_solvers_agree():
+    for seed in range(20):
+        g: Graph = random_graph(15, 0.3, seed)
+        start, end = g.start, g.end
+        expected = g.solve(start, end, algorithm="dijkstra").distance
+        for algorithm in ("a_star", "jps", "bidirectional_dijkstra", "bidirectional_a_star"):
+            g.reset_discovered()
+            assert g.solve(start, end, algorithm=algorithm).distance == expected
+
+def test_solve_dijkstra_headless():
+    g: Graph = Graph(10, 10)
+    for row in range(9):
+        g.grid[row][5].set_barrier()
+    result = g.solve(g.grid[0][0], g.grid[0][9], algorithm="dijkstra")
+
+    assert result.found
+    assert result.distance == 27
+    assert result.path[0] == (0, 0) and result.path[-1] == (0, 9)
+    assert len(result.path) == result.distance + 1
+    assert result.expanded > 0
+
+def test_solve_a_star_observer():
+    g: Graph = Graph(10, 1)
+    calls: list = []
+    result = g.solve(g.grid[2][2], g.grid[7][8], observer=lambda: calls.append(1))
+
+    assert result.distance == 11
+    assert len(calls) == result.expanded - 1
+
+def test_solve_unreachable():
+    g: Graph = Graph(10, 10)
+    g.grid[0][1].set_barrier()
+    g.grid[1][0].set_barrier()
+    result = g.solve(g.grid[0][0], g.grid[9][9], algorithm="dijkstra")
+
+    assert not result.found
+    assert result.path == []
+
+def test_steps_yield_events():
+    g: Graph = Graph(10, 10)
+    g.set_start(g.grid[0][0])
+    g.set_end(g.grid[0][9])
+    steps = g.a_star_steps()
+    events: list = next(steps)
+
+    assert (0, State.CLOSED) not in events
+    for index, state in events:
+        assert g.grid.get_state(index) == state == State.OPEN
+    result = Graph.run(steps)
+    assert result.distance == 9
+
+def test_generate_maze_steps():
+    g: Graph = Graph(11, 10)
+    carved: int = sum(len(events) for events in g.generate_maze_steps())
+
+    assert carved == g.grid.states.count(State.EMPTY.value)
+    assert g.grid[10][10].state == State.EMPTY
+
+def weighted_graph() -> Graph:
+    # A cheap detour around an expensive strip in the middle column
+    g: Graph = Graph(5, 1)
+    for row in range(4):
+        g.grid.set_weight(g.grid.index(row, 2), 20)
+    return g
+
+def test_weighted_solvers():
+    g: Graph = weighted_graph()
+    start, end = g.grid[0][0], g.grid[0][4]
+    for algorithm, options in (
+        ("dijkstra", {"engine": "bucket"}), ("dijkstra", {"engine": "queue"}),
+        ("a_star", {}), ("bidirectional_dijkstra", {}), ("bidirectional_a_star", {}),
+    ):
+        g.reset_discovered()
+        result = g.solve(start, end, algorithm=algorithm, **options)
+        assert result.distance == 12
+        assert (4, 2) in result.path
+
+def test_weighted_unsupported():
+    g: Graph = weighted_graph()
+    with pytest.raises(ValueError):
+        g.solve(g.grid[0][0], g.grid[0][4], algorithm="jps")
+    with pytest.raises(ValueError):
+        g.solve(g.grid[0][0], g.grid[0][4], algorithm="dijkstra", engine="wavefront")
+
+def test_set_weight_invalidates_cache_and_planner():
+    g: Graph = Graph(5, 1)
+    g.set_start(g.grid[0][0])
+    g.dijkstra()
+    g.set_end(g.grid[0][4])
+    assert g.shortest_path(g.start, g.end).distance == 4
+    assert g.replan().distance == 4
+
+    g.set_weight(g.grid[0][2], 9)
+    assert g.cache.get(g.start.index) is None
+    assert g.replan().distance == 6
+    g.set_weight(g.grid[0][2], 1)
+    assert g.replan().distance == 4
+
+@pytest.mark.parametrize("algorithm", ["dijkstra", "a_star", "bidirectional_dijkstra", "bidirectional_a_star"])
+def test_diagonal_solvers(algorithm: str):
+    g: Graph = Graph(10, 1, 8)
+    result = g.solve(g.grid[0][0], g.grid[9][6], algorithm=algorithm)
+
+    assert result.distance == pytest.approx(3 + 6 * 2 ** 0.5)
+    assert len(result.path) == 10
+
+def test_corner_cutting():
+    g: Graph = Graph(3, 1, 8)
+    g.grid[1][0].set_barrier()
+    start, end = g.grid[0][0], g.grid[1][1]
+    assert g.solve(start, end, algorithm="dijkstra").distance == 2
+
+    g.reset_discovered()
+    g.set_connectivity(8, corner_cutting=True)
+    assert g.solve(start, end, algorithm="dijkstra").distance == pytest.approx(2 ** 0.5)
+
+    # Two barriers touching at their corners still block the move
+    g.reset_discovered()
+    g.grid[0][1].set_barrier()
+    assert not g.solve(start, end, algorithm="a_star").found
+
+def test_diagonal_unsupported():
+    g: Graph = Graph(5, 1, 8)
+    with pytest.raises(ValueError):
+        g.solve(g.grid[0][0], g.grid[4][4], algorithm="jps")
@@ -0,0 +1,125 @@
+import pytest
+from pathfinder.grid import Grid
+from pathfinder.graph import Graph
+from pathfinder.util.colour import Colour
+from pathfinder.util.state import State
+
+
+def test_index_position():
+    grid: Grid = Grid(4, 6, 10)
+
+    assert grid.index(2, 3) == 15
+    assert grid.position(15) == (2, 3)
+    assert grid.size == len(grid.states) == 24
+
+def test_vertex_view():
+    grid: Grid = Grid(4, 6, 10)
+    v = grid[2][3]
+    v.set_barrier()
+
+    assert grid.get_state(15) == State.BARRIER
+    assert grid[2][3].colour == Colour.BLACK
+    assert grid[2][3] == v
+    assert (v.x, v.y) == (30, 20)
+
+def test_neighbors():
+    grid: Grid = Grid(4, 6, 10)
+
+    assert grid.neighbors(0) == [6, 1]
+    assert grid.neighbors(grid.index(3, 5)) == [17, 22]
+    assert grid.neighbors(grid.index(2, 2), 2) == [2, 12, 16]
+
+def test_reset_discovered():
+    g: Graph = Graph(10, 10)
+    g.grid[5][0].set_barrier()
+    g.solve(g.grid[0][0], g.grid[9][9], algorithm="dijkstra")
+    g.mark_path(False)
+    g.reset_discovered()
+
+    assert g.paths == {}
+    assert g.grid[5][0].state == State.BARRIER
+    assert g.grid[0][0].state == State.START
+    assert g.grid[9][9].state == State.END
+    assert g.grid.states.count(State.EMPTY.value) == 97
+
+def test_dirty_cells():
+    grid: Grid = Grid(4, 6, 10)
+    grid.redraw = False
+    grid[1][2].set_open()
+    grid.set_state(3, State.CLOSED)
+
+    assert grid.dirty == {8, 3}
+    grid.invalidate()
+    assert grid.redraw and not grid.dirty
+
+def test_weights():
+    grid: Grid = Grid(4, 6, 10)
+    grid.redraw = False
+
+    assert not grid.weighted and grid.min_weight() == grid.max_weight() == 1
+    grid.set_weight(7, 5)
+    assert grid[1][1].weight == grid.get_weight(7) == 5
+    assert grid.weighted and grid.min_weight() == 1 and grid.max_weight() == 5
+    assert grid.dirty == {7}
+    with pytest.raises(ValueError):
+        grid.set_weight(7, 0)
+
+def test_diagonal_moves():
+    grid: Grid = Grid(3, 3, 10, 8)
+    center: int = grid.index(1, 1)
+
+    assert len(grid.moves(center)) == 8
+    assert sorted(grid.adjacent(0)) == [1, 3, 4]
+    # A barrier above the center blocks the diagonal moves past its corners
+    grid.set_state(grid.index(0, 1), State.BARRIER)
+    assert {neighbor for neighbor, _ in grid.moves(center)} == {3, 5, 6, 7, 8}
+    grid.set_connectivity(8, corner_cutting=True)
+    assert {neighbor for neighbor, _ in grid.moves(center)} == {0, 2, 3, 5, 6, 7, 8}
+    # Never squeeze between two barriers touching at their corners
+    grid.set_state(grid.index(1, 0), State.BARRIER)
+    assert 0 not in {neighbor for neighbor, _ in grid.moves(center)}
+
+def test_distance():
+    assert Grid(5, 5, 10).distance(0, 24) == 8
+    assert Grid(5, 5, 10, 8).distance(0, 23) == pytest.approx(4 + 3 * (2 ** 0.5 - 1))
+    with pytest.raises(ValueError):
+        Grid(5, 5, 10, 6)
+
+def test_clear_discovered():
+    graph: Graph = Graph(40, 40)
+    grid: Grid = graph.grid
+    grid[1][1].set_barrier()
+    graph.reset_discovered()
+    graph.solve(grid[0][0], grid[2][2], "dijkstra")
+    changed: set = {index for index, state in enumerate(grid.states) if state in (5, 6)}
+    grid.dirty.clear()
+    grid.redraw = False
+    graph.reset_discovered()
+
+    # Only the cells discovered by the search have been reset and redrawn
+    assert not grid.redraw
+    assert grid.dirty == changed
+    assert grid.states.count(State.OPEN.value) == grid.states.count(State.CLOSED.value) == 0
+    assert grid.get_state(grid.index(1, 1)) == State.BARRIER
+
+def test_clear_in_place():
+    graph: Graph = Graph(10, 10)
+    grid: Grid = graph.grid
+    grid[2][2].set_barrier()
+    grid.set_weight(3, 9)
+    version: int = grid.version
+    graph.reset()
+
+    assert graph.grid is grid
+    assert grid.version > version
+    assert grid.states == bytearray([State.EMPTY.value]) * 100
+    assert grid.weights == bytearray([1]) * 100
+
+def test_scratch_reused():
+    grid: Grid = Grid(5, 5, 10)
+    first = grid.scratch()
+    # A search running at the same time gets arrays of its own
+    second = grid.scratch()
+    assert first is not second
+    first.release()
+    assert grid.scratch() is first
@@ -0,0 +1,89 @@
+import pytest
+import random
+from pathfinder.graph import Graph
+from pathfinder.hpa import HierarchicalPlanner
+from pathfinder.util.state import State
+
+
+def blocked_graph(rows: int, columns: int, seed: int, connectivity: int = 4) -> Graph:
+    rng: random.Random = random.Random(seed)
+    g: Graph = Graph(rows, 1, connectivity, columns=columns)
+    for index in range(g.grid.size):
+        if rng.random() < 0.25:
+            g.grid.states[index] = State.BARRIER.value
+        else:
+            g.grid.weights[index] = rng.randint(1, 3)
+    return g
+
+def path_cost(g: Graph, path: list) -> float:
+    cost: float = 0
+    for (a_row, a_col), (b_row, b_col) in zip(path, path[1:]):
+        assert max(abs(a_row - b_row), abs(a_col - b_col)) == 1
+        assert g.grid[b_row][b_col].state != State.BARRIER
+        length: float = 2 ** 0.5 if a_row != b_row and a_col != b_col else 1
+        cost += g.grid[b_row][b_col].weight * length
+    return cost
+
+@pytest.mark.parametrize("seed", range(8))
+def test_paths_valid_and_close(seed: int):
+    rng: random.Random = random.Random(seed)
+    g: Graph = blocked_graph(23, 31, seed, 8 if seed % 2 else 4)
+    free: list = [index for index in range(g.grid.size) if g.grid.states[index] != State.BARRIER.value]
+    for _ in range(10):
+        start, end = rng.sample(free, 2)
+        g.reset_discovered()
+        reference = g.solve(g.grid.vertex(start), g.grid.vertex(end), "dijkstra")
+        result = g.solve(g.grid.vertex(start), g.grid.vertex(end), "hpa_star", cluster_size=5)
+        # Diagonal connections imply orthogonal ones, so HPA* finds a path
+        # whenever there is one
+        assert result.found == reference.found
+        if result.found:
+            assert result.path[0] == g.grid.position(start)
+            assert result.path[-1] == g.grid.position(end)
+            assert path_cost(g, result.path) == pytest.approx(result.distance)
+            assert reference.distance <= result.distance + 1e-9
+
+@pytest.mark.parametrize("seed", range(5))
+def test_incremental_update_matches_rebuild(seed: int):
+    rng: random.Random = random.Random(seed)
+    g: Graph = blocked_graph(20, 20, seed)
+    g.hierarchy = HierarchicalPlanner(g.grid, 4)
+    for _ in range(15):
+        vertex = g.grid.vertex(rng.randrange(g.grid.size))
+        if vertex.state == State.BARRIER:
+            g.remove_barrier(vertex)
+        elif rng.random() < 0.3:
+            g.set_weight(vertex, rng.randint(1, 9))
+        else:
+            g.set_barrier(vertex)
+        rebuilt: HierarchicalPlanner = HierarchicalPlanner(g.grid, 4)
+        assert g.hierarchy.version == g.grid.version
+        assert g.hierarchy.nodes == rebuilt.nodes
+        assert g.hierarchy.intra == rebuilt.intra
+        assert g.hierarchy.inter == rebuilt.inter
+
+def test_reused_until_grid_changes():
+    g: Graph = Graph(32, 1)
+    g.solve(g.grid[0][0], g.grid[31][31], "hpa_star")
+    hierarchy: HierarchicalPlanner = g.hierarchy
+    g.set_barrier(g.grid[5][5])
+    result = g.hpa_star()
+    assert g.hierarchy is hierarchy
+    assert result.distance == 62
+    g.generate_maze()
+    g.set_start(g.grid[0][0])
+    g.set_end(g.grid[30][30])
+    assert g.hpa_star().found
+    assert g.hierarchy is not hierarchy
+
+def test_same_cluster_and_unreachable():
+    g: Graph = Graph(8, 1)
+    planner: HierarchicalPlanner = HierarchicalPlanner(g.grid, 4)
+    assert planner.path(0, 0) == (0, [0])
+    assert planner.path(0, 9) == (2, [0, 1, 9]) or planner.path(0, 9) == (2, [0, 8, 9])
+    for col in range(8):
+        g.set_barrier(g.grid[3][col])
+    planner = HierarchicalPlanner(g.grid, 4)
+    assert planner.find(0, 63) == (float('inf'), [])
+    with pytest.raises(ValueError):
+        HierarchicalPlanner(g.grid, 1)
@@ -0,0 +1,43 @@
+import pytest
+import random
+from pathfinder.graph import Graph
+from pathfinder.util.state import State
+
+
+def barrier_graph(rows: int, percent_barriers: float, seed: int) -> Graph:
+    rng: random.Random = random.Random(seed)
+    g: Graph = Graph(rows, 10)
+    for row in g.grid:
+        for node in row:
+            if rng.random() < percent_barriers:
+                node.set_barrier()
+    return g
+
+@pytest.mark.parametrize("seed", range(40))
+def test_same_length_as_dijkstra(seed: int):
+    rng: random.Random = random.Random(seed)
+    g: Graph = barrier_graph(15, rng.choice([0.0, 0.1, 0.25, 0.35]), seed)
+    start, end = g.grid[rng.randrange(15)][rng.randrange(15)], g.grid[rng.randrange(15)][rng.randrange(15)]
+    if start == end:
+        return
+    expected = g.solve(start, end, algorithm="dijkstra")
+    g.reset_discovered()
+    result = g.solve(start, end, algorithm="jps")
+
+    assert result.distance == expected.distance
+    if result.found:
+        # The path consists of neighboring cells none of which is a barrier
+        assert len(result.path) == result.distance + 1
+        for (r1, c1), (r2, c2) in zip(result.path, result.path[1:]):
+            assert abs(r1 - r2) + abs(c1 - c2) == 1
+            assert g.grid[r2][c2].state != State.BARRIER
+        g.mark_path(False)
+
+def test_fewer_expansions_on_open_grid():
+    g: Graph = Graph(60, 1)
+    a_star = g.solve(g.grid[0][0], g.grid[59][59])
+    g.reset_discovered()
+    jps = g.solve(g.grid[0][0], g.grid[59][59], algorithm="jps")
+
+    assert jps.distance == a_star.distance == 118
+    assert jps.expanded < a_star.expanded
@@ -0,0 +1,103 @@
+import pytest
+import random
+from pathfinder.graph import Graph
+from pathfinder.lpa import LPAStar
+from pathfinder.util.state import State
+
+
+def reference_distance(g: Graph, start, end) -> float:
+    g.reset_discovered()
+    return g.solve(start, end, algorithm="dijkstra").distance
+
+@pytest.mark.parametrize("seed", range(10))
+def test_replan_after_edits(seed: int):
+    rng: random.Random = random.Random(seed)
+    g: Graph = Graph(15, 10)
+    for row in g.grid:
+        for node in row:
+            if rng.random() < 0.2:
+                node.set_barrier()
+    start, end = g.grid[0][0], g.grid[14][14]
+    g.set_start(start)
+    g.set_end(end)
+
+    for _ in range(10):
+        result = g.replan()
+        assert result.distance == reference_distance(g, start, end)
+        if result.found:
+            assert result.path[0] == (0, 0) and len(result.path) == result.distance + 1
+            for row, col in result.path:
+                assert g.grid[row][col].state != State.BARRIER
+        for _ in range(3):
+            node = g.grid[rng.randrange(15)][rng.randrange(15)]
+            if node == start or node == end:
+                continue
+            if node.state == State.BARRIER:
+                g.remove_barrier(node)
+            else:
+                g.set_barrier(node)
+
+def test_moving_end_keeps_planner():
+    g: Graph = Graph(20, 10)
+    g.set_start(g.grid[0][0])
+    g.set_end(g.grid[19][19])
+    g.replan()
+    planner: LPAStar = g.planner
+    g.grid[19][19].reset()
+    g.set_end(g.grid[10][10])
+
+    assert g.replan().distance == 20
+    assert g.planner is planner
+
+def test_repairs_less_than_full_search():
+    g: Graph = Graph(60, 10)
+    g.set_start(g.grid[0][0])
+    g.set_end(g.grid[59][59])
+    full = g.replan()
+    g.set_barrier(g.grid[59][58])
+    repaired = g.replan()
+    g.planner = None
+    from_scratch = g.replan()
+
+    assert repaired.distance == from_scratch.distance == full.distance
+    assert repaired.expanded < from_scratch.expanded
+
+@pytest.mark.parametrize("corner_cutting", [False, True])
+def test_replan_diagonal(corner_cutting: bool):
+    rng: random.Random = random.Random(3)
+    g: Graph = Graph(15, 10, 8, corner_cutting)
+    for row in g.grid:
+        for node in row:
+            if rng.random() < 0.25:
+                node.set_barrier()
+    start, end = g.grid[0][0], g.grid[14][14]
+    start.reset()
+    end.reset()
+    g.set_start(start)
+    g.set_end(end)
+
+    for _ in range(10):
+        result = g.replan()
+        assert result.distance == pytest.approx(reference_distance(g, start, end))
+        for _ in range(3):
+            node = g.grid[rng.randrange(15)][rng.randrange(15)]
+            if node == start or node == end:
+                continue
+            if node.state == State.BARRIER:
+                g.remove_barrier(node)
+            else:
+                g.set_barrier(node)
+
+
+def test_replan_after_direct_edit():
+    g: Graph = Graph(10, 1)
+    start, end = g.grid[0][0], g.grid[0][9]
+    g.set_start(start)
+    g.set_end(end)
+    assert g.replan().distance == 9
+    # Written without notifying the planner
+    for row in range(9):
+        g.grid.states[g.grid.index(row, 5)] = State.BARRIER.value
+    result = g.replan()
+    assert result.distance == reference_distance(g, start, end)
+    assert (0, 5) not in result.path
@@ -0,0 +1,97 @@
+import pytest
+from pathfinder.cli import main
+from pathfinder.graph import Graph
+from pathfinder.mapfile import load, save
+from pathfinder.util.state import State
+
+MOVINGAI: str = """type octile
+height 3
+width 5
+map
+..@..
+.T@G.
+.....
+"""
+
+
+def rectangular_graph() -> Graph:
+    g: Graph = Graph(3, 1, columns=5)
+    for row in range(2):
+        g.set_barrier(g.grid[row][2])
+    g.set_weight(g.grid[2][2], 7)
+    return g
+
+def test_rectangular():
+    g: Graph = rectangular_graph()
+    assert (g.grid.rows, g.grid.columns) == (3, 5)
+    result = g.solve(g.grid[0][0], g.grid[0][4], "dijkstra")
+    assert result.distance == 14
+    assert (2, 2) in result.path
+
+def test_load_movingai(tmp_path):
+    path = tmp_path / "small.map"
+    path.write_text(MOVINGAI)
+    g: Graph = load(str(path))
+    assert (g.rows, g.columns, g.connectivity) == (3, 5, 8)
+    assert g.grid[1][1].state == State.BARRIER
+    assert g.grid[1][3].state == State.EMPTY
+    assert g.grid.states.count(State.BARRIER.value) == 3
+    assert load(str(path), connectivity=4).connectivity == 4
+
+def test_load_movingai_invalid(tmp_path):
+    path = tmp_path / "broken.map"
+    path.write_text(MOVINGAI.replace("width 5", "width 6"))
+    with pytest.raises(ValueError):
+        load(str(path))
+
+@pytest.mark.parametrize("name", ["map.grid", "map.png"])
+def test_round_trip(tmp_path, name):
+    g: Graph = rectangular_graph()
+    g.set_connectivity(8, True)
+    path = str(tmp_path / name)
+    save(g, path)
+    loaded: Graph = load(path, weights=True) if name.endswith(".png") else load(path)
+    assert (loaded.rows, loaded.columns) == (3, 5)
+    assert loaded.grid.states == g.grid.states
+    assert loaded.grid.weights == g.grid.weights
+    if name.endswith(".grid"):
+        assert (loaded.connectivity, loaded.corner_cutting) == (8, True)
+
+@pytest.mark.parametrize("connectivity", [4, 8])
+def test_round_trip_movingai(tmp_path, connectivity: int):
+    g: Graph = rectangular_graph()
+    g.set_connectivity(connectivity)
+    path = str(tmp_path / "map.map")
+    save(g, path)
+    loaded: Graph = load(path)
+    assert loaded.grid.states == g.grid.states
+    assert loaded.connectivity == connectivity
+    assert not loaded.grid.weighted
+
+def test_load_binary_invalid(tmp_path):
+    path = tmp_path / "map.grid"
+    path.write_bytes(b"not a grid file at all")
+    with pytest.raises(ValueError):
+        load(str(path))
+
+def test_cli(tmp_path, capsys):
+    path = str(tmp_path / "small.map")
+    with open(path, "w") as file:
+        file.write(MOVINGAI)
+    assert main(["solve", path, "--start", "0,0", "--end", "0,4", "--connectivity", "4", "--path"]) == 0
+    out: str = capsys.readouterr().out
+    assert "distance: 8" in out
+    assert "0,0 1,0 2,0" in out
+    assert main(["solve", path, "--start", "0,0", "--end", "0,4", "-a", "ara_star", "--epsilon", "2", "--connectivity", "4"]) == 0
+    out = capsys.readouterr().out
+    assert "distance: 8" in out and "bound: 1.000" in out
+    assert main(["solve", path, "--start", "0,0", "--end", "0,4", "-a", "ara_star", "--max-expanded", "1"]) == 1
+    out = capsys.readouterr().out
+    assert "distance: no path within budget" in out and "bound: inf" in out
+    assert main(["solve", path, "--start", "0,0", "--end", "0,4", "--time-limit", "5"]) == 2
+
+    converted = str(tmp_path / "small.grid")
+    assert main(["convert", path, converted]) == 0
+    assert main(["info", converted]) == 0
+    assert "rows: 3  columns: 5" in capsys.readouterr().out
+    assert main(["solve", converted, "--start", "1,1"]) == 2
@@ -0,0 +1,79 @@
+import hashlib
+import pytest
+from pathfinder import maze
+from pathfinder.components import ComponentIndex
+from pathfinder.graph import Graph
+from pathfinder.grid import Grid
+from pathfinder.util.state import State
+
+BARRIER: int = State.BARRIER.value
+
+
+@pytest.mark.parametrize("algorithm", maze.ENGINES)
+@pytest.mark.parametrize("rows, columns", [(1, 1), (2, 2), (11, 11), (10, 13), (21, 8)])
+def test_perfect_maze(algorithm, rows, columns):
+    states: bytearray = maze.generate(rows, columns, algorithm, 7)
+    grid: Grid = Grid(rows, columns, 1)
+    grid.states[:] = states
+    cells: int = ((rows + 1) // 2) * ((columns + 1) // 2)
+
+    # All cells are connected and a tree has one passage less than cells
+    assert ComponentIndex(grid).count == 1
+    assert len(states) - states.count(BARRIER) == 2 * cells - 1
+
+@pytest.mark.parametrize("algorithm, digest", [
+    ("backtracker", "8ccda3ec63bda4c1"),
+    ("kruskal", "5902b81c3f8a6c41"),
+    ("eller", "4dc5efbb30e28180"),
+])
+def test_seeded(algorithm, digest):
+    states: bytearray = maze.generate(21, 31, algorithm, 1)
+    assert hashlib.sha256(states).hexdigest()[:16] == digest
+    assert maze.generate(21, 31, algorithm, 2) != states
+
+@pytest.mark.parametrize("algorithm", maze.ENGINES)
+def test_steps_match(algorithm):
+    states: bytearray = bytearray([BARRIER]) * (15 * 17)
+    carved: list = [index for step in maze.carve(states, 15, 17, algorithm, 3) for index in step]
+
+    assert states == maze.generate(15, 17, algorithm, 3)
+    assert sorted(carved) == [index for index, state in enumerate(states) if state != BARRIER]
+
+def test_unknown_algorithm():
+    with pytest.raises(ValueError):
+        maze.generate(5, 5, "prim")
+
+def test_graph_maze():
+    g: Graph = Graph(21, 1, columns=15)
+    g.index_components()
+    g.generate_maze(algorithm="kruskal", seed=4)
+    assert g.grid.states == maze.generate(21, 15, "kruskal", 4)
+    assert g.components.count == 1
+
+    # Watched and headless generation make the same maze
+    steps: Graph = Graph(21, 1, columns=15)
+    steps.generate_maze(lambda: None, "kruskal", 4)
+    assert steps.grid.states == g.grid.states
+
+def test_replan_after_maze():
+    g: Graph = Graph(21, 1)
+    g.set_start(g.grid[0][0])
+    g.set_end(g.grid[20][20])
+    g.replan()
+    g.generate_maze(seed=1)
+    assert g.planner is None
+
+    start, end = g.grid[0][0], g.grid[20][20]
+    g.set_start(start)
+    g.set_end(end)
+    replanned = g.replan().distance
+    g.reset_discovered()
+    assert replanned == g.solve(start, end, algorithm="dijkstra").distance
+
+def test_cli(tmp_path):
+    from pathfinder.cli import main
+    from pathfinder.mapfile import load
+
+    path = str(tmp_path / "maze.grid")
+    assert main(["maze", path, "--rows", "9", "--columns", "13", "-a", "eller", "--seed", "5"]) == 0
+    assert load(path).grid.states == maze.generate(9, 13, "eller", 5)
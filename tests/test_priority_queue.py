@@ -0,0 +1,43 @@
+import pytest
+import random
+from pathfinder.util.priority_queue import PriorityQueue
+
+
+def test_pop_order():
+    queue: PriorityQueue = PriorityQueue()
+    items: list = list(range(100))
+    random.Random(1).shuffle(items)
+    for item in items:
+        queue.push(item, item * 2)
+
+    popped: list = [queue.pop() for _ in range(len(items))]
+    assert popped == [(i, i * 2) for i in range(100)]
+    assert queue.empty()
+
+def test_fifo_tie_breaking():
+    queue: PriorityQueue = PriorityQueue()
+    for item in "abc":
+        queue.push(item, 1)
+
+    assert [queue.pop()[0] for _ in range(3)] == ["a", "b", "c"]
+
+def test_membership_and_decrease_key():
+    queue: PriorityQueue = PriorityQueue()
+    queue.push("a", 5)
+    queue.push("b", 3)
+
+    assert "a" in queue and "c" not in queue
+    queue.decrease_key("a", 1)
+    queue.decrease_key("b", 10)
+    assert queue.priority("b") == 3
+    assert queue.pop() == ("a", 1)
+    assert "a" not in queue and len(queue) == 1
+
+def test_remove():
+    queue: PriorityQueue = PriorityQueue()
+    for item in range(10):
+        queue.push(item, 10 - item)
+    queue.remove(9)
+    queue.remove(4)
+
+    assert [queue.pop()[0] for _ in range(8)] == [8, 7, 6, 5, 3, 2, 1, 0]
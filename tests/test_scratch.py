@@ -0,0 +1,24 @@
+from pathfinder.util.scratch import SearchScratch
+
+
+def test_reset_touched():
+    scratch: SearchScratch = SearchScratch(100)
+    scratch.acquire()
+    for index in (3, 50, 97):
+        scratch.touched.append(index)
+        scratch.dist[index] = index
+    scratch.release()
+
+    assert scratch.acquire() is scratch
+    assert scratch.dist == [float('inf')] * 100
+    assert scratch.touched == []
+    assert scratch.busy
+
+def test_refill():
+    scratch: SearchScratch = SearchScratch(16).acquire()
+    scratch.touched.extend(range(16))
+    scratch.dist[:] = range(16)
+    scratch.release()
+    scratch.acquire()
+
+    assert scratch.dist == [float('inf')] * 16
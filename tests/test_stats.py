@@ -0,0 +1,84 @@
+import pytest
+from pathfinder.graph import Graph
+from pathfinder.util.colour import Colour, heat
+from pathfinder.util.stats import SearchStats
+
+
+def open_graph(rows: int) -> Graph:
+    g: Graph = Graph(rows, 1)
+    g.set_start(g.grid[0][0])
+    g.set_end(g.grid[rows - 1][rows - 1])
+    return g
+
+def test_disabled_by_default():
+    g: Graph = open_graph(10)
+    assert g.stats is None
+    assert g.dijkstra().distance == 18
+
+def test_dijkstra_counters():
+    g: Graph = open_graph(10)
+    g.stats = SearchStats()
+    result = g.dijkstra()
+
+    assert result.distance == 18
+    assert g.stats.expanded == result.expanded == len(g.stats.order) == g.stats.pops
+    assert g.stats.pushes == result.opened
+    assert g.stats.relaxed == result.opened - 1
+    assert g.stats.order[0] == g.start.index
+    assert g.stats.order[-1] == g.end.index
+    assert g.stats.lookups > 0
+    assert set(g.stats.timers) == {"search"}
+
+def test_a_star_counters_and_draw_timer():
+    g: Graph = open_graph(10)
+    g.stats = SearchStats()
+    calls: list = []
+    result = g.a_star(observer=lambda: calls.append(1))
+
+    assert result.found
+    assert g.stats.expanded == result.expanded
+    assert g.stats.pushes == result.opened
+    assert set(g.stats.timers) == {"search", "draw"}
+    assert len(calls) == result.expanded - 1
+
+def test_counters_accumulate_until_reset():
+    g: Graph = open_graph(10)
+    g.stats = SearchStats()
+    first = g.dijkstra().expanded
+    g.reset_discovered()
+    g.dijkstra()
+    assert g.stats.expanded == 2 * first
+    g.stats.reset()
+    assert g.stats.expanded == 0 and g.stats.order == [] and g.stats.timers == {}
+
+def test_merge():
+    g: Graph = open_graph(10)
+    g.stats = SearchStats()
+    g.dijkstra()
+    total: SearchStats = SearchStats()
+    total.add_time("draw", 1.0)
+    total.merge(g.stats)
+    total.merge(g.stats)
+    assert total.expanded == 2 * g.stats.expanded and total.pops == 2 * g.stats.pops
+    assert total.order == g.stats.order * 2
+    assert total.timers["search"] == pytest.approx(2 * g.stats.timers["search"])
+    assert total.timers["draw"] == 1.0
+
+def test_maze_carved():
+    g: Graph = Graph(11, 1)
+    g.stats = SearchStats()
+    g.generate_maze()
+    # Every cell with even row and column plus the walls of a spanning tree
+    assert g.stats.carved == 2 * 36 - 1
+
+def test_profile():
+    g: Graph = open_graph(10)
+    g.stats = SearchStats(profile=True)
+    g.dijkstra()
+    assert "dijkstra_steps" in g.stats.report()
+    with pytest.raises(ValueError):
+        SearchStats().report()
+
+def test_heat():
+    assert heat(0) == Colour.YELLOW
+    assert heat(1) == Colour.PURPLE
@@ -43,4 +43,11 @@ def test_setter():
     v.set_open()
     
     assert v.state == State.OPEN
-    assert v.colour == Colour.LIGHT_BLUE
\ No newline at end of file
+    assert v.colour == Colour.LIGHT_BLUE
+
+def test_get_neighbors_diagonal():
+    g: Graph = Graph(10, 10, 8)
+    v_neighbors: dict = g.grid[0][0].get_neighbors(g)
+
+    assert list(v_neighbors.keys()) == ["lower", "right", "lower_right"]
+    assert v_neighbors["lower_right"].get_position() == (1, 1)
@@ -0,0 +1,75 @@
+import pytest
+from pathfinder.grid import Grid
+from pathfinder.util.colour import Colour, STATE_COLOURS
+from pathfinder.util.state import State
+from pathfinder.viewport import MAX_ZOOM, Viewport
+
+
+def test_fit():
+    viewport: Viewport = Viewport(1000, 2000, 800, 400)
+    assert viewport.zoom == viewport.min_zoom == 0.4
+    assert viewport.visible() == (0, 1000, 0, 2000)
+    assert viewport.cell_at((799, 399)) == (997, 1997)
+
+def test_zoom_keeps_cell_under_pointer():
+    viewport: Viewport = Viewport(1000, 1000, 500, 500)
+    before: tuple = viewport.cell_at((120, 340))
+    viewport.zoom_at(20, (120, 340))
+
+    assert viewport.zoom == 10
+    assert viewport.cell_at((120, 340)) == before
+    first_row, end_row, first_col, end_col = viewport.visible()
+    assert (end_row - first_row, end_col - first_col) == (50, 50)
+    viewport.zoom_at(1000, (0, 0))
+    assert viewport.zoom == MAX_ZOOM
+    viewport.fit()
+    assert (viewport.zoom, viewport.x, viewport.y) == (0.5, 0, 0)
+
+def test_pan_clamped():
+    viewport: Viewport = Viewport(100, 100, 100, 100)
+    viewport.zoom_at(4, (0, 0))
+    viewport.pan(40, 1000)
+    assert (viewport.x, viewport.y) == (10, 75)
+    assert viewport.cell_at((0, 0)) == (75, 10)
+    viewport.pan(-1000, 0)
+    assert viewport.x == 0
+
+def test_cell_rects_tile():
+    viewport: Viewport = Viewport(10, 10, 37, 37)
+    viewport.pan(3, 5)
+    rects: list = [viewport.cell_rect(0, col) for col in range(10)]
+    for (left, _, width, _), (right, _, _, _) in zip(rects, rects[1:]):
+        assert left + width == right
+    assert viewport.cell_at((5, 5)) is not None
+    assert Viewport(10, 20, 40, 40).cell_at((5, 30)) is None
+
+def test_render():
+    pytest.importorskip("numpy")
+    grid: Grid = Grid(400, 400, 1)
+    for row in range(400):
+        for col in range(200, 204):
+            grid.set_state(grid.index(row, col), State.BARRIER)
+    viewport: Viewport = Viewport(400, 400, 100, 100)
+    surface = viewport.render(grid)
+
+    # Four by four cells per pixel, the wall fills pixel column 50
+    assert surface.get_size() == (100, 100)
+    assert tuple(surface.get_at((50, 10)))[:3] == STATE_COLOURS[State.BARRIER.value]
+    assert tuple(surface.get_at((10, 10)))[:3] == Colour.WHITE
+
+def test_render_heat_map_incremental():
+    pytest.importorskip("numpy")
+    grid: Grid = Grid(200, 200, 1)
+    order: list = list(range(0, grid.size, 3))
+    for index in order:
+        grid.set_state(index, State.CLOSED)
+    viewport: Viewport = Viewport(200, 200, 100, 100)
+    growing: list = order[:len(order) // 2]
+    viewport.render(grid, growing)
+    growing += order[len(order) // 2:]
+    extended = viewport.render(grid, growing)
+    # Extending the order matches drawing it at once, and so does a new order
+    fresh = Viewport(200, 200, 100, 100).render(grid, list(order))
+    again = viewport.render(grid, list(order))
+    for pos in ((0, 0), (30, 70), (99, 99)):
+        assert extended.get_at(pos) == fresh.get_at(pos) == again.get_at(pos)
@@ -0,0 +1,47 @@
+import pytest
+import random
+from pathfinder.graph import Graph
+from pathfinder.wavefront import wavefront
+
+
+def barrier_graph(rows: int, percent_barriers: float, seed: int) -> Graph:
+    rng: random.Random = random.Random(seed)
+    g: Graph = Graph(rows, 10)
+    for row in g.grid:
+        for node in row:
+            if rng.random() < percent_barriers:
+                node.set_barrier()
+    g.grid[0][0].reset()
+    return g
+
+def path_length(paths: dict, node: int, start: int) -> int:
+    length: int = 0
+    while node != start:
+        node = paths[node]
+        length += 1
+    return length
+
+@pytest.mark.parametrize("seed", range(5))
+def test_distances_match_dijkstra(seed: int):
+    g: Graph = barrier_graph(20, 0.3, seed)
+    g.set_start(g.grid[0][0])
+    g.dijkstra()
+    dist, prev = wavefront(g.grid, 0)
+
+    reached: set = {node for node in range(g.grid.size) if dist[node] > 0}
+    assert reached == set(g.paths)
+    for node in reached:
+        assert dist[node] == path_length(g.paths, node, 0)
+        assert abs(int(prev[node]) - node) in (1, g.columns)
+
+@pytest.mark.parametrize("seed", range(5))
+def test_engine_matches_queue(seed: int):
+    g: Graph = barrier_graph(20, 0.25, seed)
+    expected = g.solve(g.grid[0][0], g.grid[19][19], algorithm="dijkstra")
+    g.reset_discovered()
+    result = g.solve(g.grid[0][0], g.grid[19][19], algorithm="dijkstra", engine="wavefront")
+
+    assert result.distance == expected.distance
+    assert len(result.path) == len(expected.path)
+    if result.found:
+        g.mark_path(False)
@@ -0,0 +1,75 @@
+import time
+import pytest
+from pathfinder.graph import Graph
+from pathfinder.util.state import State
+from pathfinder.util.stats import SearchStats
+from pathfinder.worker import QUEUE_SIZE, SearchWorker
+
+
+def maze_graph() -> Graph:
+    g: Graph = Graph(41, 1)
+    g.generate_maze(seed=2)
+    g.set_start(g.grid[0][0])
+    g.set_end(g.grid[40][40])
+    return g
+
+def drain(worker: SearchWorker, g: Graph):
+    while not worker.done:
+        g.grid.apply(worker.poll(1000))
+        time.sleep(0.001)
+
+def test_snapshot():
+    g: Graph = maze_graph()
+    g.index_components()
+    snapshot: Graph = g.snapshot()
+
+    assert snapshot.grid is not g.grid and snapshot.grid.states == g.grid.states
+    assert snapshot.grid.weights is g.grid.weights
+    assert snapshot.start.index == g.start.index and snapshot.end.index == g.end.index
+    assert snapshot.components.grid is snapshot.grid
+    snapshot.grid.set_state(1, State.OPEN)
+    assert g.grid.states[1] != State.OPEN.value
+
+def test_snapshot_stats():
+    g: Graph = maze_graph()
+    g.stats = SearchStats()
+    worker: SearchWorker = SearchWorker(g, "a_star_steps", landmarks=4)
+    # The search counts into stats of its own
+    assert worker.snapshot.stats is not g.stats
+    drain(worker, g)
+    assert g.stats.expanded == 0
+    g.stats.merge(worker.snapshot.stats)
+    assert g.stats.expanded == worker.result.expanded
+    assert worker.snapshot.landmarks.version == g.grid.version
+
+@pytest.mark.parametrize("solver", ["a_star_steps", "dijkstra_steps", "jump_point_search_steps"])
+def test_same_result(solver):
+    g: Graph = maze_graph()
+    expected = Graph.run(getattr(maze_graph(), solver)())
+    worker: SearchWorker = SearchWorker(g, solver, batch=7)
+    drain(worker, g)
+
+    assert worker.result.distance == expected.distance
+    assert worker.result.path == expected.path
+    # The events received reproduce the states of the snapshot
+    assert g.grid.states == worker.snapshot.grid.states
+
+def test_bounded_queue_and_cancel():
+    g: Graph = Graph(120, 1)
+    g.set_start(g.grid[0][0])
+    worker: SearchWorker = SearchWorker(g, "dijkstra_steps", batch=1)
+    time.sleep(0.05)
+    # Nothing has been drained, so the search waits after filling the queue
+    # with single steps of at most 5 events each instead of covering the grid
+    events: list = worker.poll(10 ** 9)
+    assert len(events) <= 5 * (QUEUE_SIZE + 8)
+    assert not worker.done
+    worker.cancel()
+    assert worker.done
+    assert worker.poll(10) == []
+
+def test_error():
+    g: Graph = Graph(5, 1)
+    worker: SearchWorker = SearchWorker(g, "a_star_steps")
+    with pytest.raises(AttributeError):
+        drain(worker, g)